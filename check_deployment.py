@@ -1,69 +1,105 @@
 #!/usr/bin/env python3
-import urllib.request
+import http.client
 import urllib.parse
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-def test_deployment():
-    base_url = "https://hassaniya-normaliser.onrender.com"
-    
-    print("Testing Hassaniya Normalizer Deployment")
-    print("=" * 40)
+BASE_URL = "https://hassaniya-normaliser.onrender.com"
+
+def _request(conn, method, path, body=None, headers=None):
+    """Issue a request on an open connection and return (status, body)."""
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    # Read the full body before the caller closes the connection
+    return response.status, response.read()
+
+def _connect():
+    """Open an HTTPS connection to the deployment.
     
-    # Test health check
+    Each probe runs in its own thread and opens its own connection, since
+    http.client connections cannot be shared between threads.
+    """
+    host = urllib.parse.urlsplit(BASE_URL).netloc
+    return http.client.HTTPSConnection(host, timeout=10)
+
+def probe_health():
+    """Check the health endpoint and return the report lines."""
+    lines = []
+    conn = _connect()
     try:
-        with urllib.request.urlopen(f"{base_url}/healthz") as response:
-            print(f"Health check - Status: {response.status}")
-            if response.status == 200:
-                data = json.loads(response.read().decode())
-                print(f"Health check - Response: {data}")
+        status_code, body = _request(conn, "GET", "/healthz")
+        lines.append(f"Health check - Status: {status_code}")
+        if status_code == 200:
+            data = json.loads(body.decode())
+            lines.append(f"Health check - Response: {data}")
     except Exception as e:
-        print(f"Health check failed: {e}")
-    
-    print()
-    
-    # Test normalize endpoint
+        lines.append(f"Health check failed: {e}")
+    finally:
+        conn.close()
+    return "\n".join(lines)
+
+def probe_normalize():
+    """Check the normalize endpoint and return the report lines."""
+    lines = []
+    conn = _connect()
     try:
         test_text = "قال الرجل"
         data = json.dumps({"text": test_text, "show_diff": True}).encode('utf-8')
-        req = urllib.request.Request(
-            f"{base_url}/api/normalize",
-            data=data,
+        status_code, body = _request(
+            conn, "POST", "/api/normalize",
+            body=data,
             headers={'Content-Type': 'application/json'}
         )
         
-        with urllib.request.urlopen(req) as response:
-            print(f"Normalize test - Status: {response.status}")
-            if response.status == 200:
-                result = json.loads(response.read().decode())
-                print(f"Normalize test - Input: {test_text}")
-                print(f"Normalize test - Output: {result.get('normalized', 'N/A')}")
-                print(f"Normalize test - Changes: {len(result.get('changes', []))}")
-                if result.get('original') == result.get('normalized'):
-                    print("⚠️  WARNING: No normalization occurred - likely using fallback function")
-                else:
-                    print("✅ Normalization working correctly")
+        lines.append(f"Normalize test - Status: {status_code}")
+        if status_code == 200:
+            result = json.loads(body.decode())
+            lines.append(f"Normalize test - Input: {test_text}")
+            lines.append(f"Normalize test - Output: {result.get('normalized', 'N/A')}")
+            lines.append(f"Normalize test - Changes: {len(result.get('changes', []))}")
+            if result.get('original') == result.get('normalized'):
+                lines.append("⚠️  WARNING: No normalization occurred - likely using fallback function")
+            else:
+                lines.append("✅ Normalization working correctly")
     except Exception as e:
-        print(f"Normalize test failed: {e}")
-    
-    print()
-    
-    # Test debug endpoint
+        lines.append(f"Normalize test failed: {e}")
+    finally:
+        conn.close()
+    return "\n".join(lines)
+
+def probe_debug():
+    """Check the debug data-files endpoint and return the report lines."""
+    lines = []
+    conn = _connect()
     try:
-        with urllib.request.urlopen(f"{base_url}/api/debug/data-files") as response:
-            print(f"Debug test - Status: {response.status}")
-            if response.status == 200:
-                debug_data = json.loads(response.read().decode())
-                print(f"Debug test - Normalizer stats: {debug_data.get('normalizer_stats', {})}")
-                
-                # Check if data files are accessible
-                data_files = debug_data.get('data_files_status', {})
-                for filename, status in data_files.items():
-                    if status.get('found') and status.get('exists'):
-                        print(f"✅ {filename}: Found and accessible")
-                    else:
-                        print(f"❌ {filename}: {status.get('error', 'Not found or inaccessible')}")
+        status_code, body = _request(conn, "GET", "/api/debug/data-files")
+        lines.append(f"Debug test - Status: {status_code}")
+        if status_code == 200:
+            debug_data = json.loads(body.decode())
+            lines.append(f"Debug test - Normalizer stats: {debug_data.get('normalizer_stats', {})}")
+            
+            # Check if data files are accessible
+            data_files = debug_data.get('data_files_status', {})
+            for filename, status in data_files.items():
+                if status.get('found') and status.get('exists'):
+                    lines.append(f"✅ {filename}: Found and accessible")
+                else:
+                    lines.append(f"❌ {filename}: {status.get('error', 'Not found or inaccessible')}")
     except Exception as e:
-        print(f"Debug test failed: {e}")
+        lines.append(f"Debug test failed: {e}")
+    finally:
+        conn.close()
+    return "\n".join(lines)
+
+def test_deployment():
+    print("Testing Hassaniya Normalizer Deployment")
+    print("=" * 40)
+    
+    # The probes are independent and latency-bound, so run them in parallel
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(fn) for fn in (probe_health, probe_normalize, probe_debug)]
+        # Report in a fixed order; total wall time is still the slowest probe
+        print("\n\n".join(future.result() for future in futures))
 
 if __name__ == "__main__":
-    test_deployment()
\ No newline at end of file
+    test_deployment()
@@ -1,13 +1,120 @@
 #!/usr/bin/env python3
 """Validate data files for consistency and correctness."""
 
-import json
+import argparse
+import hashlib
 import sys
+from collections import Counter
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Set, Dict, List
+from typing import Iterator, Optional, Set, Dict, List, Tuple
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
-def validate_variants_file(file_path: Path) -> bool:
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+    _JSON_ERRORS: Tuple[type, ...] = (ValueError, ijson.JSONError)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _JSON_ERRORS = (ValueError,)
+
+
+# Exception files larger than this are streamed with ijson (when available);
+# smaller ones are parsed in one go, which is faster with orjson
+STREAM_THRESHOLD_BYTES = 1_000_000
+
+# Written next to the data files by --skip-unchanged after a passing run
+CACHE_FILENAME = ".validate_cache.json"
+
+_MISSING = object()
+
+
+@contextmanager
+def _json_array_items(file_path: Path) -> Iterator[Optional[Iterator]]:
+    """Open a JSON file and yield an iterator over its top-level array.
+    
+    Large files are streamed with ijson so items can be checked while the
+    file is being parsed; otherwise the raw bytes are parsed in one call.
+    
+    Args:
+        file_path: Path to the JSON file
+        
+    Yields:
+        Iterator over the array items, or None if the document is not an array
+    """
+    if IJSON_AVAILABLE and file_path.stat().st_size > STREAM_THRESHOLD_BYTES:
+        with open(file_path, 'rb') as f:
+            events = ijson.parse(f, use_float=True)
+            _, event, _ = next(events)
+            yield ijson.items(events, 'item') if event == 'start_array' else None
+        return
+    
+    data = _json.loads(file_path.read_bytes())
+    yield iter(data) if isinstance(data, list) else None
+
+
+def _sha256(file_path: Path) -> str:
+    """Return the hex SHA-256 digest of a file."""
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _fingerprint(file_path: Path) -> List:
+    """Return the [size, mtime_ns, sha256] record stored in the cache."""
+    stat = file_path.stat()
+    return [stat.st_size, stat.st_mtime_ns, _sha256(file_path)]
+
+
+def _is_unchanged(file_path: Path, record: Optional[List]) -> bool:
+    """Check a data file against its cached fingerprint.
+    
+    A matching size and mtime is trusted as-is; if only the mtime differs
+    (e.g. after a fresh checkout) the content digest decides.
+    """
+    if not record or not file_path.exists():
+        return False
+    size, mtime_ns, digest = record
+    stat = file_path.stat()
+    if stat.st_size != size:
+        return False
+    if stat.st_mtime_ns == mtime_ns:
+        return True
+    return _sha256(file_path) == digest
+
+
+def load_validation_cache(cache_file: Path) -> Dict[str, List]:
+    """Load the fingerprints recorded by the last successful validation."""
+    try:
+        cache = _json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_validation_cache(cache_file: Path, files: List[Path]) -> None:
+    """Record the fingerprints of data files that passed validation."""
+    cache = {file_path.name: _fingerprint(file_path) for file_path in files}
+    data = _json.dumps(cache)
+    if isinstance(data, str):  # stdlib json fallback
+        data = data.encode('utf-8')
+    try:
+        cache_file.write_bytes(data)
+    except OSError as e:
+        print(f"Warning: could not write validation cache: {e}")
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write collected report lines to stdout in a single call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def validate_variants_file(file_path: Path) -> Tuple[bool, Set[str], Set[str]]:
     """Validate hassaniya_variants.jsonl file.
     
     Checks:
@@ -21,13 +128,15 @@ def validate_variants_file(file_path: Path) -> bool:
         file_path: Path to the variants JSONL file
         
     Returns:
-        True if valid, False otherwise
+        Tuple of (is_valid, canonical_forms, all_variants). The sets are
+        reused by validate_data_consistency so the file is parsed only once.
     """
-    print(f"Validating variants file: {file_path}")
+    out: List[str] = [f"Validating variants file: {file_path}"]
     
     if not file_path.exists():
-        print(f"ERROR: File not found: {file_path}")
-        return False
+        out.append(f"ERROR: File not found: {file_path}")
+        _write_lines(out)
+        return False, set(), set()
     
     canonical_forms: Set[str] = set()
     all_variants: Set[str] = set()
@@ -35,95 +144,96 @@ def validate_variants_file(file_path: Path) -> bool:
     errors = []
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line_number += 1
-                line = line.strip()
-                
-                if not line:  # Skip empty lines
-                    continue
-                
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError as e:
-                    errors.append(f"Line {line_number}: Invalid JSON - {e}")
-                    continue
-                
-                # Check required fields
-                if not isinstance(entry, dict):
-                    errors.append(f"Line {line_number}: Entry must be a JSON object")
-                    continue
-                
-                if 'canonical' not in entry:
-                    errors.append(f"Line {line_number}: Missing 'canonical' field")
-                    continue
-                
-                if 'variants' not in entry:
-                    errors.append(f"Line {line_number}: Missing 'variants' field")
-                    continue
-                
-                canonical = entry['canonical']
-                variants = entry['variants']
-                
-                # Validate canonical form
-                if not isinstance(canonical, str) or not canonical.strip():
-                    errors.append(f"Line {line_number}: 'canonical' must be a non-empty string")
-                    continue
-                
-                # Validate variants
-                if not isinstance(variants, list):
-                    errors.append(f"Line {line_number}: 'variants' must be a list")
-                    continue
-                
-                if not variants:
-                    errors.append(f"Line {line_number}: 'variants' list cannot be empty")
+        lines = file_path.read_bytes().splitlines()
+        for line_number, line in enumerate(lines, 1):
+            # splitlines() already dropped the line terminator and the JSON
+            # parser tolerates surrounding whitespace, so no strip() is needed
+            if not line or line.isspace():  # Skip empty lines
+                continue
+            
+            try:
+                entry = _json.loads(line)
+            except ValueError as e:
+                errors.append(f"Line {line_number}: Invalid JSON - {e}")
+                continue
+            
+            # Check required fields
+            if not isinstance(entry, dict):
+                errors.append(f"Line {line_number}: Entry must be a JSON object")
+                continue
+            
+            # One lookup per field; the sentinel tells a missing key from null
+            canonical = entry.get('canonical', _MISSING)
+            if canonical is _MISSING:
+                errors.append(f"Line {line_number}: Missing 'canonical' field")
+                continue
+            
+            variants = entry.get('variants', _MISSING)
+            if variants is _MISSING:
+                errors.append(f"Line {line_number}: Missing 'variants' field")
+                continue
+            
+            # Validate canonical form
+            if not isinstance(canonical, str) or not canonical.strip():
+                errors.append(f"Line {line_number}: 'canonical' must be a non-empty string")
+                continue
+            
+            # Validate variants
+            if not isinstance(variants, list):
+                errors.append(f"Line {line_number}: 'variants' must be a list")
+                continue
+            
+            if not variants:
+                errors.append(f"Line {line_number}: 'variants' list cannot be empty")
+                continue
+            
+            # Check for duplicate canonical forms (one hash probe: add() leaves
+            # the size unchanged when the form was already seen)
+            seen_count = len(canonical_forms)
+            canonical_forms.add(canonical)
+            if len(canonical_forms) == seen_count:
+                errors.append(f"Line {line_number}: Duplicate canonical form '{canonical}'")
+            
+            # Validate each variant
+            for i, variant in enumerate(variants):
+                if not isinstance(variant, str) or not variant.strip():
+                    errors.append(f"Line {line_number}: Variant {i+1} must be a non-empty string")
                     continue
                 
-                # Check for duplicate canonical forms
-                if canonical in canonical_forms:
-                    errors.append(f"Line {line_number}: Duplicate canonical form '{canonical}'")
-                else:
-                    canonical_forms.add(canonical)
+                # Check if canonical appears in its own variants
+                if variant == canonical:
+                    errors.append(f"Line {line_number}: Canonical form '{canonical}' appears in its own variants")
                 
-                # Validate each variant
-                for i, variant in enumerate(variants):
-                    if not isinstance(variant, str) or not variant.strip():
-                        errors.append(f"Line {line_number}: Variant {i+1} must be a non-empty string")
-                        continue
-                    
-                    # Check if canonical appears in its own variants
-                    if variant == canonical:
-                        errors.append(f"Line {line_number}: Canonical form '{canonical}' appears in its own variants")
-                    
-                    # Track all variants for cross-checking
-                    if variant in all_variants:
-                        errors.append(f"Line {line_number}: Variant '{variant}' appears multiple times")
-                    else:
-                        all_variants.add(variant)
-    
+                # Track all variants for cross-checking
+                seen_count = len(all_variants)
+                all_variants.add(variant)
+                if len(all_variants) == seen_count:
+                    errors.append(f"Line {line_number}: Variant '{variant}' appears multiple times")
+
     except Exception as e:
         errors.append(f"Error reading file: {e}")
     
     # Check for variants that are also canonical forms
-    variant_canonical_overlap = all_variants & canonical_forms
-    if variant_canonical_overlap:
-        for overlap in variant_canonical_overlap:
+    if not all_variants.isdisjoint(canonical_forms):
+        for overlap in all_variants.intersection(canonical_forms):
             errors.append(f"Word '{overlap}' appears as both canonical and variant")
     
     # Report results
     if errors:
-        print(f"VALIDATION FAILED: {len(errors)} error(s) found:")
+        out.append(f"VALIDATION FAILED: {len(errors)} error(s) found:")
         for error in errors[:20]:  # Limit to first 20 errors
-            print(f"  - {error}")
+            out.append(f"  - {error}")
         if len(errors) > 20:
-            print(f"  ... and {len(errors) - 20} more errors")
-        return False
-    
-    print(f"✓ Variants file is valid:")
-    print(f"  - {line_number} entries processed")
-    print(f"  - {len(canonical_forms)} unique canonical forms")
-    print(f"  - {len(all_variants)} unique variants")
-    return True
+            out.append(f"  ... and {len(errors) - 20} more errors")
+        _write_lines(out)
+        return False, canonical_forms, all_variants
+    
+    out.append(f"✓ Variants file is valid:")
+    out.append(f"  - {line_number} entries processed")
+    out.append(f"  - {len(canonical_forms)} unique canonical forms")
+    out.append(f"  - {len(all_variants)} unique variants")
+    _write_lines(out)
+    return True, canonical_forms, all_variants
 
 
 def validate_exceptions_file(file_path: Path) -> bool:
@@ -141,63 +251,72 @@ def validate_exceptions_file(file_path: Path) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    print(f"Validating exceptions file: {file_path}")
+    out: List[str] = [f"Validating exceptions file: {file_path}"]
     
     if not file_path.exists():
-        print(f"ERROR: File not found: {file_path}")
+        out.append(f"ERROR: File not found: {file_path}")
+        _write_lines(out)
         return False
     
     errors = []
+    words: List[str] = []
+    word_counts: Counter = Counter()
+    item_count = 0
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Check if it's a list
-        if not isinstance(data, list):
-            errors.append("File must contain a JSON array")
-            return False
-        
-        seen_words: Set[str] = set()
-        
-        for i, word in enumerate(data):
-            # Check if each item is a string
-            if not isinstance(word, str):
-                errors.append(f"Item {i+1}: Must be a string, got {type(word).__name__}")
-                continue
+        with _json_array_items(file_path) as items:
             
-            # Check for empty strings
-            if not word.strip():
-                errors.append(f"Item {i+1}: Empty or whitespace-only string")
-                continue
+            # Check if it's a list
+            if items is None:
+                errors.append("File must contain a JSON array")
+                _write_lines(out)
+                return False
             
-            # Check for duplicates
-            if word in seen_words:
-                errors.append(f"Item {i+1}: Duplicate word '{word}'")
-            else:
-                seen_words.add(word)
+            # When streaming, items are checked as they are parsed
+            for item_count, word in enumerate(items, 1):
+                # Check if each item is a string
+                if not isinstance(word, str):
+                    errors.append(f"Item {item_count}: Must be a string, got {type(word).__name__}")
+                    continue
+                
+                # Check for empty strings
+                if not word.strip():
+                    errors.append(f"Item {item_count}: Empty or whitespace-only string")
+                    continue
+                
+                words.append(word)
+        
+        # Check for duplicates in one pass over the valid words
+        word_counts = Counter(words)
+        for word, count in word_counts.items():
+            if count > 1:
+                errors.append(f"Duplicate word '{word}' appears {count} times")
     
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         errors.append(f"Invalid JSON format: {e}")
     except Exception as e:
         errors.append(f"Error reading file: {e}")
     
     # Report results
     if errors:
-        print(f"VALIDATION FAILED: {len(errors)} error(s) found:")
+        out.append(f"VALIDATION FAILED: {len(errors)} error(s) found:")
         for error in errors[:20]:  # Limit to first 20 errors
-            print(f"  - {error}")
+            out.append(f"  - {error}")
         if len(errors) > 20:
-            print(f"  ... and {len(errors) - 20} more errors")
+            out.append(f"  ... and {len(errors) - 20} more errors")
+        _write_lines(out)
         return False
     
-    print(f"✓ Exceptions file is valid:")
-    print(f"  - {len(data)} exception words")
-    print(f"  - {len(seen_words)} unique words")
+    out.append(f"✓ Exceptions file is valid:")
+    out.append(f"  - {item_count} exception words")
+    out.append(f"  - {len(word_counts)} unique words")
+    _write_lines(out)
     return True
 
 
-def validate_data_consistency(variants_file: Path, exceptions_file: Path) -> bool:
+def validate_data_consistency(
+    exceptions_file: Path, canonical_forms: Set[str], all_variants: Set[str]
+) -> bool:
     """Validate consistency between variants and exceptions files.
     
     Checks:
@@ -205,55 +324,30 @@ def validate_data_consistency(variants_file: Path, exceptions_file: Path) -> boo
     - Exception words don't appear as variants
     
     Args:
-        variants_file: Path to variants JSONL file
         exceptions_file: Path to exceptions JSON file
+        canonical_forms: Canonical forms collected by validate_variants_file
+        all_variants: Variants collected by validate_variants_file
         
     Returns:
         True if consistent, False otherwise
     """
-    print("Validating data consistency...")
+    out: List[str] = ["Validating data consistency..."]
     
     errors = []
     
     try:
         # Load exceptions
-        with open(exceptions_file, 'r', encoding='utf-8') as f:
-            exceptions = set(json.load(f))
-        
-        # Load variants
-        canonical_forms = set()
-        all_variants = set()
-        
-        with open(variants_file, 'r', encoding='utf-8') as f:
-            for line_number, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                try:
-                    entry = json.loads(line)
-                    canonical = entry.get('canonical', '')
-                    variants = entry.get('variants', [])
-                    
-                    if canonical:
-                        canonical_forms.add(canonical)
-                    
-                    for variant in variants:
-                        if isinstance(variant, str):
-                            all_variants.add(variant)
-                            
-                except json.JSONDecodeError:
-                    continue  # Skip invalid lines (already caught by other validation)
+        with open(exceptions_file, 'rb') as f:
+            exceptions = frozenset(_json.loads(f.read()))
         
-        # Check for overlaps
-        exception_canonical_overlap = exceptions & canonical_forms
-        if exception_canonical_overlap:
-            for word in exception_canonical_overlap:
+        # Check for overlaps; isdisjoint() stops at the first shared word, so
+        # the intersection is only built when there is something to report
+        if not exceptions.isdisjoint(canonical_forms):
+            for word in exceptions.intersection(canonical_forms):
                 errors.append(f"Exception word '{word}' also appears as canonical form")
         
-        exception_variant_overlap = exceptions & all_variants
-        if exception_variant_overlap:
-            for word in exception_variant_overlap:
+        if not exceptions.isdisjoint(all_variants):
+            for word in exceptions.intersection(all_variants):
                 errors.append(f"Exception word '{word}' also appears as variant")
     
     except Exception as e:
@@ -261,23 +355,37 @@ def validate_data_consistency(variants_file: Path, exceptions_file: Path) -> boo
     
     # Report results
     if errors:
-        print(f"CONSISTENCY CHECK FAILED: {len(errors)} error(s) found:")
+        out.append(f"CONSISTENCY CHECK FAILED: {len(errors)} error(s) found:")
         for error in errors[:10]:  # Limit to first 10 errors
-            print(f"  - {error}")
+            out.append(f"  - {error}")
         if len(errors) > 10:
-            print(f"  ... and {len(errors) - 10} more errors")
+            out.append(f"  ... and {len(errors) - 10} more errors")
+        _write_lines(out)
         return False
     
-    print("✓ Data consistency check passed")
+    out.append("✓ Data consistency check passed")
+    _write_lines(out)
     return True
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """Main validation function.
     
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    
     Returns:
         0 if all validations pass, 1 otherwise
     """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--skip-unchanged',
+        action='store_true',
+        help=f"skip validation when the data files match {CACHE_FILENAME} "
+             "from the last successful run"
+    )
+    args = parser.parse_args(argv)
+    
     print("=== Hassaniya Normalizer Data Validation ===")
     
     # Find data files
@@ -288,15 +396,25 @@ def main() -> int:
     variants_file = data_dir / "hassaniya_variants.jsonl"
     exceptions_file = data_dir / "exception_words_g_q.json"
     
+    cache_file = data_dir / CACHE_FILENAME
+    data_files = [variants_file, exceptions_file]
+    
     print(f"Project root: {project_root}")
     print(f"Data directory: {data_dir}")
     print()
     
+    if args.skip_unchanged:
+        cache = load_validation_cache(cache_file)
+        if all(_is_unchanged(p, cache.get(p.name)) for p in data_files):
+            print("✓ Data files unchanged since last successful validation (cache hit)")
+            return 0
+    
     # Run validations
     all_valid = True
     
     # Validate individual files
-    if not validate_variants_file(variants_file):
+    variants_valid, canonical_forms, all_variants = validate_variants_file(variants_file)
+    if not variants_valid:
         all_valid = False
     print()
     
@@ -306,12 +424,14 @@ def main() -> int:
     
     # Validate consistency between files
     if all_valid:  # Only run consistency check if individual files are valid
-        if not validate_data_consistency(variants_file, exceptions_file):
+        if not validate_data_consistency(exceptions_file, canonical_forms, all_variants):
             all_valid = False
         print()
     
     # Final result
     if all_valid:
+        if args.skip_unchanged:
+            save_validation_cache(cache_file, data_files)
         print("🎉 All data validation checks passed!")
         return 0
     else:
@@ -2,34 +2,65 @@
 Updated: Force deployment refresh to ensure debug endpoint is available.
 """
 
+import asyncio
+import codecs
+import difflib
+import gzip
 import hashlib
 import os
+import re
+import shutil
+import tempfile
 import time
 import json
 import zipfile
-import io
+import urllib.parse
 import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import compress, groupby
+from operator import ne
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, BinaryIO, Callable, Iterator, Set, Tuple
 
-from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse, FileResponse
+from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form, Header, Request
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse, FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
 # Import normalizer functionality
 try:
     from hassy_normalizer.normalizer import normalize_text, get_stats as get_normalizer_stats
     from hassy_normalizer.diff import word_diff_simple, format_diff_html, get_change_stats
+    from hassy_normalizer.data_loader import _get_data_file_path
+    # Files normalize_text reads its rules from; see _normalizer_data_version
+    NORMALIZER_DATA_FILES: Tuple[str, ...] = (
+        "hassaniya_variants.jsonl", "exception_words_g_q.json", "linked_words.json",
+    )
 except ImportError:
     # Fallback functions if normalizer is not available
     def normalize_text(text: str) -> str:
         return text.replace('ڤ', 'ف').replace('ڨ', 'ق')
     
+    NORMALIZER_DATA_FILES = ()
+    
     # get_normalizer_stats is now imported from hassy_normalizer.normalizer
     
     def word_diff_simple(text: str) -> List:
@@ -41,36 +72,248 @@ except ImportError:
     def get_change_stats(diff_entries: List) -> Dict[str, Any]:
         return {"total_words": 0, "changed_words": 0, "change_percentage": 0.0}
 
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file."""
+    return _json_loads(path.read_bytes())
+
+def _read_jsonl(path: Path) -> List[Dict]:
+    """Read a JSONL file in one call and parse each non-blank line."""
+    return [_json_loads(line) for line in path.read_bytes().splitlines() if line.strip()]
+
+def _variant_entries(variants_data: Dict[str, List[str]]) -> List[Dict]:
+    """Build JSONL variant entries from a canonical -> variants map."""
+    return [
+        {"canonical": canonical_word, "variants": variant_list}
+        for canonical_word, variant_list in variants_data.items()
+    ]
+
+def _read_variants(path: Path) -> Dict[str, List[str]]:
+    """Read the variants JSONL file into a canonical -> variants map."""
+    return {entry["canonical"]: entry["variants"] for entry in _read_jsonl(path)}
+
+def _dump_json_indented(data: Any) -> bytes:
+    """Serialize a JSON file the way linked_words.json is stored.
+    
+    orjson's OPT_INDENT_2 output is byte-for-byte the layout of
+    json.dump(..., ensure_ascii=False, indent=2), so a rewrite only
+    changes the edited entries.
+    """
+    return _json_dumps(data, indent=True)
+
+def _write_bytes(path: Path, payload: bytes) -> Tuple[int, int]:
+    """Write a file and return its new (mtime_ns, size) stamp.
+    
+    The payload goes to a temporary file in the same directory that then
+    replaces the original, so readers see either the old or the new
+    contents, never a partly written file.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(payload)
+        # mkstemp creates the file private; keep the original's permissions
+        try:
+            os.chmod(tmp_name, path.stat().st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+def _dump_jsonl(entries: List[Dict]) -> bytes:
+    """Serialize entries as JSONL, one object per line.
+    
+    Lines keep json.dumps' default ", " and ": " separators, the layout
+    the tracked data files are maintained in, which orjson cannot produce.
+    """
+    return "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries).encode('utf-8')
+
+def _dump_variants(variants_data: Dict[str, List[str]]) -> bytes:
+    """Serialize a canonical -> variants map as the variants JSONL file."""
+    return _dump_jsonl(_variant_entries(variants_data))
+
+# Word-file edits are written this long after the first pending change, so a
+# burst of edits costs one rewrite instead of one per edit
+FLUSH_DELAY_SECONDS = 0.1
+# A write that failed is retried this long after the failed flush
+FLUSH_RETRY_SECONDS = 5.0
+
+# get_stats() results are reused for this long unless the storage changes
+# first, so a burst of dashboard polls costs one aggregation
+STATS_CACHE_SECONDS = 3.0
+
+def _copy_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a get_stats() result down to the per-user totals."""
+    user_stats = {user: dict(totals) for user, totals in stats["user_stats"].items()}
+    return {**stats, "user_stats": user_stats}
+
+@lru_cache(maxsize=None)
+def _data_file_candidates(filename: str) -> Tuple[Path, ...]:
+    """Locations a writable data file may live in, for deployment compatibility."""
+    return (
+        Path("src/hassy_normalizer/data") / filename,
+        Path("../src/hassy_normalizer/data") / filename,
+        Path("data") / filename,
+    )
+
+# filename -> path of the data file once it has been found on disk
+_found_data_files: Dict[str, Path] = {}
+
+def _find_data_file(filename: str) -> Optional[Path]:
+    """Return the first existing candidate location of a data file.
+    
+    Hits are remembered because the data directory does not move while the
+    server runs; misses are not, so a file created later is still found.
+    """
+    path = _found_data_files.get(filename)
+    if path is None:
+        path = next((p for p in _data_file_candidates(filename) if p.exists()), None)
+        if path is not None:
+            _found_data_files[filename] = path
+    return path
+
+@lru_cache(maxsize=2)
+def _iso_second(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second, timezone.utc).isoformat()
+
+def _iso_now() -> str:
+    """Return the current UTC time in ISO 8601 format, to the second.
+    
+    Records created within the same second share one formatted string
+    instead of each building a datetime.
+    """
+    return _iso_second(int(time.time()))
+
+@lru_cache(maxsize=4)
+def _stamp_second(epoch_second: int, utc: bool) -> str:
+    moment = datetime.fromtimestamp(epoch_second, timezone.utc if utc else None)
+    return moment.strftime("%Y%m%d_%H%M%S")
+
+def _file_stamp(utc: bool = True) -> str:
+    """Return the current time as YYYYMMDD_HHMMSS for use in file names.
+    
+    Cached per second like _iso_now(); utc=False gives local time, as used
+    for export downloads.
+    """
+    return _stamp_second(int(time.time()), utc)
+
+# Sample paragraphs every new storage starts with; copied per instance since
+# paragraphs are mutated in place
+_SAMPLE_CREATED_AT = _iso_now()
+_SAMPLE_PARAGRAPHS = (
+    {
+        "id": 1,
+        "text_original": "مرحبا بكم في مسجل اللهجة الحسانية",
+        "text_final": None,
+        "status": "unassigned",
+        "assigned_to": None,
+        "uploaded_by": "SYSTEM",
+        "created_at": _SAMPLE_CREATED_AT
+    },
+    {
+        "id": 2,
+        "text_original": "هذا نص تجريبي للتسجيل والتطبيع",
+        "text_final": None,
+        "status": "unassigned",
+        "assigned_to": None,
+        "uploaded_by": "SYSTEM",
+        "created_at": _SAMPLE_CREATED_AT
+    },
+)
+
 # Simple in-memory storage
 class SimpleStorage:
     def __init__(self):
         self.paragraphs = []
         self.recordings = []
-        self.variants = []
+        # Reported grammar variants by id, in the order they were added
+        self.variants: Dict[int, Dict] = {}
+        self.next_variant_id = 1
         self.next_id = 1
+        # Parsed word files keyed by path, with the (mtime_ns, size) they were read at
+        self._file_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+        # Changed word files waiting to be written: path -> (data, serializer)
+        self._dirty_files: Dict[Path, Tuple[Any, Callable[[Any], bytes]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        # Created lazily so it binds to the server's event loop
+        self._flush_lock: Optional[asyncio.Lock] = None
+        # (wrong, correct) pairs of the cached linked-words list they were built from
+        self._linked_keys: Set[Tuple[str, str]] = set()
+        self._linked_keys_source: Optional[List[Dict]] = None
         
         # Add sample data
-        self.paragraphs = [
-            {
-                "id": 1,
-                "text_original": "مرحبا بكم في مسجل اللهجة الحسانية",
-                "text_final": None,
-                "status": "unassigned",
-                "assigned_to": None,
-                "uploaded_by": "SYSTEM",
-                "created_at": datetime.now(timezone.utc).isoformat()
-            },
-            {
-                "id": 2,
-                "text_original": "هذا نص تجريبي للتسجيل والتطبيع",
-                "text_final": None,
-                "status": "unassigned",
-                "assigned_to": None,
-                "uploaded_by": "SYSTEM",
-                "created_at": datetime.now(timezone.utc).isoformat()
-            }
-        ]
-        self.next_id = 3
+        self.paragraphs = [dict(paragraph) for paragraph in _SAMPLE_PARAGRAPHS]
+        self.next_id = len(_SAMPLE_PARAGRAPHS) + 1
+        # Per-user totals, kept up to date by add_recording and _set_status
+        self._user_stats: Dict[str, Dict[str, Any]] = {}
+        # (monotonic expiry, result) of the last get_stats(); dropped by
+        # every change that affects the numbers
+        self._stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        # Encoded transcriptions.jsonl for the recordings export, built on
+        # first use after a change
+        self._transcriptions_jsonl: Optional[bytes] = None
+        self._reindex()
+    
+    def _data_changed(self) -> None:
+        """Drop the results derived from paragraphs and recordings."""
+        self._stats_cache = None
+        self._transcriptions_jsonl = None
+    
+    def _reindex(self) -> None:
+        """Rebuild the paragraph indexes from self.paragraphs.
+        
+        _by_status maps each status to {id: paragraph}; dicts keep insertion
+        order, so the unassigned queue is served in upload order.
+        """
+        self._by_id: Dict[int, Dict] = {}
+        self._by_status: Dict[str, Dict[int, Dict]] = defaultdict(dict)
+        self._by_user: Dict[str, Set[int]] = defaultdict(set)
+        for paragraph in self.paragraphs:
+            self._by_id[paragraph["id"]] = paragraph
+            self._by_status[paragraph["status"]][paragraph["id"]] = paragraph
+            if paragraph["assigned_to"]:
+                self._by_user[paragraph["assigned_to"]].add(paragraph["id"])
+    
+    def _set_status(self, paragraph: Dict, status: str) -> None:
+        """Change a paragraph's status and move it to the matching index."""
+        old_status = paragraph["status"]
+        self._data_changed()
+        del self._by_status[old_status][paragraph["id"]]
+        paragraph["status"] = status
+        self._by_status[status][paragraph["id"]] = paragraph
+        
+        user = paragraph["assigned_to"]
+        if user and old_status != status:
+            if old_status == "done":
+                self._user_stats_for(user)["paragraphs_completed"] -= 1
+            elif status == "done":
+                self._user_stats_for(user)["paragraphs_completed"] += 1
+    
+    def _user_stats_for(self, user: str) -> Dict[str, Any]:
+        """Return the running totals for a user, creating them if needed."""
+        return self._user_stats.setdefault(user, {
+            "recordings": 0,
+            "paragraphs_completed": 0,
+            "transcription_minutes": 0.0
+        })
     
     def add_paragraph(self, text: str, uploaded_by: str = "SYSTEM") -> int:
         paragraph = {
@@ -80,37 +323,77 @@ class SimpleStorage:
             "status": "unassigned",
             "assigned_to": None,
             "uploaded_by": uploaded_by,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": _iso_now()
         }
         self.paragraphs.append(paragraph)
+        self._data_changed()
+        self._by_id[paragraph["id"]] = paragraph
+        self._by_status["unassigned"][paragraph["id"]] = paragraph
         self.next_id += 1
         return paragraph["id"]
     
+    def add_paragraphs(self, texts: List[str], uploaded_by: str = "SYSTEM") -> int:
+        """Add several unassigned paragraphs at once and return how many were added.
+        
+        Same as calling add_paragraph for each text, but the timestamp,
+        index buckets and cache invalidation are handled once per batch.
+        """
+        created_at = _iso_now()
+        first_id = self.next_id
+        batch = [
+            {
+                "id": para_id,
+                "text_original": text,
+                "text_final": None,
+                "status": "unassigned",
+                "assigned_to": None,
+                "uploaded_by": uploaded_by,
+                "created_at": created_at
+            }
+            for para_id, text in enumerate(texts, first_id)
+        ]
+        if not batch:
+            return 0
+        self.paragraphs.extend(batch)
+        self._data_changed()
+        by_id = {paragraph["id"]: paragraph for paragraph in batch}
+        self._by_id.update(by_id)
+        self._by_status["unassigned"].update(by_id)
+        self.next_id = first_id + len(batch)
+        return len(batch)
+    
+    def get_paragraph(self, para_id: int) -> Optional[Dict]:
+        """Return the paragraph with this id, or None."""
+        return self._by_id.get(para_id)
+    
     def get_next_unassigned(self, username: str) -> Optional[Dict]:
-        for paragraph in self.paragraphs:
-            if (paragraph["status"] == "unassigned" and 
-                (paragraph["uploaded_by"] == username or 
-                 paragraph["uploaded_by"] == "SYSTEM" or 
-                 username in ADMINS)):
-                paragraph["status"] = "assigned"
-                paragraph["assigned_to"] = username
-                return paragraph
-        return None
+        is_admin_user = username in ADMINS
+        paragraph = next(
+            (p for p in self._by_status["unassigned"].values()
+             if is_admin_user or p["uploaded_by"] == username or p["uploaded_by"] == "SYSTEM"),
+            None
+        )
+        if paragraph is None:
+            return None
+        self._set_status(paragraph, "assigned")
+        paragraph["assigned_to"] = username
+        self._by_user[username].add(paragraph["id"])
+        return paragraph
     
     def complete_paragraph(self, para_id: int, text_final: str, username: str) -> bool:
-        for paragraph in self.paragraphs:
-            if paragraph["id"] == para_id and paragraph["assigned_to"] == username:
-                paragraph["text_final"] = text_final
-                paragraph["status"] = "done"
-                return True
-        return False
+        paragraph = self._by_id.get(para_id)
+        if paragraph is None or paragraph["assigned_to"] != username:
+            return False
+        paragraph["text_final"] = text_final
+        self._set_status(paragraph, "done")
+        return True
     
     def skip_paragraph(self, para_id: int, username: str) -> bool:
-        for paragraph in self.paragraphs:
-            if paragraph["id"] == para_id and paragraph["assigned_to"] == username:
-                paragraph["status"] = "skipped"
-                return True
-        return False
+        paragraph = self._by_id.get(para_id)
+        if paragraph is None or paragraph["assigned_to"] != username:
+            return False
+        self._set_status(paragraph, "skipped")
+        return True
     
     def add_recording(self, para_id: int, username: str, filename: str, emotion: str = None):
         recording = {
@@ -119,78 +402,171 @@ class SimpleStorage:
             "user": username,
             "filename": filename,
             "emotion": emotion,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": _iso_now(),
+            # The audio file is already on disk, so its duration is measured
+            # once here instead of on every stats request
+            "duration_min": self._get_audio_duration(filename)
         }
         self.recordings.append(recording)
+        self._data_changed()
+        
+        user_stats = self._user_stats_for(username)
+        user_stats["recordings"] += 1
+        user_stats["transcription_minutes"] += recording["duration_min"]
         return recording["id"]
     
     def add_variant(self, word: str, suggestion: str, reporter: str):
         variant = {
-            "id": len(self.variants) + 1,
+            "id": self.next_variant_id,
             "word": word,
             "suggestion": suggestion,
             "reporter": reporter,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": _iso_now()
         }
-        self.variants.append(variant)
+        self.variants[variant["id"]] = variant
+        self.next_variant_id += 1
         return variant["id"]
     def delete_variant(self, variant_id: int, reporter: str):
         """Delete a grammar variant if it belongs to the reporter"""
-        for i, variant in enumerate(self.variants):
-            if variant["id"] == variant_id and variant["reporter"] == reporter:
-                del self.variants[i]
-                return True
-        return False
+        variant = self.variants.get(variant_id)
+        if variant is None or variant["reporter"] != reporter:
+            return False
+        del self.variants[variant_id]
+        return True
+    
+    def _read_cached(self, path: Path, loader: Callable[[Path], Any]) -> Any:
+        """Return the parsed contents of a file, re-reading it only if it changed on disk."""
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        data = loader(path)
+        self._file_cache[path] = (stamp, data)
+        return data
+    
+    def _write_cached(self, path: Path, data: Any, serialize: Callable[[Any], bytes]) -> None:
+        """Update a cached file and schedule it to be written to disk.
+        
+        Reads see the new data immediately. The file itself is rewritten
+        FLUSH_DELAY_SECONDS later, once for all edits made in between. New
+        files, and calls made outside an event loop, are written right away.
+        """
+        cached = self._file_cache.get(path)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if cached is None or loop is None:
+            self._write_file(path, data, serialize)
+            return
+        
+        # Keep the on-disk stamp so _read_cached keeps returning the new data
+        self._file_cache[path] = (cached[0], data)
+        self._dirty_files[path] = (data, serialize)
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush_later())
+    
+    def _write_file(self, path: Path, data: Any, serialize: Callable[[Any], bytes]) -> None:
+        """Write a file and keep its parsed contents cached under the new mtime."""
+        try:
+            stamp = _write_bytes(path, serialize(data))
+        except Exception:
+            # The cached object may already hold the unsaved change
+            self._file_cache.pop(path, None)
+            raise
+        self._file_cache[path] = (stamp, data)
+    
+    async def _flush_later(self, delay: float = FLUSH_DELAY_SECONDS) -> None:
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        await self.flush()
+    
+    async def flush(self, retry: bool = True) -> bool:
+        """Write all pending word-file changes to disk; return True if all were written.
+        
+        Data is serialized on the event loop, where it is only ever mutated,
+        and the disk writes run in a worker thread so requests keep being
+        served meanwhile. The lock keeps two flushes from writing one file.
+        A file that fails to write stays pending, and its edits stay
+        visible; with retry, another flush is scheduled FLUSH_RETRY_SECONDS
+        later.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        
+        async with self._flush_lock:
+            dirty, self._dirty_files = self._dirty_files, {}
+            failed = False
+            for path, (data, serialize) in dirty.items():
+                try:
+                    stamp = await asyncio.to_thread(_write_bytes, path, serialize(data))
+                except Exception as e:
+                    logger.error(f"Error saving {path}, keeping the edit pending: {e}")
+                    # Edits made during the write are pending already and
+                    # hold the newer data
+                    self._dirty_files.setdefault(path, (data, serialize))
+                    failed = True
+                    continue
+                # Edits made during the write stay in the cache (and are
+                # pending again); only the stamp is updated
+                cached = self._file_cache.get(path)
+                if cached is not None:
+                    self._file_cache[path] = (stamp, cached[1])
+            
+            if failed and retry and self._flush_task is None:
+                self._flush_task = asyncio.get_running_loop().create_task(
+                    self._flush_later(FLUSH_RETRY_SECONDS))
+            return not failed
+    
+    def _linked_word_keys(self, linked_words: List[Dict]) -> Set[Tuple[str, str]]:
+        """Return the (wrong, correct) pairs in a linked-words list.
+        
+        The set is rebuilt only when the list object changes, i.e. when the
+        file was (re)loaded; add/delete keep it in step otherwise.
+        """
+        if linked_words is not self._linked_keys_source:
+            self._linked_keys = {(item.get("wrong"), item.get("correct")) for item in linked_words}
+            self._linked_keys_source = linked_words
+        return self._linked_keys
     
     def add_linked_word(self, wrong: str, correct: str, reporter: str):
         """Add a linked word pair and update the JSON file in real-time"""
-        # Try multiple possible paths for deployment compatibility
-        possible_paths = [
-            Path("src/hassy_normalizer/data/linked_words.json"),
-            Path("./src/hassy_normalizer/data/linked_words.json"),
-            Path("../src/hassy_normalizer/data/linked_words.json"),
-            Path("data/linked_words.json"),
-            Path("./data/linked_words.json")
-        ]
-        
-        linked_words_file = None
+        linked_words_file = _find_data_file("linked_words.json")
         linked_words = []
         
-        # Find existing file or use first path as default
-        for path in possible_paths:
-            try:
-                if path.exists():
-                    linked_words_file = path
-                    with open(path, 'r', encoding='utf-8') as f:
-                        linked_words = json.load(f)
-                    break
-            except Exception:
-                continue
-        
-        # If no existing file found, use first path
         if linked_words_file is None:
-            linked_words_file = possible_paths[0]
+            # No existing file: create it at the first candidate location
+            linked_words_file = _data_file_candidates("linked_words.json")[0]
+        else:
+            try:
+                linked_words = self._read_cached(linked_words_file, _read_json)
+            except Exception as e:
+                print(f"Error reading linked words: {e}")
+                return None
         
         # Add new entry
         new_entry = {
             "wrong": wrong,
             "correct": correct,
             "reporter": reporter,
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": _iso_now()
         }
         
         # Check if entry already exists
-        exists = any(item.get("wrong") == wrong and item.get("correct") == correct 
-                    for item in linked_words)
+        linked_keys = self._linked_word_keys(linked_words)
         
-        if not exists:
+        if (wrong, correct) not in linked_keys:
             linked_words.append(new_entry)
+            linked_keys.add((wrong, correct))
             
             # Save to file
             try:
                 linked_words_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(linked_words_file, 'w', encoding='utf-8') as f:
-                    json.dump(linked_words, f, ensure_ascii=False, indent=2)
+                self._write_cached(linked_words_file, linked_words, _dump_json_indented)
                 return len(linked_words)
             except Exception as e:
                 print(f"Error saving linked words: {e}")
@@ -199,35 +575,19 @@ class SimpleStorage:
     
     def add_variant_word(self, canonical: str, variant: str, reporter: str):
         """Add a variant word and update the JSONL file in real-time"""
-        # Try multiple possible paths for deployment compatibility
-        possible_paths = [
-            Path("src/hassy_normalizer/data/hassaniya_variants.jsonl"),
-            Path("./src/hassy_normalizer/data/hassaniya_variants.jsonl"),
-            Path("../src/hassy_normalizer/data/hassaniya_variants.jsonl"),
-            Path("data/hassaniya_variants.jsonl"),
-            Path("./data/hassaniya_variants.jsonl")
-        ]
-        
-        variants_file = None
+        variants_file = _find_data_file("hassaniya_variants.jsonl")
         variants_data = {}
         
-        # Find existing file or use first path as default
-        for path in possible_paths:
-            try:
-                if path.exists():
-                    variants_file = path
-                    with open(path, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            if line.strip():
-                                entry = json.loads(line)
-                                variants_data[entry["canonical"]] = entry["variants"]
-                    break
-            except Exception:
-                continue
-        
-        # If no existing file found, use first path
         if variants_file is None:
-            variants_file = possible_paths[0]
+            # No existing file: create it at the first candidate location
+            variants_file = _data_file_candidates("hassaniya_variants.jsonl")[0]
+        else:
+            try:
+                # The cached map itself is edited, so no per-call rebuild
+                variants_data = self._read_cached(variants_file, _read_variants)
+            except Exception as e:
+                print(f"Error reading variant words: {e}")
+                return None
         
         # Add new variant
         if canonical in variants_data:
@@ -241,13 +601,7 @@ class SimpleStorage:
         # Save to file
         try:
             variants_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(variants_file, 'w', encoding='utf-8') as f:
-                for canonical_word, variant_list in variants_data.items():
-                    entry = {
-                        "canonical": canonical_word,
-                        "variants": variant_list
-                    }
-                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self._write_cached(variants_file, variants_data, _dump_variants)
             return len(variants_data)
         except Exception as e:
             print(f"Error saving variant words: {e}")
@@ -255,148 +609,107 @@ class SimpleStorage:
     
     def get_linked_words(self):
         """Get all linked words from the JSON file"""
-        # Try multiple possible paths for deployment compatibility
-        possible_paths = [
-            Path("src/hassy_normalizer/data/linked_words.json"),
-            Path("./src/hassy_normalizer/data/linked_words.json"),
-            Path("../src/hassy_normalizer/data/linked_words.json"),
-            Path("data/linked_words.json"),
-            Path("./data/linked_words.json")
-        ]
-        
-        for linked_words_file in possible_paths:
+        linked_words_file = _find_data_file("linked_words.json")
+        if linked_words_file is not None:
             try:
-                if linked_words_file.exists():
-                    with open(linked_words_file, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                return self._read_cached(linked_words_file, _read_json)
             except Exception:
-                continue
+                pass
         return []
     
     def get_variant_words(self):
         """Get all variant words from the JSONL file"""
-        # Try multiple possible paths for deployment compatibility
-        possible_paths = [
-            Path("src/hassy_normalizer/data/hassaniya_variants.jsonl"),
-            Path("./src/hassy_normalizer/data/hassaniya_variants.jsonl"),
-            Path("../src/hassy_normalizer/data/hassaniya_variants.jsonl"),
-            Path("data/hassaniya_variants.jsonl"),
-            Path("./data/hassaniya_variants.jsonl")
-        ]
-        
-        variants = []
-        for variants_file in possible_paths:
+        variants_file = _find_data_file("hassaniya_variants.jsonl")
+        if variants_file is not None:
             try:
-                if variants_file.exists():
-                    with open(variants_file, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            if line.strip():
-                                variants.append(json.loads(line))
-                    return variants
+                return _variant_entries(self._read_cached(variants_file, _read_variants))
             except Exception:
-                continue
-        return variants
+                pass
+        return []
     
     def delete_linked_word(self, wrong: str, correct: str):
         """Delete a linked word pair from the JSON file"""
-        # Try multiple possible paths for deployment compatibility
-        possible_paths = [
-            Path("src/hassy_normalizer/data/linked_words.json"),
-            Path("./src/hassy_normalizer/data/linked_words.json"),
-            Path("../src/hassy_normalizer/data/linked_words.json"),
-            Path("data/linked_words.json"),
-            Path("./data/linked_words.json")
-        ]
+        linked_words_file = _find_data_file("linked_words.json")
+        if linked_words_file is None:
+            return False
         
-        for linked_words_file in possible_paths:
-            try:
-                if linked_words_file.exists():
-                    with open(linked_words_file, 'r', encoding='utf-8') as f:
-                        linked_words = json.load(f)
-                    
-                    # Remove the entry
-                    linked_words = [item for item in linked_words 
-                                  if not (item.get("wrong") == wrong and item.get("correct") == correct)]
-                    
-                    # Save back to file
-                    with open(linked_words_file, 'w', encoding='utf-8') as f:
-                        json.dump(linked_words, f, ensure_ascii=False, indent=2)
-                    
-                    return True
-            except Exception as e:
-                print(f"Error deleting linked word: {e}")
-                continue
-        return False
+        try:
+            linked_words = self._read_cached(linked_words_file, _read_json)
+            linked_keys = self._linked_word_keys(linked_words)
+            
+            # Nothing to remove, so nothing to rewrite
+            if (wrong, correct) not in linked_keys:
+                return True
+            
+            # Remove the entry
+            linked_words = [item for item in linked_words 
+                          if not (item.get("wrong") == wrong and item.get("correct") == correct)]
+            linked_keys.discard((wrong, correct))
+            self._linked_keys_source = linked_words
+            
+            # Save back to file
+            self._write_cached(linked_words_file, linked_words, _dump_json_indented)
+            
+            return True
+        except Exception as e:
+            print(f"Error deleting linked word: {e}")
+            return False
     
     def delete_variant_word(self, canonical: str, variant: str = None):
         """Delete a variant word or entire canonical entry from the JSONL file"""
-        # Try multiple possible paths for deployment compatibility
-        possible_paths = [
-            Path("src/hassy_normalizer/data/hassaniya_variants.jsonl"),
-            Path("./src/hassy_normalizer/data/hassaniya_variants.jsonl"),
-            Path("../src/hassy_normalizer/data/hassaniya_variants.jsonl"),
-            Path("data/hassaniya_variants.jsonl"),
-            Path("./data/hassaniya_variants.jsonl")
-        ]
+        variants_file = _find_data_file("hassaniya_variants.jsonl")
+        if variants_file is None:
+            return False
         
-        for variants_file in possible_paths:
-            try:
-                if variants_file.exists():
-                    variants_data = {}
-                    with open(variants_file, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            if line.strip():
-                                entry = json.loads(line)
-                                variants_data[entry["canonical"]] = entry["variants"]
-                    
-                    # Remove variant or entire canonical entry
-                    if canonical in variants_data:
-                        if variant and variant in variants_data[canonical]:
-                            # Remove specific variant
-                            variants_data[canonical].remove(variant)
-                            # If no variants left, remove the canonical entry
-                            if not variants_data[canonical]:
-                                del variants_data[canonical]
-                        else:
-                            # Remove entire canonical entry
-                            del variants_data[canonical]
-                    
-                    # Save back to file
-                    with open(variants_file, 'w', encoding='utf-8') as f:
-                        for canonical_word, variant_list in variants_data.items():
-                            entry = {
-                                "canonical": canonical_word,
-                                "variants": variant_list
-                            }
-                            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
-                    
-                    return True
-            except Exception as e:
-                print(f"Error deleting variant word: {e}")
-                continue
-        return False
+        try:
+            variants_data = self._read_cached(variants_file, _read_variants)
+            if canonical not in variants_data:
+                return True
+            
+            # Remove variant or entire canonical entry
+            if variant and variant in variants_data[canonical]:
+                # Remove specific variant
+                variants_data[canonical].remove(variant)
+                # If no variants left, remove the canonical entry
+                if not variants_data[canonical]:
+                    del variants_data[canonical]
+            else:
+                # Remove entire canonical entry
+                del variants_data[canonical]
+            
+            # Save back to file
+            self._write_cached(variants_file, variants_data, _dump_variants)
+            
+            return True
+        except Exception as e:
+            print(f"Error deleting variant word: {e}")
+            return False
     
     def reset_user_stats(self, username: str) -> bool:
         """Reset all statistics for a specific user."""
         try:
             # Remove user's recordings
             self.recordings = [r for r in self.recordings if r["user"] != username]
+            self._data_changed()
             
             # Reset user's paragraph assignments and completions
-            for paragraph in self.paragraphs:
-                if paragraph["assigned_to"] == username:
-                    paragraph["assigned_to"] = None
-                    paragraph["status"] = "unassigned"
-                    paragraph["text_final"] = None
-            
-            # Remove user's audio files
-            import glob
-            audio_files = glob.glob(f"data/audio/*{username}*")
-            for file_path in audio_files:
-                try:
-                    os.remove(file_path)
-                except OSError:
-                    pass  # File might not exist or be in use
+            for para_id in self._by_user.pop(username, ()):
+                paragraph = self._by_id[para_id]
+                paragraph["assigned_to"] = None
+                paragraph["text_final"] = None
+                self._set_status(paragraph, "unassigned")
+            # Returned paragraphs go back into the queue in upload order
+            self._by_status["unassigned"] = dict(sorted(self._by_status["unassigned"].items()))
+            self._user_stats.pop(username, None)
+            
+            # Remove user's audio files; dotfiles are skipped, as glob did
+            with os.scandir(AUDIO_DIR) as entries:
+                for entry in entries:
+                    if username in entry.name and not entry.name.startswith('.') and entry.is_file():
+                        try:
+                            os.unlink(entry.path)
+                        except OSError:
+                            pass  # File might not exist or be in use
             
             return True
         except Exception:
@@ -406,7 +719,7 @@ class SimpleStorage:
         """Add a new user (admin only function)."""
         global USERS
         if username.upper() not in USERS:
-            USERS.append(username.upper())
+            USERS = USERS | {username.upper()}
             return True
         return False
     
@@ -414,7 +727,7 @@ class SimpleStorage:
         """Remove a user (admin only function)."""
         global USERS
         if username.upper() in USERS and username.upper() not in ADMINS:
-            USERS.remove(username.upper())
+            USERS = USERS - {username.upper()}
             # Also reset their stats
             self.reset_user_stats(username.upper())
             return True
@@ -422,10 +735,11 @@ class SimpleStorage:
     
     def get_all_users(self) -> Dict[str, Any]:
         """Get all users with their roles."""
+        regular_users = sorted(USERS.difference(ADMINS))
         return {
             "admins": ADMINS,
-            "regular_users": [u for u in USERS if u not in ADMINS],
-            "all_users": USERS
+            "regular_users": regular_users,
+            "all_users": ADMINS + regular_users
         }
     
     def get_user(self, username: str) -> Dict[str, Any]:
@@ -436,42 +750,25 @@ class SimpleStorage:
         }
     
     def get_stats(self) -> Dict[str, Any]:
-        total = len(self.paragraphs)
-        assigned = len([p for p in self.paragraphs if p["status"] == "assigned"])
-        completed = len([p for p in self.paragraphs if p["status"] == "done"])
-        skipped = len([p for p in self.paragraphs if p["status"] == "skipped"])
-        
-        # Calculate user statistics with more precise minute tracking
-        user_stats = {}
-        user_recording_times = {}  # Track actual recording durations
+        # Callers get a copy, so changing a result cannot alter the cached one
+        now = time.monotonic()
+        if self._stats_cache is not None and now < self._stats_cache[0]:
+            return _copy_stats(self._stats_cache[1])
         
-        for recording in self.recordings:
-            user = recording["user"]
-            if user not in user_stats:
-                user_stats[user] = {
-                    "recordings": 0,
-                    "paragraphs_completed": 0,
-                    "transcription_minutes": 0.0
-                }
-            user_stats[user]["recordings"] += 1
-            
-            # Try to get actual audio duration, fallback to estimate
-            audio_duration = self._get_audio_duration(recording.get("filename", ""))
-            user_stats[user]["transcription_minutes"] += audio_duration
+        # Status counts come straight from the index; .get() avoids creating
+        # empty buckets in the defaultdict from a read-only call
+        total = len(self.paragraphs)
+        assigned = len(self._by_status.get("assigned", ()))
+        completed = len(self._by_status.get("done", ()))
+        skipped = len(self._by_status.get("skipped", ()))
         
-        for paragraph in self.paragraphs:
-            if paragraph["status"] == "done" and paragraph["assigned_to"]:
-                user = paragraph["assigned_to"]
-                if user not in user_stats:
-                    user_stats[user] = {
-                        "recordings": 0,
-                        "paragraphs_completed": 0,
-                        "transcription_minutes": 0.0
-                    }
-                user_stats[user]["paragraphs_completed"] += 1
-
+        # Copy the running totals, leaving out users with no activity left
+        user_stats = {
+            user: dict(totals) for user, totals in self._user_stats.items()
+            if totals["recordings"] or totals["paragraphs_completed"]
+        }
         
-        return {
+        stats = {
             "total_paragraphs": total,
             "assigned_paragraphs": assigned,
             "completed_paragraphs": completed,
@@ -480,6 +777,41 @@ class SimpleStorage:
             "total_recording_minutes": sum(user_stats[user]["transcription_minutes"] for user in user_stats),
             "user_stats": user_stats
         }
+        self._stats_cache = (now + STATS_CACHE_SECONDS, stats)
+        return _copy_stats(stats)
+    
+    def transcriptions_jsonl(self) -> bytes:
+        """Return the JSONL transcriptions of completed paragraphs' recordings.
+        
+        Exports between submissions reuse the encoded file instead of
+        joining and encoding every recording again.
+        """
+        if self._transcriptions_jsonl is not None:
+            return self._transcriptions_jsonl
+        
+        jsonl_data = []
+        for recording in self.recordings:
+            paragraph = self._by_id.get(recording["paragraph_id"])
+            if paragraph and paragraph["status"] == "done":
+                # Get emotion data if available
+                emotion = recording.get("emotion", None)
+                emotion_label = EMOTION_EMOJIS.get(emotion, None) if emotion else None
+                
+                jsonl_entry = {
+                    "audio_file": recording["filename"],
+                    "text": paragraph["text_final"] or paragraph["text_original"],
+                    "original_text": paragraph["text_original"],
+                    "user": recording["user"],
+                    "paragraph_id": recording["paragraph_id"],
+                    "recording_id": recording["id"],
+                    "created_at": recording["created_at"],
+                    "emotion_emoji": emotion,
+                    "emotion": emotion_label
+                }
+                jsonl_data.append(jsonl_entry)
+        jsonl_content = "\n".join(json.dumps(entry, ensure_ascii=False) for entry in jsonl_data)
+        self._transcriptions_jsonl = jsonl_content.encode('utf-8')
+        return self._transcriptions_jsonl
     
     def _get_audio_duration(self, filename: str) -> float:
         """Get audio file duration in minutes. Fallback to estimate if file not accessible."""
@@ -487,17 +819,15 @@ class SimpleStorage:
             return 2.5  # Default estimate
         
         try:
-            file_path = AUDIO_DIR / filename
-            if file_path.exists():
-                # Try to get actual duration using file size estimation
-                # WebM files are roughly 1KB per second of audio
-                file_size_kb = file_path.stat().st_size / 1024
-                duration_seconds = file_size_kb  # Rough estimate
-                return max(0.5, min(10.0, duration_seconds / 60))  # Clamp between 0.5-10 minutes
-            else:
-                return 2.5  # Default estimate
-        except Exception:
+            # A single stat() both checks that the file exists and sizes it
+            file_size_kb = (AUDIO_DIR / filename).stat().st_size / 1024
+        except OSError:
             return 2.5  # Default estimate
+        
+        # Try to get actual duration using file size estimation
+        # WebM files are roughly 1KB per second of audio
+        duration_seconds = file_size_kb  # Rough estimate
+        return max(0.5, min(10.0, duration_seconds / 60))  # Clamp between 0.5-10 minutes
 
 # Global storage instance
 storage = SimpleStorage()
@@ -510,7 +840,9 @@ AUDIO_DIR.mkdir(exist_ok=True)
 
 # Users that can login and their roles
 ADMINS = ["EMIN", "ETHMAN", "ZAIN", "MOUHAMEDOU", "SUPERADMIN"]
-USERS = ADMINS.copy()  # Start with admins as users
+# Login checks hit this on every request; it is a frozenset for O(1) lookups
+# and is replaced, not mutated, when users are added or removed
+USERS = frozenset(ADMINS)  # Start with admins as users
 
 # Emotion emojis for audio labeling
 EMOTION_EMOJIS = {
@@ -530,6 +862,9 @@ EMOTION_EMOJIS = {
 class NormalizationRequest(BaseModel):
     text: str
     show_diff: bool = False
+    # The older per-position word list, sent with show_diff unless set; the
+    # dashboard only uses "diff" and turns it off
+    include_changes: Optional[bool] = None
 
 class ParagraphSubmission(BaseModel):
     text_final: str
@@ -560,14 +895,36 @@ class UserDetails(BaseModel):
 class EmotionSubmission(BaseModel):
     emotion: str
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson instead of the stdlib json module.
+    
+    Defined here rather than imported because FastAPI's own ORJSONResponse
+    is deprecated in recent releases.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Write any pending word-file edits before the server exits."""
+    yield
+    if not await storage.flush(retry=False):
+        logger.error(f"Unsaved word-file edits lost on shutdown: {', '.join(map(str, storage._dirty_files))}")
+
 # Create FastAPI app
 app = FastAPI(
     title="Hassaniya Unified Platform",
     description="Complete platform for Hassaniya Arabic recording, normalization, and management",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
-# Add CORS middleware
+# Add CORS middleware. Any middleware added here should be a plain ASGI class
+# (async __call__(scope, receive, send)) like CORSMiddleware, not a
+# BaseHTTPMiddleware subclass, which wraps every request in extra
+# Request/Response objects and a task.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -584,15 +941,227 @@ def is_admin(username: str) -> bool:
     """Check if user is an admin."""
     return username in ADMINS
 
+# Request dependencies that resolve the calling user or fail with 401. They
+# are async so FastAPI calls them on the event loop instead of sending each
+# one to the threadpool.
+async def current_user(username: str) -> str:
+    """The valid user named by the `username` query parameter."""
+    if not authenticate_user(username):
+        raise HTTPException(status_code=401, detail="Invalid user")
+    return username
+
+async def current_form_user(username: str = Form(...)) -> str:
+    """The valid user named by the `username` form field."""
+    return await current_user(username)
+
 @app.get("/healthz")
 async def health_check():
     """Health check endpoint for Docker and deployment platforms."""
     return {"status": "healthy", "service": "hassaniya-normalizer"}
 
-@app.get("/", response_class=HTMLResponse)
-async def serve_login_page():
-    """Serve the login page."""
-    html_content = """
+def _minify_html(html: str) -> str:
+    """Drop indentation, blank lines and whole-line HTML comments.
+    
+    Line breaks are kept, so inline JS needs no semicolon insertion care.
+    """
+    lines = (line.strip() for line in html.splitlines())
+    return "\n".join(
+        line for line in lines
+        if line and not (line.startswith("<!--") and line.endswith("-->"))
+    )
+
+@lru_cache(maxsize=64)
+def _accepted_encodings(accept_encoding: str) -> frozenset:
+    """Parse an Accept-Encoding header; browsers send a handful of distinct values."""
+    return frozenset(token.split(";", 1)[0].strip() for token in accept_encoding.lower().split(","))
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match lists etag (weak or strong)."""
+    if_none_match = request.headers.get("if-none-match", "")
+    return etag in (tag.strip().replace("W/", "", 1) for tag in if_none_match.split(","))
+
+def _json_with_etag(request: Request, content: Any) -> Response:
+    """Return content as JSON tagged with a hash of the body.
+    
+    Clients that send back a matching If-None-Match get an empty 304, so
+    an unchanged list costs no transfer and no parsing on their side.
+    """
+    body = _json_dumps(content)
+    headers = {"ETag": f'"{hashlib.sha256(body).hexdigest()[:32]}"', "Cache-Control": "no-cache"}
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+class StaticPage:
+    """A page or asset encoded and gzipped once at import time, served with an ETag.
+    
+    The page is served from memory rather than through FileResponse: most
+    clients take the gzipped body, which sendfile cannot produce, and a
+    file would add a stat() per request for a page that never changes.
+    """
+    
+    def __init__(self, content: str, media_type: str = "text/html; charset=utf-8",
+                 cache_control: str = "no-cache"):
+        self.body = _minify_html(content).encode("utf-8")
+        self.media_type = media_type
+        self.digest = hashlib.sha256(self.body).hexdigest()
+        self.etag = f'"{self.digest}"'
+        # no-cache: browsers may store the page but must revalidate, so a
+        # redeploy is picked up on the next load
+        self.headers = {"ETag": self.etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        # Content-Encoding -> (body, headers for 304s, headers for full
+        # responses), in order of preference. Each encoding is a different
+        # representation, so it gets its own tag.
+        self.encodings: Dict[str, Tuple[bytes, Dict[str, str], Dict[str, str]]] = {}
+        if BROTLI_AVAILABLE:
+            self._add_encoding("br", brotli.compress(self.body, quality=11))
+        self._add_encoding("gzip", gzip.compress(self.body, 9))
+    
+    def _add_encoding(self, encoding: str, body: bytes) -> None:
+        headers = {**self.headers, "ETag": f'{self.etag[:-1]}-{encoding}"'}
+        self.encodings[encoding] = (body, headers, {**headers, "Content-Encoding": encoding})
+    
+    def response(self, request: Request) -> Response:
+        """Return the page, or an empty 304 if the client already has it."""
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        body, headers, body_headers = self.body, self.headers, self.headers
+        for encoding, variant in self.encodings.items():
+            if encoding in accepted:
+                body, headers, body_headers = variant
+                break
+        if _etag_matches(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type=self.media_type, headers=body_headers)
+
+# Content-hashed CSS/JS split out of the HTML pages, keyed by file name.
+# A new build gets new names, so these can be cached for good.
+STATIC_ASSETS: Dict[str, StaticPage] = {}
+
+# Selectors whose rules are inlined in the dashboard shell: the layout,
+# sidebar and the dashboard page itself, which is what the first paint
+# shows. Rules for the other pages arrive in a deferred stylesheet.
+CRITICAL_CSS_SELECTORS = frozenset({
+    "*", "body", ".container", ".sidebar", ".logo", ".logo-icon", ".logo-text",
+    ".nav", ".nav-item", ".nav-icon", ".user-info", ".user-avatar", ".user-name",
+    ".logout-btn", ".main-content", ".content-area", ".page-header", ".page-title",
+    ".page-description", ".card", ".card-title", ".stats-grid", ".stat-card",
+    ".stat-number", ".stat-label", ".btn", ".btn-primary", ".btn-secondary",
+    ".btn-danger", ".btn-icon", ".hidden",
+})
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SELECTOR_HEAD = re.compile(r"[.#]?[\w*-]+")
+
+_CSS_PUNCTUATION_SPACE = re.compile(r"\s*([{};,>])\s*")
+_CSS_COLON_SPACE = re.compile(r":\s+")
+_CSS_LONG_HEX = re.compile(r"#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3\b")
+
+def _minify_css(css: str) -> str:
+    """Drop the whitespace and last semicolons a stylesheet does not need.
+    
+    Spaces before a colon are kept, since "a :hover" and "a:hover" differ,
+    and #aabbcc colors are shortened to #abc.
+    """
+    css = _CSS_PUNCTUATION_SPACE.sub(r"\1", css.strip())
+    css = _CSS_COLON_SPACE.sub(":", css)
+    css = _CSS_LONG_HEX.sub(r"#\1\2\3", css)
+    return css.replace(";}", "}")
+
+def _is_critical_css_rule(prelude: str) -> bool:
+    """Return True if a top-level CSS rule belongs in the inline stylesheet."""
+    if prelude.startswith("@keyframes"):
+        # Only used by the recording button and the toasts
+        return False
+    if prelude.startswith("@"):
+        # @media only adjusts the layout, which must not flash on phones
+        return True
+    for selector in prelude.split(","):
+        head = _CSS_SELECTOR_HEAD.match(selector.strip())
+        if head and head.group() in CRITICAL_CSS_SELECTORS:
+            return True
+    return False
+
+def _split_critical_css(css: str) -> Tuple[str, str]:
+    """Split a stylesheet into its (critical, deferred) top-level rules."""
+    critical, deferred = [], []
+    css = _CSS_COMMENT.sub("", css)
+    depth = start = 0
+    for index, char in enumerate(css):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rule = css[start:index + 1].strip()
+                prelude = rule.partition("{")[0].strip()
+                (critical if _is_critical_css_rule(prelude) else deferred).append(rule)
+                start = index + 1
+    return "\n".join(critical), "\n".join(deferred)
+
+def _add_static_asset(content: str, name: str, extension: str, media_type: str) -> str:
+    """Register content in STATIC_ASSETS and return its URL."""
+    asset = StaticPage(content, media_type, "public, max-age=31536000, immutable")
+    filename = f"{name}.{asset.digest[:12]}.{extension}"
+    STATIC_ASSETS[filename] = asset
+    return f"/static/{filename}"
+
+# Dashboard pages most sessions never open; their markup is fetched by
+# showPage() the first time they are shown
+LAZY_PANELS = ("upload", "export", "statistics", "variants", "admin")
+
+_DIV_TAG = re.compile(r"<div\b|</div>")
+
+def _externalize_panels(markup: str, name: str) -> str:
+    """Move the content of each LAZY_PANELS page into STATIC_ASSETS.
+    
+    The page's <div> is kept, empty, with the content's URL in its
+    data-panel attribute.
+    """
+    for page_id in LAZY_PANELS:
+        start = re.search(r'<div id="%s"[^>]*>' % page_id, markup)
+        depth = 1
+        for tag in _DIV_TAG.finditer(markup, start.end()):
+            depth += 1 if tag.group() == "<div" else -1
+            if depth == 0:
+                break
+        url = _add_static_asset(
+            markup[start.end():tag.start()], f"{name}-{page_id}", "html", "text/html; charset=utf-8"
+        )
+        markup = f'{markup[:start.end() - 1]} data-panel="{url}">{markup[tag.start():]}'
+    return markup
+
+def _externalize_assets(html: str, name: str) -> str:
+    """Serve a page's inline <style> and <script> blocks as static assets.
+    
+    Only the critical CSS stays inline; the rest is preloaded without
+    blocking the first paint. Rarely used pages are split out as well.
+    The script is requested from <head> with defer, so it downloads while
+    the body is parsed and still runs only once the DOM is complete.
+    """
+    head, _, rest = html.partition("<style>")
+    css, _, rest = rest.partition("</style>")
+    body, _, rest = rest.partition("<script>")
+    js, _, tail = rest.partition("</script>")
+    critical_css, deferred_css = _split_critical_css(css)
+    body = _externalize_panels(body, name)
+    critical_css, deferred_css = _minify_css(critical_css), _minify_css(deferred_css)
+    css_url = _add_static_asset(deferred_css, name, "css", "text/css; charset=utf-8")
+    js_url = _add_static_asset(js, name, "js", "text/javascript; charset=utf-8")
+    return (
+        f"{head}<style>\n{critical_css}\n</style>\n"
+        f'<link rel="preload" href="{css_url}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        f'<script defer src="{js_url}"></script>{body}{tail}'
+    )
+
+@app.get("/static/{filename}")
+async def serve_static_asset(filename: str, request: Request):
+    """Serve a CSS/JS/HTML asset split out of the HTML pages."""
+    asset = STATIC_ASSETS.get(filename)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    return asset.response(request)
+
+LOGIN_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -780,12 +1349,80 @@ async def serve_login_page():
 </body>
 </html>
     """
-    return HTMLResponse(content=html_content)
 
-@app.get("/dashboard", response_class=HTMLResponse)
-async def serve_dashboard():
-    """Serve the main dashboard."""
-    html_content = """
+LOGIN_PAGE = StaticPage(LOGIN_HTML)
+
+@app.get("/", response_class=HTMLResponse)
+async def serve_login_page(request: Request):
+    """Serve the login page."""
+    return LOGIN_PAGE.response(request)
+
+# The three word-list sections of the variants page share one layout
+_VARIANT_SECTION_HTML = """
+                <!-- {comment} -->
+                <div class="card">
+                    <h3 class="card-title">{title}</h3>
+                    <p style="color: #64748b; margin-bottom: 20px;">{description}</p>
+                    
+                    <div style="display: grid; grid-template-columns: 1fr 1fr auto; gap: 12px; margin-bottom: 20px; align-items: end;">
+                        <div>
+                            <label style="display: block; margin-bottom: 6px; font-weight: 500; color: #374151;">{left_label}:</label>
+                            <input type="text" id="{left_id}" class="form-input" placeholder="{left_placeholder}" style="width: 100%;">
+                        </div>
+                        <div>
+                            <label style="display: block; margin-bottom: 6px; font-weight: 500; color: #374151;">{right_label}:</label>
+                            <input type="text" id="{right_id}" class="form-input" placeholder="{right_placeholder}" style="width: 100%;">
+                        </div>
+                        <button class="btn btn-primary" onclick="{action}" style="height: 44px;">
+                            <span class="btn-icon">{icon}</span> {button}
+                        </button>
+                    </div>
+                    
+                    <div id="{status_id}" class="status" data-variant="info" style="display: none;"></div>
+                    
+                    <div style="margin-top: 24px;">
+                        <h4 style="margin-bottom: 12px; color: #374151;">{list_title}:</h4>
+                        <div id="{list_id}" style="max-height: 300px; overflow-y: auto; border: 1px solid #e2e8f0; border-radius: 8px; padding: 12px;">
+                            Loading {list_name}...
+                        </div>
+                    </div>
+                </div>
+"""
+
+VARIANT_SECTIONS = (
+    {
+        "comment": "Linked Words Section",
+        "title": "Linked Words (Wrong → Correct)",
+        "description": "Add word corrections that will be saved to linked_words.json",
+        "left_label": "Wrong Word", "left_id": "wrongWord", "left_placeholder": "Enter wrong word",
+        "right_label": "Correct Word", "right_id": "correctWord", "right_placeholder": "Enter correct word",
+        "action": "addLinkedWord()", "icon": "➕", "button": "Add",
+        "status_id": "linkedWordStatus",
+        "list_title": "Current Linked Words", "list_id": "linkedWordsList", "list_name": "linked words",
+    },
+    {
+        "comment": "Variant Words Section",
+        "title": "Variant Words (Canonical → Variant)",
+        "description": "Add word variants that will be saved to hassaniya_variants.jsonl",
+        "left_label": "Canonical Word", "left_id": "canonicalWord", "left_placeholder": "Enter canonical word",
+        "right_label": "Variant Word", "right_id": "variantWord", "right_placeholder": "Enter variant word",
+        "action": "addVariantWord()", "icon": "➕", "button": "Add",
+        "status_id": "variantWordStatus",
+        "list_title": "Current Variant Words", "list_id": "variantWordsList", "list_name": "variant words",
+    },
+    {
+        "comment": "Grammar Variants Section (Existing)",
+        "title": "Grammar Variants (Existing Feature)",
+        "description": "Report grammar variants and suggestions",
+        "left_label": "Word", "left_id": "variantReportWord", "left_placeholder": "Enter word",
+        "right_label": "Suggestion", "right_id": "variantReportSuggestion", "right_placeholder": "Enter suggestion",
+        "action": "addVariantReport()", "icon": "📝", "button": "Report",
+        "status_id": "variantReportStatus",
+        "list_title": "Current Grammar Variants", "list_id": "grammarVariantsList", "list_name": "grammar variants",
+    },
+)
+
+DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -1040,97 +1677,262 @@ async def serve_dashboard():
             border: 1px solid #e2e8f0;
         }
         
-        .btn-secondary:hover {
-            background: #e2e8f0;
+        .btn-secondary:hover {
+            background: #e2e8f0;
+        }
+        
+        .btn-danger {
+            background: #ef4444;
+            color: white;
+        }
+        
+        .btn-danger:hover {
+            background: #dc2626;
+        }
+        
+        .btn-icon {
+            margin-right: 8px;
+        }
+        
+        /* Form Elements */
+        .form-group {
+            margin-bottom: 20px;
+        }
+        
+        .form-label {
+            display: block;
+            font-weight: 600;
+            color: #374151;
+            margin-bottom: 8px;
+        }
+        
+        .form-input {
+            width: 100%;
+            padding: 12px 16px;
+            border: 1px solid #d1d5db;
+            border-radius: 8px;
+            font-size: 14px;
+            transition: border-color 0.2s;
+        }
+        
+        .form-input:focus {
+            outline: none;
+            border-color: #10b981;
+            box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.1);
+        }
+        
+        .form-textarea {
+            width: 100%;
+            padding: 12px 16px;
+            border: 1px solid #d1d5db;
+            border-radius: 8px;
+            font-size: 14px;
+            resize: vertical;
+            min-height: 120px;
+            font-family: inherit;
+        }
+        
+        /* Read-only paragraph display: a plain block, not a form control */
+        .record-text {
+            margin: 0;
+            white-space: pre-wrap;
+            overflow-y: auto;
+            max-height: 320px;
+        }
+        
+        .form-textarea:focus {
+            outline: none;
+            border-color: #10b981;
+            box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.1);
+        }
+        
+        /* Status Messages */
+        .status {
+            padding: 12px 16px;
+            border-radius: 8px;
+            margin: 16px 0;
+            font-weight: 500;
+        }
+        
+        /* The variant is a data attribute, so switching it is one
+           attribute write instead of a class list rewrite */
+        .status[data-variant="success"] {
+            background: #d1fae5;
+            color: #065f46;
+            border: 1px solid #a7f3d0;
+        }
+        
+        .status[data-variant="error"] {
+            background: #fee2e2;
+            color: #991b1b;
+            border: 1px solid #fca5a5;
+        }
+        
+        .status[data-variant="warning"] {
+            background: #fef3c7;
+            color: #92400e;
+            border: 1px solid #fde68a;
+        }
+        
+        .status[data-variant="info"] {
+            background: #dbeafe;
+            color: #1e40af;
+            border: 1px solid #93c5fd;
+        }
+        
+        /* Normalize diff view */
+        .diff-texts {
+            margin-bottom: 20px;
+        }
+        
+        .diff-heading {
+            margin-bottom: 10px;
+            color: #374151;
+        }
+        
+        .diff-box {
+            padding: 12px;
+            border-radius: 6px;
+            line-height: 1.6;
+        }
+        
+        .diff-box-original {
+            background: #f9fafb;
+            margin-bottom: 15px;
+        }
+        
+        .diff-box-normalized {
+            background: #f0fdf4;
+        }
+        
+        .diff-orig,
+        .diff-norm {
+            border-radius: 3px;
+            margin: 1px;
+        }
+        
+        .diff-orig {
+            background: #fef3c7;
+            padding: 2px 4px;
+        }
+        
+        .diff-norm {
+            background: #bbf7d0;
+            color: #065f46;
+            padding: 2px 6px;
+            font-weight: 500;
+        }
+        
+        .diff-summary {
+            padding: 10px;
+            background: #dbeafe;
+            border-radius: 6px;
+            border-left: 4px solid #3b82f6;
+        }
+        
+        .diff-summary.unchanged {
+            background: #f0fdf4;
+            border-left-color: #10b981;
+        }
+        
+        /* These are redrawn wholesale; containment keeps the layout and
+           paint work of a redraw inside the element instead of the page */
+        #diffSection,
+        #linkedWordsList,
+        #variantWordsList,
+        #grammarVariantsList,
+        #detailedStats,
+        #usersList {
+            contain: layout style paint;
+        }
+        
+        /* Word list and user rows */
+        .list-row,
+        .user-row {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: 12px;
+        }
+        
+        .list-row {
+            background: #f8fafc;
+            border-radius: 6px;
+            margin: 6px 0;
+            border: 1px solid #e2e8f0;
         }
         
-        .btn-danger {
-            background: #ef4444;
-            color: white;
+        .list-row.compact {
+            padding: 8px;
+            border-radius: 4px;
+            margin: 4px 0;
+            border: none;
         }
         
-        .btn-danger:hover {
-            background: #dc2626;
+        .list-wrong {
+            color: #dc2626;
         }
         
-        .btn-icon {
-            margin-right: 8px;
+        .list-correct {
+            color: #059669;
         }
         
-        /* Form Elements */
-        .form-group {
-            margin-bottom: 20px;
+        .list-canonical {
+            color: #7c3aed;
         }
         
-        .form-label {
-            display: block;
-            font-weight: 600;
-            color: #374151;
-            margin-bottom: 8px;
+        .list-meta {
+            color: #64748b;
+            margin-left: 8px;
         }
         
-        .form-input {
-            width: 100%;
-            padding: 12px 16px;
-            border: 1px solid #d1d5db;
-            border-radius: 8px;
-            font-size: 14px;
-            transition: border-color 0.2s;
+        .list-empty {
+            text-align: center;
+            color: #64748b;
+            padding: 20px;
         }
         
-        .form-input:focus {
-            outline: none;
-            border-color: #10b981;
-            box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.1);
+        .list-notice,
+        .list-error {
+            padding: 12px;
         }
         
-        .form-textarea {
-            width: 100%;
-            padding: 12px 16px;
-            border: 1px solid #d1d5db;
-            border-radius: 8px;
-            font-size: 14px;
-            resize: vertical;
-            min-height: 120px;
-            font-family: inherit;
+        .list-notice {
+            color: #f59e0b;
         }
         
-        .form-textarea:focus {
-            outline: none;
-            border-color: #10b981;
-            box-shadow: 0 0 0 3px rgba(16, 185, 129, 0.1);
+        .list-error {
+            color: #ef4444;
         }
         
-        /* Status Messages */
-        .status {
-            padding: 12px 16px;
-            border-radius: 8px;
-            margin: 16px 0;
-            font-weight: 500;
+        .btn-del {
+            background: #ef4444;
+            color: white;
+            border: none;
+            padding: 4px 8px;
+            border-radius: 4px;
+            cursor: pointer;
+            font-size: 12px;
         }
         
-        .status-success {
-            background: #d1fae5;
-            color: #065f46;
-            border: 1px solid #a7f3d0;
+        .user-row {
+            border-bottom: 1px solid #e2e8f0;
+            background: white;
         }
         
-        .status-error {
-            background: #fee2e2;
-            color: #991b1b;
-            border: 1px solid #fca5a5;
+        .user-row.current {
+            background: #f0f9ff;
         }
         
-        .status-warning {
-            background: #fef3c7;
-            color: #92400e;
-            border: 1px solid #fde68a;
+        .user-row-name {
+            font-weight: 500;
+            color: #374151;
         }
         
-        .status-info {
-            background: #dbeafe;
-            color: #1e40af;
-            border: 1px solid #93c5fd;
+        .user-row-you {
+            color: #3b82f6;
+            font-size: 12px;
+            margin-left: 8px;
         }
         
         /* Statistics */
@@ -1156,6 +1958,36 @@ async def serve_dashboard():
             margin-bottom: 8px;
         }
         
+        .detail-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 16px;
+        }
+        
+        .detail-tile {
+            padding: 16px;
+            background: #f8fafc;
+            border-radius: 8px;
+        }
+        
+        .detail-label {
+            font-weight: 600;
+            color: #1e293b;
+        }
+        
+        .detail-value {
+            font-size: 24px;
+            color: #10b981;
+        }
+        
+        .detail-value.skipped {
+            color: #f59e0b;
+        }
+        
+        .detail-value.recordings {
+            color: #3b82f6;
+        }
+        
         .stat-label {
             color: #64748b;
             font-weight: 500;
@@ -1179,17 +2011,16 @@ async def serve_dashboard():
             font-size: 32px;
             cursor: pointer;
             transition: all 0.3s;
+            background: #10b981;
+            color: white;
         }
         
-        .record-button.recording {
+        /* State lives in an attribute on the one button, and the layer is
+           only promoted while the pulse actually runs */
+        .record-button[data-recording="true"] {
             background: #ef4444;
-            color: white;
             animation: pulse 2s infinite;
-        }
-        
-        .record-button.stopped {
-            background: #10b981;
-            color: white;
+            will-change: transform;
         }
         
         @keyframes pulse {
@@ -1262,6 +2093,75 @@ async def serve_dashboard():
             display: none !important;
         }
         
+        /* Toast messages */
+        .toast {
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            padding: 12px 20px;
+            border-radius: 6px;
+            color: white;
+            font-weight: 500;
+            z-index: 1000;
+            background: #3b82f6;
+            animation: slideIn 0.3s ease-out;
+            will-change: transform, opacity;
+        }
+        
+        .toast.leaving {
+            animation: slideOut 0.3s ease-in forwards;
+        }
+        
+        .toast-success {
+            background: #059669;
+        }
+        
+        .toast-error {
+            background: #dc2626;
+        }
+        
+        /* Confirmation dialog */
+        .modal-overlay {
+            position: fixed;
+            inset: 0;
+            background: rgba(15, 23, 42, 0.4);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            z-index: 1001;
+        }
+        
+        .modal {
+            background: white;
+            border-radius: 12px;
+            padding: 24px;
+            width: calc(100% - 40px);
+            max-width: 420px;
+            box-shadow: 0 20px 40px rgba(0, 0, 0, 0.15);
+        }
+        
+        .modal-actions {
+            display: flex;
+            justify-content: flex-end;
+            gap: 8px;
+            margin-top: 20px;
+        }
+        
+        .modal-btn {
+            border: none;
+            border-radius: 6px;
+            padding: 8px 16px;
+            font-weight: 500;
+            cursor: pointer;
+            background: #e2e8f0;
+            color: #334155;
+        }
+        
+        .modal-btn.confirm {
+            background: #ef4444;
+            color: white;
+        }
+        
         @keyframes slideIn {
             from {
                 transform: translateX(100%);
@@ -1284,6 +2184,8 @@ async def serve_dashboard():
             }
         }
     </style>
+    <!-- Start fetching the stats with the page; loadStats() picks up this response -->
+    <link rel="preload" href="/api/stats" as="fetch" crossorigin="anonymous">
 </head>
 <body>
     <div class="container">
@@ -1294,35 +2196,35 @@ async def serve_dashboard():
             </div>
             
             <nav class="nav">
-                <div class="nav-item active" onclick="showPage('dashboard')">
+                <div class="nav-item active" data-page="dashboard">
                     <div class="nav-icon">📊</div>
                     Dashboard
                 </div>
-                <div class="nav-item" onclick="showPage('record')">
+                <div class="nav-item" data-page="record">
                     <div class="nav-icon">🎙️</div>
                     Record
                 </div>
-                <div class="nav-item" onclick="showPage('normalize')">
+                <div class="nav-item" data-page="normalize">
                     <div class="nav-icon">📝</div>
                     Normalize
                 </div>
-                <div class="nav-item" onclick="showPage('upload')">
+                <div class="nav-item" data-page="upload">
                     <div class="nav-icon">📤</div>
                     Upload Text
                 </div>
-                <div class="nav-item" onclick="showPage('export')">
+                <div class="nav-item" data-page="export">
                     <div class="nav-icon">💾</div>
                     Export
                 </div>
-                <div class="nav-item" onclick="showPage('statistics')">
+                <div class="nav-item" data-page="statistics">
                     <div class="nav-icon">📈</div>
                     Statistics
                 </div>
-                <div class="nav-item" onclick="showPage('variants')">
+                <div class="nav-item" data-page="variants">
                     <div class="nav-icon">🔤</div>
                     Variants
                 </div>
-                <div class="nav-item hidden" id="adminTab" onclick="showPage('admin')">
+                <div class="nav-item hidden" id="adminTab" data-page="admin">
                     <div class="nav-icon">⚙️</div>
                     Admin
                 </div>
@@ -1349,19 +2251,19 @@ async def serve_dashboard():
                 
                 <div class="stats-grid">
                     <div class="stat-card">
-                        <div class="stat-number" id="totalParagraphs">0</div>
+                        <div class="stat-number" id="totalParagraphs">–</div>
                         <div class="stat-label">Total Paragraphs</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-number" id="completedParagraphs">0</div>
+                        <div class="stat-number" id="completedParagraphs">–</div>
                         <div class="stat-label">Completed</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-number" id="userRecordings">0</div>
+                        <div class="stat-number" id="userRecordings">–</div>
                         <div class="stat-label">Your Recordings</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-number" id="recordingMinutes">0</div>
+                        <div class="stat-number" id="recordingMinutes">–</div>
                         <div class="stat-label">Minutes Recorded</div>
                     </div>
                 </div>
@@ -1391,7 +2293,7 @@ async def serve_dashboard():
                 
                 <div class="card">
                     <h3 class="card-title">Text to Record</h3>
-                    <textarea id="textToRecord" class="form-textarea" readonly placeholder="Loading text to record..."></textarea>
+                    <pre id="textToRecord" class="form-textarea record-text" aria-readonly="true">Loading text to record...</pre>
                     <button class="btn btn-secondary" onclick="loadNextParagraph()" style="margin-top: 16px;">
                         <span class="btn-icon">🔄</span> Load Next Text
                     </button>
@@ -1400,7 +2302,7 @@ async def serve_dashboard():
                 <div class="card">
                     <h3 class="card-title">Recording Controls</h3>
                     <div class="recording-interface">
-                        <button class="record-button stopped" id="recordBtn" onclick="toggleRecording()">
+                        <button class="record-button" data-recording="false" id="recordBtn" onclick="toggleRecording()">
                             <span id="recordIcon">🔴</span>
                         </button>
                         <div style="margin: 20px 0;">
@@ -1411,7 +2313,7 @@ async def serve_dashboard():
                                 <span class="btn-icon">✅</span> Submit
                             </button>
                         </div>
-                        <div class="status status-info" id="recordStatus">Ready to record</div>
+                        <div class="status" data-variant="info" id="recordStatus">Ready to record</div>
                     </div>
                 </div>
                 
@@ -1421,7 +2323,7 @@ async def serve_dashboard():
                     <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(120px, 1fr)); gap: 12px; margin-bottom: 16px;" id="emotionButtons">
                         <!-- Emotion buttons will be loaded here -->
                     </div>
-                    <div class="status status-info" id="selectedEmotion">Selected: None</div>
+                    <div class="status" data-variant="info" id="selectedEmotion">Selected: None</div>
                     <div style="margin-top: 16px;">
                         <button class="btn btn-secondary" onclick="submitWithoutEmotion()" style="margin-right: 8px;">
                             <span class="btn-icon">⏭️</span> Submit without Emotion
@@ -1542,92 +2444,7 @@ async def serve_dashboard():
                     <p class="page-description">Manage linked words and variant words for real-time updates</p>
                 </div>
                 
-                <!-- Linked Words Section -->
-                <div class="card">
-                    <h3 class="card-title">Linked Words (Wrong → Correct)</h3>
-                    <p style="color: #64748b; margin-bottom: 20px;">Add word corrections that will be saved to linked_words.json</p>
-                    
-                    <div style="display: grid; grid-template-columns: 1fr 1fr auto; gap: 12px; margin-bottom: 20px; align-items: end;">
-                        <div>
-                            <label style="display: block; margin-bottom: 6px; font-weight: 500; color: #374151;">Wrong Word:</label>
-                            <input type="text" id="wrongWord" class="form-input" placeholder="Enter wrong word" style="width: 100%;">
-                        </div>
-                        <div>
-                            <label style="display: block; margin-bottom: 6px; font-weight: 500; color: #374151;">Correct Word:</label>
-                            <input type="text" id="correctWord" class="form-input" placeholder="Enter correct word" style="width: 100%;">
-                        </div>
-                        <button class="btn btn-primary" onclick="addLinkedWord()" style="height: 44px;">
-                            <span class="btn-icon">➕</span> Add
-                        </button>
-                    </div>
-                    
-                    <div id="linkedWordStatus" class="status status-info" style="display: none;"></div>
-                    
-                    <div style="margin-top: 24px;">
-                        <h4 style="margin-bottom: 12px; color: #374151;">Current Linked Words:</h4>
-                        <div id="linkedWordsList" style="max-height: 300px; overflow-y: auto; border: 1px solid #e2e8f0; border-radius: 8px; padding: 12px;">
-                            Loading linked words...
-                        </div>
-                    </div>
-                </div>
-                
-                <!-- Variant Words Section -->
-                <div class="card">
-                    <h3 class="card-title">Variant Words (Canonical → Variant)</h3>
-                    <p style="color: #64748b; margin-bottom: 20px;">Add word variants that will be saved to hassaniya_variants.jsonl</p>
-                    
-                    <div style="display: grid; grid-template-columns: 1fr 1fr auto; gap: 12px; margin-bottom: 20px; align-items: end;">
-                        <div>
-                            <label style="display: block; margin-bottom: 6px; font-weight: 500; color: #374151;">Canonical Word:</label>
-                            <input type="text" id="canonicalWord" class="form-input" placeholder="Enter canonical word" style="width: 100%;">
-                        </div>
-                        <div>
-                            <label style="display: block; margin-bottom: 6px; font-weight: 500; color: #374151;">Variant Word:</label>
-                            <input type="text" id="variantWord" class="form-input" placeholder="Enter variant word" style="width: 100%;">
-                        </div>
-                        <button class="btn btn-primary" onclick="addVariantWord()" style="height: 44px;">
-                            <span class="btn-icon">➕</span> Add
-                        </button>
-                    </div>
-                    
-                    <div id="variantWordStatus" class="status status-info" style="display: none;"></div>
-                    
-                    <div style="margin-top: 24px;">
-                        <h4 style="margin-bottom: 12px; color: #374151;">Current Variant Words:</h4>
-                        <div id="variantWordsList" style="max-height: 300px; overflow-y: auto; border: 1px solid #e2e8f0; border-radius: 8px; padding: 12px;">
-                            Loading variant words...
-                        </div>
-                    </div>
-                </div>
-                
-                <!-- Grammar Variants Section (Existing) -->
-                <div class="card">
-                    <h3 class="card-title">Grammar Variants (Existing Feature)</h3>
-                    <p style="color: #64748b; margin-bottom: 20px;">Report grammar variants and suggestions</p>
-                    
-                    <div style="display: grid; grid-template-columns: 1fr 1fr auto; gap: 12px; margin-bottom: 20px; align-items: end;">
-                        <div>
-                            <label style="display: block; margin-bottom: 6px; font-weight: 500; color: #374151;">Word:</label>
-                            <input type="text" id="variantReportWord" class="form-input" placeholder="Enter word" style="width: 100%;">
-                        </div>
-                        <div>
-                            <label style="display: block; margin-bottom: 6px; font-weight: 500; color: #374151;">Suggestion:</label>
-                            <input type="text" id="variantReportSuggestion" class="form-input" placeholder="Enter suggestion" style="width: 100%;">
-                        </div>
-                        <button class="btn btn-primary" onclick="addVariantReport()" style="height: 44px;">
-                            <span class="btn-icon">📝</span> Report
-                        </button>
-                    </div>
-                    
-                    <div id="variantReportStatus" class="status status-info" style="display: none;"></div>
-                    
-                    <div style="margin-top: 24px;">
-                        <h4 style="margin-bottom: 12px; color: #374151;">Current Grammar Variants:</h4>
-                        <div id="grammarVariantsList" style="max-height: 300px; overflow-y: auto; border: 1px solid #e2e8f0; border-radius: 8px; padding: 12px;">
-                            Loading grammar variants...
-                        </div>
-                    </div>
-                </div>
+""" + "".join(_VARIANT_SECTION_HTML.format(**section) for section in VARIANT_SECTIONS) + """
             </div>
             
             <!-- Admin Page -->
@@ -1650,7 +2467,7 @@ async def serve_dashboard():
                         </button>
                     </div>
                     
-                    <div id="userManagementStatus" class="status status-info" style="display: none;"></div>
+                    <div id="userManagementStatus" class="status" data-variant="info" style="display: none;"></div>
                     
                     <div style="margin-top: 24px;">
                         <h4 style="margin-bottom: 12px; color: #374151;">Current Users:</h4>
@@ -1663,7 +2480,11 @@ async def serve_dashboard():
         </div>
     </div>
     
+    <div id="toast" class="toast hidden" role="status"></div>
+    
     <script>
+        'use strict';
+        
         // Check login status
         const currentUser = localStorage.getItem('username');
         if (!currentUser) {
@@ -1679,35 +2500,120 @@ async def serve_dashboard():
         
         let isRecording = false;
         let mediaRecorder;
-        let audioChunks = [];
+        // One chunk list for the whole session, emptied in place between takes
+        const audioChunks = [];
+        let recordedBlob = null;
         let currentParagraph = null;
         
-        // Navigation
-        function showPage(pageId) {
+        // Elements the handlers touch on every call, looked up once
+        const els = {
+            toast: document.getElementById('toast'),
+            recordBtn: document.getElementById('recordBtn'),
+            recordIcon: document.getElementById('recordIcon'),
+            recordStatus: document.getElementById('recordStatus'),
+            textToRecord: document.getElementById('textToRecord'),
+            editedText: document.getElementById('editedText'),
+            selectedEmotion: document.getElementById('selectedEmotion'),
+            emotionSelection: document.getElementById('emotionSelection'),
+            emotionButtons: document.getElementById('emotionButtons'),
+            inputText: document.getElementById('inputText'),
+            outputText: document.getElementById('outputText'),
+            diffSection: document.getElementById('diffSection'),
+            diffOutput: document.getElementById('diffOutput'),
+            totalParagraphs: document.getElementById('totalParagraphs'),
+            completedParagraphs: document.getElementById('completedParagraphs'),
+            userRecordings: document.getElementById('userRecordings'),
+            recordingMinutes: document.getElementById('recordingMinutes'),
+            adminTab: document.getElementById('adminTab'),
+            // Elements of lazily loaded pages are added by loadPanel()
+        };
+        
+        // Navigation: only the active nav item and page are tracked, so
+        // switching pages touches two elements instead of scanning them all
+        let activeNav = document.querySelector('.nav-item.active');
+        let activePage = document.getElementById('dashboard');
+        
+        document.querySelector('.nav').addEventListener('click', e => {
+            const navItem = e.target.closest('[data-page]');
+            if (navItem) {
+                showPage(navItem.dataset.page, navItem);
+            }
+        });
+        
+        // The variant lists' Delete buttons carry the entry in data-*
+        // attributes and share this one listener on their page
+        document.getElementById('variants').addEventListener('click', e => {
+            const btn = e.target.closest('[data-del]');
+            if (!btn) {
+                return;
+            }
+            const entry = btn.dataset;
+            if (entry.del === 'linked') {
+                deleteLinkedWord(entry.wrong, entry.correct);
+            } else if (entry.del === 'variant') {
+                deleteVariantWord(entry.canonical, entry.variant);
+            } else if (entry.del === 'grammar') {
+                deleteGrammarVariant(entry);
+            }
+        });
+        
+        // Rarely used pages ship empty, with their markup's URL in
+        // data-panel; each is fetched once, the first time it is shown
+        const panelLoads = {};
+        
+        function loadPanel(page) {
+            if (!page.dataset.panel) {
+                return Promise.resolve();
+            }
+            if (!panelLoads[page.id]) {
+                panelLoads[page.id] = fetch(page.dataset.panel)
+                    .then(response => {
+                        if (!response.ok) {
+                            throw new Error(`HTTP ${response.status}`);
+                        }
+                        return response.text();
+                    })
+                    .then(html => {
+                        page.innerHTML = html;
+                        delete page.dataset.panel;
+                        for (const node of page.querySelectorAll('[id]')) {
+                            els[node.id] = node;
+                        }
+                    })
+                    .catch(error => {
+                        // Let the next visit retry
+                        delete panelLoads[page.id];
+                        throw error;
+                    });
+            }
+            return panelLoads[page.id];
+        }
+        
+        async function showPage(pageId, navItem) {
             // Check admin access for admin page
             if (pageId === 'admin' && !isAdmin) {
                 showMessage('Access denied: Admin privileges required', 'error');
                 return;
             }
             
-            // Hide all pages
-            document.querySelectorAll('.content-area').forEach(area => {
-                area.classList.remove('active');
-            });
-            
-            // Remove active class from nav items
-            document.querySelectorAll('.nav-item').forEach(item => {
-                item.classList.remove('active');
-            });
-            
-            // Show selected page
-            document.getElementById(pageId).classList.add('active');
+            const page = document.getElementById(pageId);
+            activePage.classList.remove('active');
+            activeNav.classList.remove('active');
+            activePage = page;
+            activeNav = navItem;
+            activePage.classList.add('active');
+            activeNav.classList.add('active');
             
-            // Add active class to clicked nav item
-            event.target.closest('.nav-item').classList.add('active');
+            try {
+                await loadPanel(page);
+            } catch (error) {
+                console.error('Error loading page:', error);
+                showMessage('Could not load this page, please try again', 'error');
+                return;
+            }
             
             // Load data for specific pages
-            if (pageId === 'dashboard') {
+            if (pageId === 'dashboard' || pageId === 'statistics') {
                 loadStats();
             }
             if (pageId === 'record') {
@@ -1715,7 +2621,7 @@ async def serve_dashboard():
                 loadNextParagraph();
             }
             if (pageId === 'upload') {
-                document.getElementById('uploadUsername').textContent = currentUsername;
+                els.uploadUsername.textContent = currentUsername;
             }
             if (pageId === 'variants') {
                 loadLinkedWords();
@@ -1732,42 +2638,78 @@ async def serve_dashboard():
             window.location.href = '/';
         }
         
+        function setStatus(el, text, variant) {
+            el.textContent = text;
+            el.dataset.variant = variant;
+        }
+        
+        // Escapes server and user strings before they go into innerHTML
+        // markup, including attribute values
+        const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+        const HTML_SPECIAL = /[&<>"']/g;
+        
+        function esc(value) {
+            return String(value).replace(HTML_SPECIAL, c => HTML_ESCAPES[c]);
+        }
+        
+        function debounce(fn, ms) {
+            let timer;
+            return (...args) => {
+                clearTimeout(timer);
+                timer = setTimeout(() => fn(...args), ms);
+            };
+        }
+        
+        // Reloads after adds, deletes and resets, so a burst of edits
+        // refetches and redraws each list once
+        const reloadStats = debounce(loadStats, 150);
+        const reloadLinkedWords = debounce(loadLinkedWords, 150);
+        const reloadVariantWords = debounce(loadVariantWords, 150);
+        const reloadGrammarVariants = debounce(loadGrammarVariants, 150);
+        
         // Recording functions
         async function toggleRecording() {
-            const btn = document.getElementById('recordBtn');
-            const icon = document.getElementById('recordIcon');
-            const status = document.getElementById('recordStatus');
+            const btn = els.recordBtn;
+            const icon = els.recordIcon;
+            const status = els.recordStatus;
             
             if (!isRecording) {
                 try {
                     const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
                     mediaRecorder = new MediaRecorder(stream);
-                    audioChunks = [];
+                    audioChunks.length = 0;
+                    recordedBlob = null;
                     
                     mediaRecorder.ondataavailable = event => {
                         audioChunks.push(event.data);
                     };
+                    // Assemble the recording once, when the last chunk is in,
+                    // tagged with the type the recorder actually produced
+                    mediaRecorder.onstop = () => {
+                        recordedBlob = new Blob(audioChunks, { type: mediaRecorder.mimeType || 'audio/webm' });
+                        audioChunks.length = 0;
+                        stream.getTracks().forEach(track => track.stop());
+                    };
                     
-                    mediaRecorder.start();
+                    // With a timeslice the encoder hands data over as it goes
+                    // instead of buffering the whole take until stop()
+                    mediaRecorder.start(2000);
                     isRecording = true;
                     icon.textContent = '⏹️';
-                    btn.className = 'record-button recording';
-                    status.textContent = 'Recording... 🎙️';
-                    status.className = 'status status-success';
+                    btn.dataset.recording = 'true';
+                    setStatus(status, 'Recording... 🎙️', 'success');
                 } catch (error) {
-                    status.textContent = 'Error: Could not access microphone';
-                    status.className = 'status status-error';
+                    setStatus(status, 'Error: Could not access microphone', 'error');
                 }
             } else {
                 mediaRecorder.stop();
                 isRecording = false;
                 icon.textContent = '🔴';
-                btn.className = 'record-button stopped';
-                status.textContent = 'Recording stopped. Select an emotion to submit.';
-                status.className = 'status status-info';
+                btn.dataset.recording = 'false';
+                setStatus(status, 'Recording stopped. Select an emotion to submit.', 'info');
                 
                 // Show emotion selection
-                document.getElementById('emotionSelection').style.display = 'block';
+                els.emotionSelection.style.display = 'block';
                 document.querySelector('#record .btn-primary').disabled = true; // Disable submit until emotion is selected
             }
         }
@@ -1775,30 +2717,26 @@ async def serve_dashboard():
         async function loadNextParagraph() {
             const username = currentUsername;
             
-            document.getElementById('textToRecord').value = 'Loading next paragraph...';
+            els.textToRecord.textContent = 'Loading next paragraph...';
             
             try {
-                const response = await fetch(`/api/para/next?username=${username}`);
+                const response = await fetch(`/api/para/next?username=${encodeURIComponent(username)}`);
                 if (response.ok) {
+                    // json() parses the body in one pass without an extra JS string copy
                     currentParagraph = await response.json();
-                    document.getElementById('textToRecord').value = currentParagraph.text_original;
-                    document.getElementById('editedText').value = currentParagraph.text_original;
+                    const text = currentParagraph.text_original;
+                    els.textToRecord.textContent = text;
+                    els.editedText.value = text;
                     
-                    const status = document.getElementById('recordStatus');
-                    status.textContent = `Paragraph ${currentParagraph.id} ready to record`;
-                    status.className = 'status status-info';
+                    setStatus(els.recordStatus, `Paragraph ${currentParagraph.id} ready to record`, 'info');
                 } else {
-                    document.getElementById('textToRecord').value = 'No more paragraphs available';
-                    const status = document.getElementById('recordStatus');
-                    status.textContent = 'No paragraphs available';
-                    status.className = 'status status-warning';
+                    els.textToRecord.textContent = 'No more paragraphs available';
+                    setStatus(els.recordStatus, 'No paragraphs available', 'warning');
                 }
             } catch (error) {
                 console.error('Error loading paragraph:', error);
-                document.getElementById('textToRecord').value = 'Error loading paragraph';
-                const status = document.getElementById('recordStatus');
-                status.textContent = 'Error loading paragraph';
-                status.className = 'status status-error';
+                els.textToRecord.textContent = 'Error loading paragraph';
+                setStatus(els.recordStatus, 'Error loading paragraph', 'error');
             }
         }
         
@@ -1810,9 +2748,7 @@ async def serve_dashboard():
                     method: 'POST'
                 });
                 
-                const status = document.getElementById('recordStatus');
-                status.textContent = 'Paragraph skipped';
-                status.className = 'status status-warning';
+                setStatus(els.recordStatus, 'Paragraph skipped', 'warning');
                 
                 setTimeout(loadNextParagraph, 1000);
             } catch (error) {
@@ -1824,7 +2760,7 @@ async def serve_dashboard():
 
         function selectEmotion(emotion, btn) {
             selectedEmotion = emotion;
-            document.getElementById('selectedEmotion').textContent = `Selected: ${emotion}`;
+            els.selectedEmotion.textContent = `Selected: ${emotion}`;
             
             // Visual feedback for selection
             document.querySelectorAll('.emotion-btn').forEach(b => b.classList.remove('selected'));
@@ -1841,24 +2777,24 @@ async def serve_dashboard():
 
         function resetRecordingState() {
             selectedEmotion = null;
-            audioChunks = [];
+            audioChunks.length = 0;
+            recordedBlob = null;
             isRecording = false;
             
             // Reset UI elements
-            const btn = document.getElementById('recordBtn');
-            const icon = document.getElementById('recordIcon');
-            const status = document.getElementById('recordStatus');
+            const btn = els.recordBtn;
+            const icon = els.recordIcon;
+            const status = els.recordStatus;
             
-            if (btn) btn.className = 'record-button stopped';
+            if (btn) btn.dataset.recording = 'false';
             if (icon) icon.textContent = '🔴';
             if (status) {
-                status.textContent = 'Ready to record';
-                status.className = 'status status-info';
+                setStatus(status, 'Ready to record', 'info');
             }
             
             // Hide emotion selection and reset
-            document.getElementById('emotionSelection').style.display = 'none';
-            document.getElementById('selectedEmotion').textContent = '';
+            els.emotionSelection.style.display = 'none';
+            els.selectedEmotion.textContent = '';
             document.querySelectorAll('.emotion-btn').forEach(b => b.classList.remove('selected'));
             document.querySelector('#record .btn-primary').disabled = false;
         }
@@ -1868,7 +2804,7 @@ async def serve_dashboard():
                 const response = await fetch('/api/emotions');
                 if (response.ok) {
                     const emotions = await response.json();
-                    const container = document.getElementById('emotionButtons');
+                    const container = els.emotionButtons;
                     
                     if (container && emotions.emotions) {
                         container.innerHTML = '';
@@ -1888,7 +2824,7 @@ async def serve_dashboard():
         }
 
         async function submitRecording() {
-            if (!currentParagraph || audioChunks.length === 0) {
+            if (!currentParagraph || !recordedBlob) {
                 showMessage('No recording to submit', 'warning');
                 return;
             }
@@ -1899,17 +2835,29 @@ async def serve_dashboard():
             }
 
             try {
-                const audioBlob = new Blob(audioChunks, { type: 'audio/webm' });
-                const formData = new FormData();
-                formData.append('username', currentUsername);
-                formData.append('text_final', document.getElementById('editedText').value);
-                formData.append('audio_file', audioBlob, `para_${currentParagraph.id}_user_${currentUsername}_${new Date().toISOString().replace(/[:.]/g, '-')}.webm`);
-                formData.append('emotion', selectedEmotion);
-
-                const response = await fetch(`/api/para/${currentParagraph.id}/submit`, {
-                    method: 'POST',
-                    body: formData
-                });
+                // The audio goes as the raw body and the text in a header;
+                // texts over the server's TEXT_FINAL_HEADER_MAX fall back to
+                // a multipart form
+                const textFinal = encodeURIComponent(els.editedText.value);
+                let response;
+                if (textFinal.length <= 4000) {
+                    const query = `username=${encodeURIComponent(currentUsername)}&emotion=${encodeURIComponent(selectedEmotion)}`;
+                    response = await fetch(`/api/para/${currentParagraph.id}/audio?${query}`, {
+                        method: 'PUT',
+                        headers: { 'Content-Type': recordedBlob.type, 'X-Text-Final': textFinal },
+                        body: recordedBlob
+                    });
+                } else {
+                    const formData = new FormData();
+                    formData.append('username', currentUsername);
+                    formData.append('text_final', els.editedText.value);
+                    formData.append('audio_file', recordedBlob, `para_${currentParagraph.id}_user_${currentUsername}_${new Date().toISOString().replace(/[:.]/g, '-')}.webm`);
+                    formData.append('emotion', selectedEmotion);
+                    response = await fetch(`/api/para/${currentParagraph.id}/submit`, {
+                        method: 'POST',
+                        body: formData
+                    });
+                }
 
                 if (response.ok) {
                     showMessage('Recording submitted successfully!', 'success');
@@ -1925,118 +2873,145 @@ async def serve_dashboard():
             }
         }
         
-        // Normalization functions
+        // Normalization functions. Typing re-normalizes after a short pause;
+        // a newer request aborts the one in flight, so a stale response can
+        // never overwrite a fresher one.
+        let normalizeController = null;
+        let normalizeTimer = 0;
+        // Diff runs and changed-word count of the last normalize response
+        let lastDiff = null;
+        
+        els.inputText.addEventListener('input', () => {
+            clearTimeout(normalizeTimer);
+            if (els.inputText.value.trim()) {
+                normalizeTimer = setTimeout(normalizeText, 150);
+            }
+        });
+        
         async function normalizeText() {
-            const input = document.getElementById('inputText').value;
+            clearTimeout(normalizeTimer);
+            const input = els.inputText.value;
             if (!input.trim()) {
-                alert('Please enter some text to normalize');
+                showMessage('Please enter some text to normalize', 'error');
                 return;
             }
             
+            if (normalizeController) {
+                normalizeController.abort();
+            }
+            normalizeController = new AbortController();
+            
             try {
                 const response = await fetch('/api/normalize', {
                     method: 'POST',
                     headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({ text: input, show_diff: true })
+                    body: JSON.stringify({ text: input, show_diff: true, include_changes: false }),
+                    signal: normalizeController.signal
                 });
                 
                 if (response.ok) {
                     const result = await response.json();
-                    document.getElementById('outputText').value = result.normalized;
+                    els.outputText.value = result.normalized;
+                    lastDiff = result;
                     
                     // Automatically show diff if there are changes
-                    if (result.diff_html || input !== result.normalized) {
-                        showDiffVisualization(result.original, result.normalized, result.changes);
+                    if (input !== result.normalized) {
+                        showDiffVisualization(result.diff, result.changed_words);
                     } else {
                         hideDiffVisualization();
                     }
                 }
             } catch (error) {
-                console.error('Error normalizing text:', error);
+                if (error.name !== 'AbortError') {
+                    console.error('Error normalizing text:', error);
+                }
             }
         }
         
-        function showDiffVisualization(original, normalized, changes) {
-            const diffSection = document.getElementById('diffSection');
-            const diffOutput = document.getElementById('diffOutput');
-            
-            // Create visual diff
-            const originalWords = original.split(' ');
-            const normalizedWords = normalized.split(' ');
-            
-            let diffHtml = '<div style="margin-bottom: 20px;">';
-            diffHtml += '<h4 style="margin-bottom: 10px; color: #374151;">Original Text:</h4>';
-            diffHtml += '<div style="padding: 12px; background: #f9fafb; border-radius: 6px; margin-bottom: 15px; line-height: 1.6;">';
-            
-            // Highlight original words that will be changed
-            originalWords.forEach((word, index) => {
-                if (normalizedWords[index] && word !== normalizedWords[index]) {
-                    diffHtml += `<span style="background: #fef3c7; padding: 2px 4px; border-radius: 3px; margin: 1px;">${word}</span> `;
-                } else {
-                    diffHtml += `${word} `;
+        // Append a heading plus text box for one side ('o' or 'n') of the
+        // server's diff runs to parent, with the changed runs highlighted;
+        // consecutive unchanged runs become a single text node.
+        function diffBlock(parent, title, diff, side, boxClass, highlightClass) {
+            const heading = document.createElement('h4');
+            heading.className = 'diff-heading';
+            heading.textContent = title;
+            const box = document.createElement('div');
+            box.className = `diff-box ${boxClass}`;
+            let plain = '';
+            for (const run of diff) {
+                if (run.op === 'eq') {
+                    plain += run.o;
+                    continue;
                 }
-            });
-            
-            diffHtml += '</div>';
-            diffHtml += '<h4 style="margin-bottom: 10px; color: #374151;">Normalized Text:</h4>';
-            diffHtml += '<div style="padding: 12px; background: #f0fdf4; border-radius: 6px; line-height: 1.6;">';
-            
-            // Highlight normalized words that were changed
-            normalizedWords.forEach((word, index) => {
-                if (originalWords[index] && word !== originalWords[index]) {
-                    diffHtml += `<span style="background: #bbf7d0; color: #065f46; padding: 2px 6px; border-radius: 3px; margin: 1px; font-weight: 500;">${word}</span> `;
-                } else {
-                    diffHtml += `${word} `;
+                if (!run[side]) {
+                    continue;
                 }
-            });
+                if (plain) {
+                    box.append(plain);
+                    plain = '';
+                }
+                const span = document.createElement('span');
+                span.className = highlightClass;
+                span.textContent = run[side];
+                box.appendChild(span);
+            }
+            if (plain) {
+                box.append(plain);
+            }
+            parent.append(heading, box);
+        }
+        
+        function showDiffVisualization(diff, changedWords) {
+            const diffSection = els.diffSection;
+            const diffOutput = els.diffOutput;
             
-            diffHtml += '</div></div>';
+            const texts = document.createElement('div');
+            texts.className = 'diff-texts';
+            // Highlight original words that will be changed
+            diffBlock(texts, 'Original Text:', diff, 'o', 'diff-box-original', 'diff-orig');
+            // Highlight normalized words that were changed
+            diffBlock(texts, 'Normalized Text:', diff, 'n', 'diff-box-normalized', 'diff-norm');
             
             // Add change summary
-            const changedWords = originalWords.filter((word, index) => 
-                normalizedWords[index] && word !== normalizedWords[index]
-            ).length;
-            
+            const summary = document.createElement('div');
+            summary.className = 'diff-summary';
+            const label = document.createElement('strong');
             if (changedWords > 0) {
-                diffHtml += `<div style="padding: 10px; background: #dbeafe; border-radius: 6px; border-left: 4px solid #3b82f6;">`;
-                diffHtml += `<strong>Changes:</strong> ${changedWords} word${changedWords > 1 ? 's' : ''} normalized`;
-                diffHtml += '</div>';
+                label.textContent = 'Changes:';
+                summary.append(label, ` ${changedWords} word${changedWords > 1 ? 's' : ''} normalized`);
             } else {
-                diffHtml += `<div style="padding: 10px; background: #f0fdf4; border-radius: 6px; border-left: 4px solid #10b981;">`;
-                diffHtml += '<strong>No changes:</strong> Text is already normalized';
-                diffHtml += '</div>';
+                summary.classList.add('unchanged');
+                label.textContent = 'No changes:';
+                summary.append(label, ' Text is already normalized');
             }
             
-            diffOutput.innerHTML = diffHtml;
+            diffOutput.replaceChildren(texts, summary);
             diffSection.classList.remove('hidden');
         }
         
         function hideDiffVisualization() {
-            const diffSection = document.getElementById('diffSection');
+            const diffSection = els.diffSection;
             diffSection.classList.add('hidden');
         }
         
         function showDiff() {
-            const input = document.getElementById('inputText').value;
-            const output = document.getElementById('outputText').value;
-            
-            if (!input || !output) {
-                alert('Please normalize text first');
+            if (!lastDiff || !els.outputText.value) {
+                showMessage('Please normalize text first', 'error');
                 return;
             }
             
-            showDiffVisualization(input, output);
+            showDiffVisualization(lastDiff.diff, lastDiff.changed_words);
         }
         
         // Upload function
         async function uploadFile() {
-            const fileInput = document.getElementById('fileInput');
+            const fileInput = els.fileInput;
             const file = fileInput.files[0];
             
             if (!file) return;
             
-            const statusDiv = document.getElementById('uploadStatus');
-            statusDiv.innerHTML = '<div class="status status-info">Uploading file...</div>';
+            const statusDiv = els.uploadStatus;
+            statusDiv.innerHTML = '<div class="status" data-variant="info">Uploading file...</div>';
             
             const formData = new FormData();
             formData.append('file', file);
@@ -2050,85 +3025,73 @@ async def serve_dashboard():
                 
                 if (response.ok) {
                     const result = await response.json();
-                    statusDiv.innerHTML = `<div class="status status-success">Successfully uploaded ${result.paragraphs_added} paragraphs for ${currentUsername}</div>`;
-                    loadStats();
+                    statusDiv.innerHTML = `<div class="status" data-variant="success">Successfully uploaded ${result.paragraphs_added} paragraphs for ${esc(currentUsername)}</div>`;
+                    reloadStats();
                 } else {
                     throw new Error('Upload failed');
                 }
             } catch (error) {
-                statusDiv.innerHTML = '<div class="status status-error">Error uploading file</div>';
+                statusDiv.innerHTML = '<div class="status" data-variant="error">Error uploading file</div>';
             }
         }
         
         // Export functions
-        async function exportRecordings() {
-            try {
-                const response = await fetch('/api/export/recordings');
-                if (response.ok) {
-                    const blob = await response.blob();
-                    const url = window.URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = `hassaniya_recordings_${new Date().toISOString().split('T')[0]}.zip`;
-                    document.body.appendChild(a);
-                    a.click();
-                    document.body.removeChild(a);
-                    window.URL.revokeObjectURL(url);
-                }
-            } catch (error) {
-                console.error('Export error:', error);
-            }
+        // Exports are plain navigations to the endpoint: the server sends
+        // Content-Disposition: attachment and the browser streams the ZIP
+        // to disk without holding it in a Blob
+        function downloadFile(url, filename) {
+            const a = document.createElement('a');
+            a.href = url;
+            a.download = filename;
+            document.body.appendChild(a);
+            a.click();
+            a.remove();
         }
         
-        async function exportStats() {
-            try {
-                const response = await fetch('/api/export/statistics');
-                if (response.ok) {
-                    const blob = await response.blob();
-                    const url = window.URL.createObjectURL(blob);
-                    const a = document.createElement('a');
-                    a.href = url;
-                    a.download = `hassaniya_statistics_${new Date().toISOString().split('T')[0]}.zip`;
-                    document.body.appendChild(a);
-                    a.click();
-                    document.body.removeChild(a);
-                    window.URL.revokeObjectURL(url);
-                }
-            } catch (error) {
-                console.error('Export error:', error);
-            }
+        function exportRecordings() {
+            downloadFile('/api/export/recordings', `hassaniya_recordings_${new Date().toISOString().split('T')[0]}.zip`);
+        }
+        
+        function exportStats() {
+            downloadFile('/api/export/statistics', `hassaniya_statistics_${new Date().toISOString().split('T')[0]}.zip`);
         }
         
         // Statistics function
+        // The last stats payload, redrawn as-is when the server answers 304
+        let statsCache = null;
+        
         async function loadStats() {
             try {
-                const response = await fetch('/api/stats');
-                if (response.ok) {
-                    const stats = await response.json();
+                const response = await fetchIfChanged('/api/stats', statsCache !== null);
+                if (response.ok || response.status === 304) {
+                    if (response.ok) {
+                        statsCache = await response.json();
+                    }
+                    const stats = statsCache;
                     
-                    document.getElementById('totalParagraphs').textContent = stats.total_paragraphs;
-                    document.getElementById('completedParagraphs').textContent = stats.completed_paragraphs;
+                    els.totalParagraphs.textContent = stats.total_paragraphs;
+                    els.completedParagraphs.textContent = stats.completed_paragraphs;
                     
                     // User-specific stats
                     const userStats = stats.user_stats[currentUsername] || { recordings: 0, transcription_minutes: 0 };
-                    document.getElementById('userRecordings').textContent = userStats.recordings;
-                    document.getElementById('recordingMinutes').textContent = Math.round(userStats.transcription_minutes);
+                    els.userRecordings.textContent = userStats.recordings;
+                    els.recordingMinutes.textContent = Math.round(userStats.transcription_minutes);
                     
-                    // Detailed stats
-                    const detailedStats = document.getElementById('detailedStats');
-                    detailedStats.innerHTML = `
-                        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 16px;">
-                            <div style="padding: 16px; background: #f8fafc; border-radius: 8px;">
-                                <div style="font-weight: 600; color: #1e293b;">Assigned</div>
-                                <div style="font-size: 24px; color: #10b981;">${stats.assigned_paragraphs}</div>
+                    // Detailed stats, once the statistics page has been loaded
+                    const detailedStats = els.detailedStats;
+                    if (detailedStats) detailedStats.innerHTML = `
+                        <div class="detail-grid">
+                            <div class="detail-tile">
+                                <div class="detail-label">Assigned</div>
+                                <div class="detail-value">${stats.assigned_paragraphs}</div>
                             </div>
-                            <div style="padding: 16px; background: #f8fafc; border-radius: 8px;">
-                                <div style="font-weight: 600; color: #1e293b;">Skipped</div>
-                                <div style="font-size: 24px; color: #f59e0b;">${stats.skipped_paragraphs}</div>
+                            <div class="detail-tile">
+                                <div class="detail-label">Skipped</div>
+                                <div class="detail-value skipped">${stats.skipped_paragraphs}</div>
                             </div>
-                            <div style="padding: 16px; background: #f8fafc; border-radius: 8px;">
-                                <div style="font-weight: 600; color: #1e293b;">Total Recordings</div>
-                                <div style="font-size: 24px; color: #3b82f6;">${stats.total_recordings}</div>
+                            <div class="detail-tile">
+                                <div class="detail-label">Total Recordings</div>
+                                <div class="detail-value recordings">${stats.total_recordings}</div>
                             </div>
                         </div>
                     `;
@@ -2140,7 +3103,7 @@ async def serve_dashboard():
         
         // Reset user statistics function
         async function resetUserStats() {
-            if (!confirm('Are you sure you want to reset all your statistics? This action cannot be undone and will delete all your recordings and progress.')) {
+            if (!(await confirmModal('Are you sure you want to reset all your statistics? This action cannot be undone and will delete all your recordings and progress.'))) {
                 return;
             }
             
@@ -2150,16 +3113,16 @@ async def serve_dashboard():
                 });
                 
                 if (response.ok) {
-                    alert('Your statistics have been reset successfully!');
+                    showMessage('Your statistics have been reset successfully!', 'success');
                     // Reload the stats to show updated values
-                    loadStats();
+                    reloadStats();
                 } else {
                     const errorData = await response.json();
-                    alert(`Error resetting statistics: ${errorData.detail || 'Unknown error'}`);
+                    showMessage(`Error resetting statistics: ${errorData.detail || 'Unknown error'}`, 'error');
                 }
             } catch (error) {
                 console.error('Error resetting statistics:', error);
-                alert('Error resetting statistics. Please try again.');
+                showMessage('Error resetting statistics. Please try again.', 'error');
             }
         }
         
@@ -2169,7 +3132,7 @@ async def serve_dashboard():
             const correct = document.getElementById('correctWord').value.trim();
             
             if (!wrong || !correct) {
-                alert('Please fill in both fields');
+                showMessage('Please fill in both fields', 'error');
                 return;
             }
             
@@ -2189,14 +3152,14 @@ async def serve_dashboard():
                 if (response.ok) {
                     document.getElementById('wrongWord').value = '';
                     document.getElementById('correctWord').value = '';
-                    alert('Linked word added successfully!');
-                    loadLinkedWords();
+                    showMessage('Linked word added successfully!', 'success');
+                    reloadLinkedWords();
                 } else {
-                    alert('Error adding linked word');
+                    showMessage('Error adding linked word', 'error');
                 }
             } catch (error) {
                 console.error('Error:', error);
-                alert('Error adding linked word');
+                showMessage('Error adding linked word', 'error');
             }
         }
         
@@ -2205,7 +3168,7 @@ async def serve_dashboard():
             const variant = document.getElementById('variantWord').value.trim();
             
             if (!canonical || !variant) {
-                alert('Please fill in both fields');
+                showMessage('Please fill in both fields', 'error');
                 return;
             }
             
@@ -2225,82 +3188,158 @@ async def serve_dashboard():
                 if (response.ok) {
                     document.getElementById('canonicalWord').value = '';
                     document.getElementById('variantWord').value = '';
-                    alert('Variant word added successfully!');
-                    loadVariantWords();
+                    showMessage('Variant word added successfully!', 'success');
+                    reloadVariantWords();
                 } else {
-                    alert('Error adding variant word');
+                    showMessage('Error adding variant word', 'error');
                 }
             } catch (error) {
                 console.error('Error:', error);
-                alert('Error adding variant word');
+                showMessage('Error adding variant word', 'error');
+            }
+        }
+        
+        // Last ETag seen per API URL. Loaders that still hold the data
+        // send it back and get an empty 304 if nothing changed.
+        const responseEtags = {};
+        
+        async function fetchIfChanged(url, haveCopy) {
+            const etag = haveCopy ? responseEtags[url] : null;
+            const response = await fetch(url, etag ? { headers: { 'If-None-Match': etag } } : {});
+            if (response.ok) {
+                responseEtags[url] = response.headers.get('ETag');
+            }
+            return response;
+        }
+        
+        // A list container remembers a signature of the data it last rendered,
+        // so reloading unchanged data leaves the DOM untouched.
+        function listUnchanged(container, items) {
+            const text = JSON.stringify(items);
+            let hash = 0x811c9dc5;
+            for (let i = 0; i < text.length; i++) {
+                hash = Math.imul(hash ^ text.charCodeAt(i), 0x01000193);
+            }
+            const sig = text.length + ':' + (hash >>> 0).toString(36);
+            if (container.dataset.sig === sig) {
+                return true;
+            }
+            container.dataset.sig = sig;
+            return false;
+        }
+        
+        // Long lists are inserted a chunk of rows per animation frame, so a
+        // big reload never blocks input for more than a frame. A newer load
+        // or an error message changes the container's data-sig, which
+        // cancels the rest of an earlier render.
+        function renderChunks(container, items, rowFn, chunk = 200) {
+            const sig = container.dataset.sig;
+            let i = 0;
+            container.replaceChildren();
+            function step() {
+                if (container.dataset.sig !== sig) {
+                    return;
+                }
+                const end = Math.min(i + chunk, items.length);
+                container.insertAdjacentHTML('beforeend', items.slice(i, end).map(rowFn).join(''));
+                i = end;
+                if (i < items.length) {
+                    requestAnimationFrame(step);
+                }
             }
+            step();
+        }
+        
+        // A reload that lands after the user has left the variants page is
+        // dropped; opening the page loads all three lists again. Checked
+        // against the active page rather than offsetParent, which would
+        // force a layout.
+        function variantsHidden() {
+            return activePage.id !== 'variants';
         }
         
         async function loadLinkedWords() {
+            if (variantsHidden()) {
+                return;
+            }
             console.log('Loading linked words...');
             try {
-                const response = await fetch('/api/linked_words');
+                const response = await fetchIfChanged('/api/linked_words', els.linkedWordsList && 'sig' in els.linkedWordsList.dataset);
+                if (response.status === 304) {
+                    return;
+                }
                 console.log('Linked words response status:', response.status);
                 if (response.ok) {
                     const data = await response.json();
                     console.log('Linked words data received:', data);
-                    const container = document.getElementById('linkedWordsList');
+                    const container = els.linkedWordsList;
                     if (container && data.linked_words) {
+                        if (listUnchanged(container, data.linked_words)) {
+                            return;
+                        }
                         if (data.linked_words.length === 0) {
                             console.log('No linked words found');
-                            container.innerHTML = '<div style="text-align: center; color: #64748b; padding: 20px;">No linked words found</div>';
+                            container.innerHTML = '<div class="list-empty">No linked words found</div>';
                         } else {
                             console.log(`Displaying ${data.linked_words.length} linked words`);
-                            container.innerHTML = data.linked_words
-                                .map((item, index) => `
-                                    <div style="display: flex; justify-content: space-between; align-items: center; padding: 12px; background: #f8fafc; border-radius: 6px; margin: 6px 0; border: 1px solid #e2e8f0;">
-                                        <div>
-                                            <strong style="color: #dc2626;">${item.wrong}</strong> → <strong style="color: #059669;">${item.correct}</strong>
-                                        </div>
-                                        <button onclick="deleteLinkedWordByIndex(${index})" style="background: #ef4444; color: white; border: none; padding: 4px 8px; border-radius: 4px; cursor: pointer; font-size: 12px;" title="Delete this linked word">
-                                            🗑️ Delete
-                                        </button>
+                            renderChunks(container, data.linked_words, item => `
+                                <div class="list-row">
+                                    <div>
+                                        <strong class="list-wrong">${esc(item.wrong)}</strong> → <strong class="list-correct">${esc(item.correct)}</strong>
                                     </div>
-                                `).join('');
-                            
-                            // Store the data globally for deletion
-                            window.currentLinkedWords = data.linked_words;
+                                    <button class="btn-del" data-del="linked" data-wrong="${esc(item.wrong)}" data-correct="${esc(item.correct)}" title="Delete this linked word">
+                                        🗑️ Delete
+                                    </button>
+                                </div>
+                            `);
                         }
                     } else {
                         console.log('Container not found or no linked_words in data');
                         if (container) {
-                            container.innerHTML = '<div style="color: #f59e0b; padding: 12px;">No linked words data available</div>';
+                            delete container.dataset.sig;
+                            container.innerHTML = '<div class="list-notice">No linked words data available</div>';
                         }
                     }
                 } else {
                     console.error('Failed to fetch linked words, status:', response.status);
-                    const container = document.getElementById('linkedWordsList');
+                    const container = els.linkedWordsList;
                     if (container) {
-                        container.innerHTML = '<div style="color: #ef4444; padding: 12px;">Failed to load linked words</div>';
+                        delete container.dataset.sig;
+                        container.innerHTML = '<div class="list-error">Failed to load linked words</div>';
                     }
                 }
             } catch (error) {
                 console.error('Error loading linked words:', error);
-                const container = document.getElementById('linkedWordsList');
+                const container = els.linkedWordsList;
                 if (container) {
-                    container.innerHTML = '<div style="color: #ef4444; padding: 12px;">Error loading linked words</div>';
+                    delete container.dataset.sig;
+                    container.innerHTML = '<div class="list-error">Error loading linked words</div>';
                 }
             }
         }
         
         async function loadVariantWords() {
+            if (variantsHidden()) {
+                return;
+            }
             console.log('Loading variant words...');
             try {
-                const response = await fetch('/api/variant_words');
+                const response = await fetchIfChanged('/api/variant_words', els.variantWordsList && 'sig' in els.variantWordsList.dataset);
+                if (response.status === 304) {
+                    return;
+                }
                 console.log('Variant words response status:', response.status);
                 if (response.ok) {
                     const data = await response.json();
                     console.log('Variant words data received:', data);
-                    const container = document.getElementById('variantWordsList');
+                    const container = els.variantWordsList;
                     if (container && data.variant_words) {
+                        if (listUnchanged(container, data.variant_words)) {
+                            return;
+                        }
                         if (data.variant_words.length === 0) {
                             console.log('No variant words found');
-                            container.innerHTML = '<div style="text-align: center; color: #64748b; padding: 20px;">No variant words found</div>';
+                            container.innerHTML = '<div class="list-empty">No variant words found</div>';
                         } else {
                             console.log(`Processing ${data.variant_words.length} variant word entries`);
                             // Flatten the variant words data structure
@@ -2319,43 +3358,42 @@ async def serve_dashboard():
                             
                             console.log(`Flattened to ${flatVariants.length} individual variants`);
                             if (flatVariants.length === 0) {
-                                container.innerHTML = '<div style="text-align: center; color: #64748b; padding: 20px;">No variant words found</div>';
+                                container.innerHTML = '<div class="list-empty">No variant words found</div>';
                             } else {
-                                container.innerHTML = flatVariants
-                                    .map((variant, index) => `
-                                        <div style="display: flex; justify-content: space-between; align-items: center; padding: 12px; background: #f8fafc; border-radius: 6px; margin: 6px 0; border: 1px solid #e2e8f0;">
-                                            <div>
-                                                <strong style="color: #7c3aed;">${variant.canonical}</strong> → <strong style="color: #059669;">${variant.variant}</strong>
-                                                <small style="color: #64748b; margin-left: 8px;">(${variant.reporter})</small>
-                                            </div>
-                                            <button onclick="deleteVariantWordByIndex(${index})" style="background: #ef4444; color: white; border: none; padding: 4px 8px; border-radius: 4px; cursor: pointer; font-size: 12px;" title="Delete this variant word">
-                                                🗑️ Delete
-                                            </button>
+                                renderChunks(container, flatVariants, variant => `
+                                    <div class="list-row">
+                                        <div>
+                                            <strong class="list-canonical">${esc(variant.canonical)}</strong> → <strong class="list-correct">${esc(variant.variant)}</strong>
+                                            <small class="list-meta">(${esc(variant.reporter)})</small>
                                         </div>
-                                    `).join('');
-                                
-                                // Store the data globally for deletion
-                                window.currentVariantWords = flatVariants;
+                                        <button class="btn-del" data-del="variant" data-canonical="${esc(variant.canonical)}" data-variant="${esc(variant.variant)}" title="Delete this variant word">
+                                            🗑️ Delete
+                                        </button>
+                                    </div>
+                                `);
                             }
                         }
                     } else {
                         console.log('Container not found or no variant_words in data');
                         if (container) {
-                            container.innerHTML = '<div style="color: #f59e0b; padding: 12px;">No variant words data available</div>';
+                            delete container.dataset.sig;
+                            container.innerHTML = '<div class="list-notice">No variant words data available</div>';
                         }
                     }
                 } else {
                     console.error('Failed to fetch variant words, status:', response.status);
-                    const container = document.getElementById('variantWordsList');
+                    const container = els.variantWordsList;
                     if (container) {
-                        container.innerHTML = '<div style="color: #ef4444; padding: 12px;">Failed to load variant words</div>';
+                        delete container.dataset.sig;
+                        container.innerHTML = '<div class="list-error">Failed to load variant words</div>';
                     }
                 }
             } catch (error) {
                 console.error('Error loading variant words:', error);
-                const container = document.getElementById('variantWordsList');
+                const container = els.variantWordsList;
                 if (container) {
-                    container.innerHTML = '<div style="color: #ef4444; padding: 12px;">Error loading variant words</div>';
+                    delete container.dataset.sig;
+                    container.innerHTML = '<div class="list-error">Error loading variant words</div>';
                 }
             }
         }
@@ -2365,7 +3403,7 @@ async def serve_dashboard():
             const suggestion = document.getElementById('variantReportSuggestion').value.trim();
             
             if (!word || !suggestion) {
-                alert('Please fill in both fields');
+                showMessage('Please fill in both fields', 'error');
                 return;
             }
             
@@ -2385,90 +3423,90 @@ async def serve_dashboard():
                 if (response.ok) {
                     document.getElementById('variantReportWord').value = '';
                     document.getElementById('variantReportSuggestion').value = '';
-                    alert('Grammar variant reported successfully!');
-                    loadGrammarVariants();
+                    showMessage('Grammar variant reported successfully!', 'success');
+                    reloadGrammarVariants();
                 } else {
-                    alert('Error reporting grammar variant');
+                    showMessage('Error reporting grammar variant', 'error');
                 }
             } catch (error) {
                 console.error('Error:', error);
-                alert('Error reporting grammar variant');
+                showMessage('Error reporting grammar variant', 'error');
             }
         }
         
         async function loadGrammarVariants() {
+            if (variantsHidden()) {
+                return;
+            }
             console.log('Loading grammar variants...');
             try {
-                const response = await fetch('/api/variants');
+                const response = await fetchIfChanged('/api/variants', els.grammarVariantsList && 'sig' in els.grammarVariantsList.dataset);
+                if (response.status === 304) {
+                    return;
+                }
                 console.log('Grammar variants response status:', response.status);
                 if (response.ok) {
                     const data = await response.json();
                     console.log('Grammar variants data received:', data);
-                    const container = document.getElementById('grammarVariantsList');
+                    const container = els.grammarVariantsList;
                     if (container && data.variants) {
+                        if (listUnchanged(container, data.variants)) {
+                            return;
+                        }
                         console.log(`Found ${data.variants.length} grammar variants`);
-                        // Store globally for delete functionality
-                        window.currentGrammarVariants = data.variants;
-                        
                         if (data.variants.length === 0) {
-                            container.innerHTML = '<div style="text-align: center; color: #64748b; padding: 20px;">No grammar variants found</div>';
+                            container.innerHTML = '<div class="list-empty">No grammar variants found</div>';
                         } else {
-                            container.innerHTML = data.variants
-                                .map((variant, index) => `
-                                    <div style="padding: 8px; background: #f8fafc; border-radius: 4px; margin: 4px 0; display: flex; justify-content: space-between; align-items: center;">
-                                        <div>
-                                            <strong>${variant.word}</strong> → ${variant.suggestion}
-                                            <small style="color: #64748b; margin-left: 8px;">(by ${variant.reporter})</small>
-                                        </div>
-                                        <button onclick="deleteGrammarVariantByIndex(${index})" 
-                                                style="background: #ef4444; color: white; border: none; padding: 4px 8px; border-radius: 4px; cursor: pointer; font-size: 12px;"
-                                                title="Delete this grammar variant">
-                                            Delete
-                                        </button>
+                            renderChunks(container, data.variants, variant => `
+                                <div class="list-row compact">
+                                    <div>
+                                        <strong>${esc(variant.word)}</strong> → ${esc(variant.suggestion)}
+                                        <small class="list-meta">(by ${esc(variant.reporter)})</small>
                                     </div>
-                                `).join('');
+                                    <button class="btn-del" data-del="grammar" data-id="${esc(variant.id)}" data-reporter="${esc(variant.reporter)}" data-word="${esc(variant.word)}" data-suggestion="${esc(variant.suggestion)}" title="Delete this grammar variant">
+                                        Delete
+                                    </button>
+                                </div>
+                            `);
                         }
                     } else {
                         console.log('Container not found or no variants in data');
                         if (container) {
-                            container.innerHTML = '<div style="color: #f59e0b; padding: 12px;">No grammar variants data available</div>';
+                            delete container.dataset.sig;
+                            container.innerHTML = '<div class="list-notice">No grammar variants data available</div>';
                         }
                     }
                 } else {
                     console.error('Failed to fetch grammar variants, status:', response.status);
-                    const container = document.getElementById('grammarVariantsList');
+                    const container = els.grammarVariantsList;
                     if (container) {
-                        container.innerHTML = '<div style="color: #ef4444; padding: 12px;">Failed to load grammar variants</div>';
+                        delete container.dataset.sig;
+                        container.innerHTML = '<div class="list-error">Failed to load grammar variants</div>';
                     }
                 }
             } catch (error) {
                 console.error('Error loading grammar variants:', error);
-                const container = document.getElementById('grammarVariantsList');
+                const container = els.grammarVariantsList;
                 if (container) {
-                    container.innerHTML = '<div style="color: #ef4444; padding: 12px;">Error loading grammar variants</div>';
+                    delete container.dataset.sig;
+                    container.innerHTML = '<div class="list-error">Error loading grammar variants</div>';
                 }
             }
         }
 
-        async function deleteLinkedWordByIndex(index) {
-            if (!window.currentLinkedWords || !window.currentLinkedWords[index]) {
-                showMessage('Error: Invalid linked word selection', 'error');
-                return;
-            }
-            
-            const item = window.currentLinkedWords[index];
-            if (!confirm(`Are you sure you want to delete the linked word "${item.wrong}" → "${item.correct}"?`)) {
+        async function deleteLinkedWord(wrongWord, correctWord) {
+            if (!(await confirmModal(`Are you sure you want to delete the linked word "${wrongWord}" → "${correctWord}"?`))) {
                 return;
             }
             
             try {
-                const response = await fetch(`/api/linked_words/${encodeURIComponent(item.wrong)}/${encodeURIComponent(item.correct)}`, {
+                const response = await fetch(`/api/linked_words/${encodeURIComponent(wrongWord)}/${encodeURIComponent(correctWord)}`, {
                     method: 'DELETE'
                 });
                 
                 if (response.ok) {
                     console.log('Linked word deleted successfully');
-                    loadLinkedWords(); // Reload the list
+                    reloadLinkedWords(); // Reload the list
                     showMessage('Linked word deleted successfully!', 'success');
                 } else {
                     const error = await response.text();
@@ -2481,25 +3519,19 @@ async def serve_dashboard():
             }
         }
 
-        async function deleteVariantWordByIndex(index) {
-            if (!window.currentVariantWords || !window.currentVariantWords[index]) {
-                showMessage('Error: Invalid variant word selection', 'error');
-                return;
-            }
-            
-            const variant = window.currentVariantWords[index];
-            if (!confirm(`Are you sure you want to delete the variant "${variant.canonical}" → "${variant.variant}"?`)) {
+        async function deleteVariantWord(canonical, variant) {
+            if (!(await confirmModal(`Are you sure you want to delete the variant "${canonical}" → "${variant}"?`))) {
                 return;
             }
             
             try {
-                const response = await fetch(`/api/variant_words/${encodeURIComponent(variant.canonical)}/${encodeURIComponent(variant.variant)}`, {
+                const response = await fetch(`/api/variant_words/${encodeURIComponent(canonical)}/${encodeURIComponent(variant)}`, {
                     method: 'DELETE'
                 });
                 
                 if (response.ok) {
                     console.log('Variant word deleted successfully');
-                    loadVariantWords(); // Reload the list
+                    reloadVariantWords(); // Reload the list
                     showMessage('Variant word deleted successfully!', 'success');
                 } else {
                     const error = await response.text();
@@ -2512,14 +3544,8 @@ async def serve_dashboard():
             }
         }
 
-        async function deleteGrammarVariantByIndex(index) {
-            if (!window.currentGrammarVariants || !window.currentGrammarVariants[index]) {
-                showMessage('Error: Invalid grammar variant selection', 'error');
-                return;
-            }
-            
-            const variant = window.currentGrammarVariants[index];
-            if (!confirm(`Are you sure you want to delete the grammar variant "${variant.word}" → "${variant.suggestion}"?`)) {
+        async function deleteGrammarVariant(variant) {
+            if (!(await confirmModal(`Are you sure you want to delete the grammar variant "${variant.word}" → "${variant.suggestion}"?`))) {
                 return;
             }
             
@@ -2530,7 +3556,7 @@ async def serve_dashboard():
                 
                 if (response.ok) {
                     console.log('Grammar variant deleted successfully');
-                    loadGrammarVariants(); // Reload the list
+                    reloadGrammarVariants(); // Reload the list
                     showMessage('Grammar variant deleted successfully!', 'success');
                 } else {
                     const error = await response.text();
@@ -2543,83 +3569,63 @@ async def serve_dashboard():
             }
         }
 
-        // Keep the original functions for backward compatibility
-        async function deleteLinkedWord(wrongWord, correctWord) {
-            if (!confirm(`Are you sure you want to delete the linked word "${wrongWord}" → "${correctWord}"?`)) {
-                return;
-            }
-            
-            try {
-                const response = await fetch(`/api/linked_words/${encodeURIComponent(wrongWord)}/${encodeURIComponent(correctWord)}`, {
-                    method: 'DELETE'
-                });
-                
-                if (response.ok) {
-                    console.log('Linked word deleted successfully');
-                    loadLinkedWords(); // Reload the list
-                    showMessage('Linked word deleted successfully!', 'success');
-                } else {
-                    const error = await response.text();
-                    console.error('Failed to delete linked word:', error);
-                    showMessage('Failed to delete linked word', 'error');
-                }
-            } catch (error) {
-                console.error('Error deleting linked word:', error);
-                showMessage('Error deleting linked word', 'error');
-            }
+        // One toast element is reused; a new message replaces the current
+        // one and restarts its timer
+        let toastTimer;
+        
+        function showMessage(message, type = 'info') {
+            const toast = els.toast;
+            toast.textContent = message;
+            toast.className = `toast toast-${type}`;
+            clearTimeout(toastTimer);
+            toastTimer = setTimeout(() => {
+                toast.classList.add('leaving');
+                toastTimer = setTimeout(() => toast.classList.add('hidden'), 300);
+            }, 3000);
         }
 
-        async function deleteVariantWord(canonical, variant) {
-            if (!confirm(`Are you sure you want to delete the variant "${canonical}" → "${variant}"?`)) {
-                return;
-            }
-            
-            try {
-                const response = await fetch(`/api/variant_words/${encodeURIComponent(canonical)}/${encodeURIComponent(variant)}`, {
-                    method: 'DELETE'
-                });
+        // Non-blocking stand-in for confirm(): resolves to true once the
+        // user confirms, false on Cancel or Escape
+        function confirmModal(message) {
+            return new Promise(resolve => {
+                const overlay = document.createElement('div');
+                overlay.className = 'modal-overlay';
+                const dialog = document.createElement('div');
+                dialog.className = 'modal';
+                dialog.setAttribute('role', 'alertdialog');
+                const text = document.createElement('p');
+                text.textContent = message;
+                const actions = document.createElement('div');
+                actions.className = 'modal-actions';
+                const cancelBtn = document.createElement('button');
+                cancelBtn.className = 'modal-btn';
+                cancelBtn.textContent = 'Cancel';
+                const confirmBtn = document.createElement('button');
+                confirmBtn.className = 'modal-btn confirm';
+                confirmBtn.textContent = 'Confirm';
                 
-                if (response.ok) {
-                    console.log('Variant word deleted successfully');
-                    loadVariantWords(); // Reload the list
-                    showMessage('Variant word deleted successfully!', 'success');
-                } else {
-                    const error = await response.text();
-                    console.error('Failed to delete variant word:', error);
-                    showMessage('Failed to delete variant word', 'error');
+                function close(result) {
+                    document.removeEventListener('keydown', onKey);
+                    overlay.remove();
+                    resolve(result);
                 }
-            } catch (error) {
-                console.error('Error deleting variant word:', error);
-                showMessage('Error deleting variant word', 'error');
-            }
-        }
-
-        function showMessage(message, type = 'info') {
-            const messageDiv = document.createElement('div');
-            messageDiv.style.cssText = `
-                position: fixed;
-                top: 20px;
-                right: 20px;
-                padding: 12px 20px;
-                border-radius: 6px;
-                color: white;
-                font-weight: 500;
-                z-index: 1000;
-                animation: slideIn 0.3s ease-out;
-                ${type === 'success' ? 'background: #059669;' : type === 'error' ? 'background: #dc2626;' : 'background: #3b82f6;'}
-            `;
-            messageDiv.textContent = message;
-            
-            document.body.appendChild(messageDiv);
-            
-            setTimeout(() => {
-                messageDiv.style.animation = 'slideOut 0.3s ease-in';
-                setTimeout(() => {
-                    document.body.removeChild(messageDiv);
-                }, 300);
-            }, 3000);
+                function onKey(e) {
+                    if (e.key === 'Escape') {
+                        close(false);
+                    }
+                }
+                cancelBtn.addEventListener('click', () => close(false));
+                confirmBtn.addEventListener('click', () => close(true));
+                document.addEventListener('keydown', onKey);
+                
+                actions.append(cancelBtn, confirmBtn);
+                dialog.append(text, actions);
+                overlay.append(dialog);
+                document.body.append(overlay);
+                confirmBtn.focus();
+            });
         }
-
+        
         // Admin functions
         async function createUser() {
             if (!isAdmin) {
@@ -2658,7 +3664,8 @@ async def serve_dashboard():
         }
         
         async function loadUsers() {
-            if (!isAdmin) return;
+            // The list lives in the admin panel, which may not be loaded yet
+            if (!isAdmin || !els.usersList) return;
             
             try {
                 const response = await fetch('/api/users');
@@ -2668,38 +3675,36 @@ async def serve_dashboard():
                     const users = usersData.all_users || [];
                     displayUsers(users);
                 } else {
-                    document.getElementById('usersList').innerHTML = 'Error loading users';
+                    els.usersList.innerHTML = 'Error loading users';
                 }
             } catch (error) {
                 console.error('Error loading users:', error);
-                document.getElementById('usersList').innerHTML = 'Error loading users';
+                els.usersList.innerHTML = 'Error loading users';
             }
         }
         
         function displayUsers(users) {
-            const usersList = document.getElementById('usersList');
+            const usersList = els.usersList;
             if (users.length === 0) {
-                usersList.innerHTML = '<p style="color: #64748b; text-align: center; padding: 20px;">No users found</p>';
+                usersList.innerHTML = '<p class="list-empty">No users found</p>';
                 return;
             }
             
-            let html = '';
-            users.forEach(user => {
+            // Build the rows as parts and join once, like the word lists
+            usersList.innerHTML = users.map(user => {
                 const isCurrentUser = user === currentUsername;
                 const canDelete = !isCurrentUser && isAdmin;
                 
-                html += `
-                    <div style="display: flex; justify-content: space-between; align-items: center; padding: 12px; border-bottom: 1px solid #e2e8f0; background: ${isCurrentUser ? '#f0f9ff' : 'white'};">
+                return `
+                    <div class="user-row${isCurrentUser ? ' current' : ''}">
                         <div>
-                            <span style="font-weight: 500; color: #374151;">${user}</span>
-                            ${isCurrentUser ? '<span style="color: #3b82f6; font-size: 12px; margin-left: 8px;">(You)</span>' : ''}
+                            <span class="user-row-name">${esc(user)}</span>
+                            ${isCurrentUser ? '<span class="user-row-you">(You)</span>' : ''}
                         </div>
-                        ${canDelete ? `<button onclick="deleteUser('${user}')" style="background: #ef4444; color: white; border: none; padding: 4px 8px; border-radius: 4px; font-size: 12px; cursor: pointer;">Delete</button>` : ''}
+                        ${canDelete ? `<button onclick="deleteUser(this.dataset.user)" data-user="${esc(user)}" class="btn-del">Delete</button>` : ''}
                     </div>
                 `;
-            });
-            
-            usersList.innerHTML = html;
+            }).join('');
         }
         
         async function deleteUser(username) {
@@ -2708,7 +3713,7 @@ async def serve_dashboard():
                 return;
             }
             
-            if (!confirm(`Are you sure you want to delete user "${username}"?`)) {
+            if (!(await confirmModal(`Are you sure you want to delete user "${username}"?`))) {
                 return;
             }
             
@@ -2732,7 +3737,7 @@ async def serve_dashboard():
 
         // Test function to manually show admin tab
         function testAdminTab() {
-            const adminTab = document.getElementById('adminTab');
+            const adminTab = els.adminTab;
             if (adminTab) {
                 adminTab.style.display = 'flex';
                 console.log('Admin tab manually shown');
@@ -2746,7 +3751,7 @@ async def serve_dashboard():
             console.log('Current username variable:', currentUsername);
             console.log('isAdmin variable:', isAdmin);
             
-            const adminTab = document.getElementById('adminTab');
+            const adminTab = els.adminTab;
             console.log('Admin tab element:', adminTab);
             
             if (adminTab) {
@@ -2761,10 +3766,10 @@ async def serve_dashboard():
                   adminTab.classList.remove('hidden');
                   console.log('Admin tab forced to visible by removing hidden class');
                 
-                alert('Admin tab debug complete - check console for details');
+                showMessage('Admin tab debug complete - check console for details', 'info');
             } else {
                 console.error('Admin tab element not found!');
-                alert('Admin tab element not found!');
+                showMessage('Admin tab element not found!', 'error');
             }
             
             console.log('=== END MANUAL ADMIN DEBUG ===');
@@ -2784,23 +3789,20 @@ async def serve_dashboard():
                 }
                 
                 // Show/hide admin tab based on status
-                const adminTab = document.getElementById('adminTab');
+                const adminTab = els.adminTab;
                 if (adminTab) {
                     adminTab.classList.toggle('hidden', !isAdmin);
                     console.log('Admin tab visibility updated. Is admin:', isAdmin);
                 }
-                
-                // Load users if admin
-                if (isAdmin) {
-                    loadUsers();
-                }
+                // The user list is loaded by showPage('admin'), once the
+                // lazily loaded admin panel is in the page
             } catch (error) {
                 console.error('Error checking admin status:', error);
                 // Fallback to hardcoded admin list
                 const adminUsers = ['EMIN', 'ETHMAN', 'ZAIN', 'MOUHAMEDOU', 'SUPERADMIN'];
                 isAdmin = adminUsers.includes(currentUsername);
                 
-                const adminTab = document.getElementById('adminTab');
+                const adminTab = els.adminTab;
                 if (adminTab) {
                     adminTab.classList.toggle('hidden', !isAdmin);
                 }
@@ -2808,30 +3810,121 @@ async def serve_dashboard():
         }
 
         // Initialize
-        document.addEventListener('DOMContentLoaded', function() {
-            // Add a small delay to ensure DOM is fully ready
-            setTimeout(function() {
-                checkAdminStatus();
-                loadStats();
-                loadNextParagraph();
-                loadLinkedWords();
-                loadVariantWords();
-                loadGrammarVariants();
-            }, 100);
+        // The script is deferred, so the shell's elements
+        // already exist; the three requests are independent and go out at once
+        document.addEventListener('DOMContentLoaded', () => {
+            Promise.all([checkAdminStatus(), loadStats(), loadNextParagraph()]).catch(console.error);
         });
     </script>
 </body>
 </html>
     """
-    return HTMLResponse(content=html_content)
+
+# The dashboard's CSS and JS are most of its weight and rarely change, so
+# they are served separately and only the HTML shell is revalidated
+DASHBOARD_PAGE = StaticPage(_externalize_assets(DASHBOARD_HTML, "dashboard"))
+
+@app.get("/dashboard", response_class=HTMLResponse)
+async def serve_dashboard(request: Request):
+    """Serve the main dashboard."""
+    return DASHBOARD_PAGE.response(request)
 
 # API Endpoints
+# The rule files' mtimes are re-checked at most this often, so an edit is
+# picked up within a second without three stat() calls per request
+NORMALIZER_VERSION_SECONDS = 1.0
+# Only inputs up to this many characters are memoized; live normalization
+# of a long paragraph sends a slightly different full text on every pause,
+# which would only fill the cache with near-duplicates
+NORMALIZE_CACHE_MAX_CHARS = 2000
+
+# (expiry, mtimes) of the last check of the rule files
+_normalizer_version: Optional[Tuple[float, Tuple[float, ...]]] = None
+
+def _normalizer_data_version() -> Tuple[float, ...]:
+    """Modification times of the normalizer's data files (0 if missing).
+    
+    Cached for NORMALIZER_VERSION_SECONDS, like get_stats().
+    """
+    global _normalizer_version
+    now = time.monotonic()
+    if _normalizer_version is not None and now < _normalizer_version[0]:
+        return _normalizer_version[1]
+    
+    version = []
+    for filename in NORMALIZER_DATA_FILES:
+        try:
+            version.append(os.path.getmtime(_get_data_file_path(filename)))
+        except OSError:
+            version.append(0.0)
+    _normalizer_version = (now + NORMALIZER_VERSION_SECONDS, tuple(version))
+    return _normalizer_version[1]
+
+@lru_cache(maxsize=256)
+def _normalize_cached(text: str, data_version: Tuple[float, ...]) -> str:
+    """normalize_text, memoized per text and version of the rule files.
+    
+    Like the data loader's own caches, the key includes the files' mtimes,
+    so an edited word list is picked up on the next check and results
+    computed with the old rules simply age out.
+    """
+    return normalize_text(text)
+
+def _normalize(text: str) -> str:
+    """normalize_text, going through the memo for short inputs only."""
+    if len(text) > NORMALIZE_CACHE_MAX_CHARS:
+        return normalize_text(text)
+    return _normalize_cached(text, _normalizer_data_version())
+
+_DIFF_TOKEN = re.compile(r"\S+|\s+")
+# SequenceMatcher is O(n*m) in the worst case; longer texts are compared
+# token by token instead, which is exact as long as the normalizer keeps
+# the word count
+DIFF_MAX_TOKENS = 2000
+
+def _positional_opcodes(a: List[str], b: List[str]) -> Iterator[Tuple[str, int, int, int, int]]:
+    """SequenceMatcher-style opcodes pairing the tokens of a and b by position."""
+    shared = min(len(a), len(b))
+    start = 0
+    for same, group in groupby(range(shared), key=lambda i: a[i] == b[i]):
+        end = start + sum(1 for _ in group)
+        yield ("equal" if same else "replace", start, end, start, end)
+        start = end
+    if len(a) != len(b):
+        yield ("replace", shared, len(a), shared, len(b))
+
+def _token_diff(original: str, normalized: str) -> Tuple[List[Dict[str, str]], int]:
+    """Diff two texts over their words and the whitespace between them.
+    
+    Returns the runs in order, {"op": "eq", "o": text} for shared text and
+    {"op": "chg", "o": old, "n": new} for replaced, inserted or deleted
+    text, plus the number of original words that changed. The dashboard
+    renders both sides of the diff straight from the runs. Texts over
+    DIFF_MAX_TOKENS tokens are compared position by position.
+    """
+    a = _DIFF_TOKEN.findall(original)
+    b = _DIFF_TOKEN.findall(normalized)
+    if max(len(a), len(b)) > DIFF_MAX_TOKENS:
+        opcodes = _positional_opcodes(a, b)
+    else:
+        # No autojunk: in long texts the single-space token would count as junk
+        opcodes = difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+    runs = []
+    changed_words = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            runs.append({"op": "eq", "o": "".join(a[i1:i2])})
+        else:
+            runs.append({"op": "chg", "o": "".join(a[i1:i2]), "n": "".join(b[j1:j2])})
+            changed_words += sum(1 for token in a[i1:i2] if not token.isspace())
+    return runs, changed_words
+
 @app.post("/api/normalize")
 async def normalize_text_api(request: NormalizationRequest):
     """Normalize text via API."""
     try:
         original_text = request.text
-        normalized_text = normalize_text(original_text)
+        normalized_text = _normalize(original_text)
         
         response = {
             "original": original_text,
@@ -2839,18 +3932,21 @@ async def normalize_text_api(request: NormalizationRequest):
         }
         
         if request.show_diff:
-            # Generate word-level diff information
+            response["diff"], response["changed_words"] = _token_diff(original_text, normalized_text)
+        
+        include_changes = request.show_diff if request.include_changes is None else request.include_changes
+        if include_changes:
+            # Per-position word changes, for clients of the older format
             original_words = original_text.split()
             normalized_words = normalized_text.split()
             
-            changes = []
-            for i, (orig, norm) in enumerate(zip(original_words, normalized_words)):
-                if orig != norm:
-                    changes.append({
-                        "index": i,
-                        "original": orig,
-                        "normalized": norm
-                    })
+            # Compare the word pairs and pick the differing indexes in C
+            # (map/compress) rather than a Python-level loop per word
+            differs = map(ne, original_words, normalized_words)
+            changes = [
+                {"index": i, "original": original_words[i], "normalized": normalized_words[i]}
+                for i in compress(range(len(original_words)), differs)
+            ]
             
             response["changes"] = changes
             response["total_changes"] = len(changes)
@@ -2860,36 +3956,45 @@ async def normalize_text_api(request: NormalizationRequest):
         raise HTTPException(status_code=500, detail=f"Normalization error: {str(e)}")
 
 @app.get("/api/para/next")
-async def get_next_paragraph(username: str):
+async def get_next_paragraph(username: str = Depends(current_user)):
     """Get the next unassigned paragraph."""
-    if not authenticate_user(username):
-        raise HTTPException(status_code=401, detail="Invalid user")
-    
     paragraph = storage.get_next_unassigned(username)
     if not paragraph:
         raise HTTPException(status_code=404, detail="No unassigned paragraphs available")
     return paragraph
 
+AUDIO_COPY_CHUNK_BYTES = 1 << 20
+# Raw audio bodies are buffered in memory up to this size (the same limit
+# Starlette uses for multipart files) and in a temporary file beyond it
+AUDIO_SPOOL_BYTES = 1 << 20
+# Longest URL-encoded X-Text-Final accepted; proxies commonly cap a request's
+# headers at 8 kB in total, so longer texts must go through the multipart
+# /submit endpoint
+TEXT_FINAL_HEADER_MAX = 4000
+
+def _save_upload(source: BinaryIO, path: Path) -> None:
+    """Copy an uploaded file to path in chunks."""
+    with open(path, "wb") as out:
+        shutil.copyfileobj(source, out, AUDIO_COPY_CHUNK_BYTES)
+
 @app.post("/api/para/{para_id}/submit")
 async def submit_paragraph(
     para_id: int,
-    username: str = Form(...),
+    username: str = Depends(current_form_user),
     text_final: str = Form(...),
     emotion: str = Form(None),
     audio_file: UploadFile = File(...)
 ):
     """Submit a recorded paragraph with emotion label."""
-    if not authenticate_user(username):
-        raise HTTPException(status_code=401, detail="Invalid user")
-    
     try:
         # Save audio file
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        timestamp = _file_stamp()
         filename = f"para_{para_id}__user_{username}__{timestamp}.webm"
         file_path = AUDIO_DIR / filename
         
-        with open(file_path, "wb") as f:
-            f.write(await audio_file.read())
+        # Copy off the event loop, 1 MiB at a time, so other requests are not
+        # blocked on disk and the recording is never held in memory whole
+        await asyncio.to_thread(_save_upload, audio_file.file, file_path)
         
         # Update paragraph
         success = storage.complete_paragraph(para_id, text_final, username)
@@ -2904,21 +4009,61 @@ async def submit_paragraph(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error submitting paragraph: {str(e)}")
 
+@app.put("/api/para/{para_id}/audio")
+async def upload_paragraph_audio(
+    para_id: int,
+    request: Request,
+    username: str = Depends(current_user),
+    emotion: Optional[str] = None,
+    x_text_final: str = Header(...)
+):
+    """Submit a recorded paragraph with the audio as the raw request body.
+    
+    Same as /api/para/{para_id}/submit without the multipart framing: the
+    URL-encoded final text comes in the X-Text-Final header, up to
+    TEXT_FINAL_HEADER_MAX characters. The body is spooled as it arrives,
+    then copied to disk by one worker thread, like a multipart upload,
+    rather than one thread hop per received chunk.
+    """
+    if len(x_text_final) > TEXT_FINAL_HEADER_MAX:
+        raise HTTPException(
+            status_code=413,
+            detail=f"X-Text-Final is limited to {TEXT_FINAL_HEADER_MAX} characters; submit longer texts to /api/para/{para_id}/submit",
+        )
+    
+    timestamp = _file_stamp()
+    filename = f"para_{para_id}__user_{username}__{timestamp}.webm"
+    file_path = AUDIO_DIR / filename
+    try:
+        with tempfile.SpooledTemporaryFile(max_size=AUDIO_SPOOL_BYTES) as spool:
+            async for chunk in request.stream():
+                spool.write(chunk)
+            spool.seek(0)
+            await asyncio.to_thread(_save_upload, spool, file_path)
+        
+        if not storage.complete_paragraph(para_id, urllib.parse.unquote(x_text_final), username):
+            raise HTTPException(status_code=404, detail="Paragraph not found or not assigned to user")
+        storage.add_recording(para_id, username, filename, emotion)
+    except Exception as e:
+        file_path.unlink(missing_ok=True)
+        if isinstance(e, HTTPException):
+            raise
+        raise HTTPException(status_code=500, detail=f"Error submitting paragraph: {str(e)}")
+    
+    return {"success": True, "id": para_id, "audio": filename, "emotion": emotion}
+
 @app.post("/api/para/{para_id}/skip")
-async def skip_paragraph(para_id: int, username: str):
+async def skip_paragraph(para_id: int, username: str = Depends(current_user)):
     """Skip a paragraph."""
-    if not authenticate_user(username):
-        raise HTTPException(status_code=401, detail="Invalid user")
-    
     success = storage.skip_paragraph(para_id, username)
     if not success:
         raise HTTPException(status_code=404, detail="Paragraph not found or not assigned to user")
     return {"success": True}
 
 @app.get("/api/stats")
-async def get_stats():
+async def get_stats(request: Request):
     """Get application statistics."""
-    return storage.get_stats()
+    return _json_with_etag(request, storage.get_stats())
 
 @app.get("/api/debug/data-files")
 async def debug_data_files():
@@ -2948,11 +4093,18 @@ async def debug_data_files():
         for filename in data_files:
             try:
                 filepath = _get_data_file_path(filename)
+                # One stat() answers both whether the file exists and its size
+                try:
+                    size = filepath.stat().st_size
+                    exists = True
+                except OSError:
+                    size = 0
+                    exists = False
                 debug_info["data_files_status"][filename] = {
                     "found": True,
                     "path": str(filepath),
-                    "exists": filepath.exists(),
-                    "size": filepath.stat().st_size if filepath.exists() else 0
+                    "exists": exists,
+                    "size": size
                 }
             except Exception as e:
                 debug_info["data_files_status"][filename] = {
@@ -2975,9 +4127,9 @@ async def add_variant(report: VariantReport):
     return {"success": True, "id": variant_id}
 
 @app.get("/api/variants")
-async def get_variants():
+async def get_variants(request: Request):
     """Get all variant reports."""
-    return {"variants": storage.variants}
+    return _json_with_etag(request, {"variants": list(storage.variants.values())})
 
 @app.post("/api/linked_words")
 async def add_linked_word(report: LinkedWordReport):
@@ -2989,9 +4141,9 @@ async def add_linked_word(report: LinkedWordReport):
         return {"success": False, "message": "Entry already exists or error occurred"}
 
 @app.get("/api/linked_words")
-async def get_linked_words():
+async def get_linked_words(request: Request):
     """Get all linked words."""
-    return {"linked_words": storage.get_linked_words()}
+    return _json_with_etag(request, {"linked_words": storage.get_linked_words()})
 
 @app.post("/api/variant_words")
 async def add_variant_word(report: VariantWordReport):
@@ -3003,9 +4155,9 @@ async def add_variant_word(report: VariantWordReport):
         return {"success": False, "message": "Variant already exists or error occurred"}
 
 @app.get("/api/variant_words")
-async def get_variant_words():
+async def get_variant_words(request: Request):
     """Get all variant words."""
-    return {"variant_words": storage.get_variant_words()}
+    return _json_with_etag(request, {"variant_words": storage.get_variant_words()})
 
 @app.delete("/api/linked_words/{wrong_word}/{correct_word}")
 async def delete_linked_word(wrong_word: str, correct_word: str):
@@ -3092,53 +4244,83 @@ async def get_emotion_emojis():
     emotions_list = [{"emoji": emoji, "name": name} for emoji, name in EMOTION_EMOJIS.items()]
     return {"emotions": emotions_list}
 
+TEXT_UPLOAD_CHUNK_BYTES = 1 << 20
+
+# Punctuation that lets a segment end before it reaches max_words
+_SENTENCE_END = ('.', '!', '?', '؟')
+
+def _split_into_segments(text: str, min_words: int = 20, max_words: int = 30) -> List[str]:
+    """Split a paragraph into segments of min_words to max_words words.
+    
+    A segment ends at the first sentence end from its min_words-th word
+    on, or after max_words words. A short tail is merged into the last
+    segment. Only the words that could end a segment are checked, and
+    each segment is joined from one slice of the word list.
+    """
+    words = text.split()
+    word_count = len(words)
+    segments = []
+    start = 0
+    while True:
+        # Index of the last word of the segment starting at `start`
+        stop = min(start + max_words - 1, word_count)
+        for i in range(start + min_words - 1, stop):
+            if words[i].endswith(_SENTENCE_END):
+                stop = i
+                break
+        if stop >= word_count:
+            break
+        segments.append(' '.join(words[start:stop + 1]))
+        start = stop + 1
+    
+    # Add remaining words if any
+    if start < word_count:
+        rest = ' '.join(words[start:])
+        if word_count - start >= min_words or not segments:
+            segments.append(rest)
+        else:  # Merge with last segment if too short
+            segments[-1] += ' ' + rest
+    
+    return segments
+
 @app.post("/api/text/upload")
 async def upload_text(file: UploadFile = File(...), username: str = Form(...)):
     """Upload a text file and split it into paragraphs."""
     try:
-        content = await file.read()
-        text = content.decode("utf-8")
-        
-        # Split text into paragraphs (empty line delimiter)
-        paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-        
-        # Function to split text into 20-30 word segments
-        def split_into_segments(text, min_words=20, max_words=30):
-            words = text.split()
-            segments = []
-            current_segment = []
-            
-            for word in words:
-                current_segment.append(word)
-                
-                # If we reach max words or find a natural break
-                if (len(current_segment) >= max_words or 
-                    (len(current_segment) >= min_words and word.endswith(('.', '!', '?', '؟', '.')))):
-                    segments.append(' '.join(current_segment))
-                    current_segment = []
-            
-            # Add remaining words if any
-            if current_segment:
-                if len(current_segment) >= min_words:
-                    segments.append(' '.join(current_segment))
-                elif segments:  # Merge with last segment if too short
-                    segments[-1] += ' ' + ' '.join(current_segment)
-                else:  # If it's the only segment, keep it even if short
-                    segments.append(' '.join(current_segment))
-            
-            return segments
-        
-        # Split each paragraph into 20-30 word segments
+        # Decode the file in chunks and segment each paragraph (empty line
+        # delimiter) as soon as it is complete, so the whole file is never
+        # held as bytes and str at once. Segments are only stored once the
+        # entire file has decoded, so a bad file adds nothing.
+        decoder = codecs.getincrementaldecoder("utf-8")()
         all_segments = []
-        for paragraph in paragraphs:
-            segments = split_into_segments(paragraph)
-            all_segments.extend(segments)
+        # Decoded pieces of the paragraph still being read. Only each new
+        # piece is searched for the delimiter, so a file without empty lines
+        # is not re-split from its start on every chunk.
+        pending: List[str] = []
+        while True:
+            chunk = await file.read(TEXT_UPLOAD_CHUNK_BYTES)
+            text = decoder.decode(chunk, final=not chunk)
+            if pending and pending[-1].endswith("\n"):
+                # A delimiter may straddle two chunks
+                pending[-1] = pending[-1][:-1]
+                text = "\n" + text
+            *paragraphs, tail = text.split("\n\n")
+            if paragraphs:
+                paragraphs[0] = "".join(pending) + paragraphs[0]
+                pending = []
+            pending.append(tail)
+            if not chunk:
+                paragraphs.append("".join(pending))
+            for paragraph in paragraphs:
+                paragraph = paragraph.strip()
+                if paragraph:
+                    # Split each paragraph into 20-30 word segments
+                    all_segments.extend(_split_into_segments(paragraph))
+            if not chunk:
+                break
         
         # Add segments to storage with the username
-        added_count = 0
-        for segment_text in all_segments:
-            storage.add_paragraph(segment_text, uploaded_by=username)
-            added_count += 1
+        added_count = storage.add_paragraphs(all_segments, uploaded_by=username)
         
         return {"success": True, "paragraphs_added": added_count}
     
@@ -3146,55 +4328,58 @@ async def upload_text(file: UploadFile = File(...), username: str = Form(...)):
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
 
 @app.get("/api/audio/{filename}")
-async def serve_audio(filename: str):
-    """Serve audio files."""
+async def serve_audio(filename: str, request: Request):
+    """Serve audio files.
+    
+    Recordings are tagged with their mtime and size, so a client that
+    already has one gets an empty 304 instead of the whole file again.
+    """
     file_path = AUDIO_DIR / filename
-    if not file_path.exists():
+    try:
+        stat_result = file_path.stat()
+    except OSError:
         raise HTTPException(status_code=404, detail="Audio file not found")
     
-    return FileResponse(file_path, media_type="audio/webm")
+    headers = {
+        "ETag": f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"',
+        "Cache-Control": "public, max-age=3600",
+    }
+    if _etag_matches(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    # Passing the stat result spares FileResponse a second stat()
+    return FileResponse(file_path, media_type="audio/webm", headers=headers, stat_result=stat_result)
 
-@app.get("/api/export/recordings")
-async def export_recordings():
-    """Export recordings as a ZIP file with emotion data."""
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        # Create JSONL file with transcription data
-        jsonl_data = []
-        
-        for recording in storage.recordings:
-            paragraph = next((p for p in storage.paragraphs if p["id"] == recording["paragraph_id"]), None)
-            if paragraph and paragraph["status"] == "done":
-                # Get emotion data if available
-                emotion = recording.get("emotion", None)
-                emotion_label = EMOTION_EMOJIS.get(emotion, None) if emotion else None
-                
-                jsonl_entry = {
-                    "audio_file": recording["filename"],
-                    "text": paragraph["text_final"] or paragraph["text_original"],
-                    "original_text": paragraph["text_original"],
-                    "user": recording["user"],
-                    "paragraph_id": recording["paragraph_id"],
-                    "recording_id": recording["id"],
-                    "created_at": recording["created_at"],
-                    "emotion_emoji": emotion,
-                    "emotion": emotion_label
-                }
-                jsonl_data.append(jsonl_entry)
-        
-        # Add JSONL file to ZIP
-        jsonl_content = "\n".join(json.dumps(entry, ensure_ascii=False) for entry in jsonl_data)
-        zip_file.writestr("transcriptions.jsonl", jsonl_content.encode('utf-8'))
-        
-        # Add audio files to ZIP
-        for recording in storage.recordings:
-            audio_path = AUDIO_DIR / recording["filename"]
-            if audio_path.exists():
-                zip_file.write(audio_path, f"recordings/{recording['filename']}")
-        
-        # Add README
-        readme_content = """# Hassaniya Recordings Export
+# Export archives stay in memory up to this size and spill to a temporary
+# file beyond it
+EXPORT_SPOOL_BYTES = 16 * 1024 * 1024
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+def _iter_spooled(spool: tempfile.SpooledTemporaryFile) -> Iterator[bytes]:
+    """Yield a finished export archive in chunks, then close it."""
+    try:
+        spool.seek(0)
+        while chunk := spool.read(EXPORT_CHUNK_BYTES):
+            yield chunk
+    finally:
+        spool.close()
+
+def _build_recordings_zip(transcriptions: bytes, audio_files: List[str]) -> tempfile.SpooledTemporaryFile:
+    """Write the recordings export archive. Runs in a worker thread."""
+    zip_buffer = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+    try:
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            # Add JSONL file to ZIP
+            zip_file.writestr("transcriptions.jsonl", transcriptions)
+            
+            # Add audio files to ZIP. WebM is already compressed, so the
+            # files are stored as they are rather than deflated again
+            for filename in audio_files:
+                audio_path = AUDIO_DIR / filename
+                if audio_path.exists():
+                    zip_file.write(audio_path, f"recordings/{filename}", compress_type=zipfile.ZIP_STORED)
+            
+            # Add README
+            readme_content = """# Hassaniya Recordings Export
 
 This ZIP file contains:
 - transcriptions.jsonl: Metadata and transcriptions in JSONL format
@@ -3203,56 +4388,84 @@ This ZIP file contains:
 The JSONL file includes emotion labels and is compatible with Whisper fine-tuning workflows.
 Emotion labels can be used to train models to detect emotional content in speech.
 """
-        zip_file.writestr("README.md", readme_content)
+            zip_file.writestr("README.md", readme_content)
+    except BaseException:
+        zip_buffer.close()
+        raise
+    return zip_buffer
+
+def _build_statistics_zip(detailed_stats: Dict[str, Any]) -> tempfile.SpooledTemporaryFile:
+    """Write the statistics export archive. Runs in a worker thread."""
+    zip_buffer = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+    try:
+        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            # orjson, when installed, is several times faster than json here
+            zip_file.writestr("statistics.json", _json_dumps(detailed_stats, indent=True))
+            
+            variants = detailed_stats["variants_reported"]
+            if variants:
+                variants_data = {"total_variants": len(variants), "variants": variants}
+                zip_file.writestr("variant_reports.json", _json_dumps(variants_data, indent=True))
+            
+            # Add user statistics
+            user_stats = detailed_stats["summary"]["user_stats"]
+            zip_file.writestr("user_statistics.json", _json_dumps(user_stats, indent=True))
+            
+            readme_content = """# Hassaniya Statistics Export
+
+This ZIP file contains:
+- statistics.json: Complete system statistics and data
+- variant_reports.json: User-reported grammar variants
+- user_statistics.json: Per-user activity statistics
+"""
+            zip_file.writestr("README.md", readme_content)
+    except BaseException:
+        zip_buffer.close()
+        raise
+    return zip_buffer
+
+@app.get("/api/export/recordings")
+async def export_recordings():
+    """Export recordings as a ZIP file with emotion data."""
+    # Storage is read on the event loop, so not while another request
+    # changes it; compression and the audio file reads then run in a
+    # worker thread. The JSONL file is cached until the next submission.
+    transcriptions = storage.transcriptions_jsonl()
+    audio_files = [recording["filename"] for recording in storage.recordings]
     
-    zip_buffer.seek(0)
+    zip_buffer = await asyncio.to_thread(_build_recordings_zip, transcriptions, audio_files)
     
+    # Streamed from the spool itself rather than copied into a second buffer
     return StreamingResponse(
-        io.BytesIO(zip_buffer.read()),
+        _iter_spooled(zip_buffer),
         media_type="application/zip",
-        headers={"Content-Disposition": f"attachment; filename=hassaniya_recordings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"}
+        headers={
+            "Content-Disposition": f"attachment; filename=hassaniya_recordings_{_file_stamp(utc=False)}.zip",
+            "Content-Length": str(zip_buffer.tell()),
+        }
     )
 
 @app.get("/api/export/statistics")
 async def export_statistics():
     """Export statistics as a ZIP file."""
-    zip_buffer = io.BytesIO()
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        stats = storage.get_stats()
-        
-        detailed_stats = {
-            "summary": stats,
-            "paragraphs": storage.paragraphs,
-            "recordings": storage.recordings,
-            "variants_reported": storage.variants
-        }
-        
-        zip_file.writestr("statistics.json", json.dumps(detailed_stats, ensure_ascii=False, indent=2).encode('utf-8'))
-        
-        if storage.variants:
-            variants_data = {"total_variants": len(storage.variants), "variants": storage.variants}
-            zip_file.writestr("variant_reports.json", json.dumps(variants_data, ensure_ascii=False, indent=2).encode('utf-8'))
-        
-        # Add user statistics
-        user_stats = stats["user_stats"]
-        zip_file.writestr("user_statistics.json", json.dumps(user_stats, ensure_ascii=False, indent=2).encode('utf-8'))
-        
-        readme_content = """# Hassaniya Statistics Export
-
-This ZIP file contains:
-- statistics.json: Complete system statistics and data
-- variant_reports.json: User-reported grammar variants
-- user_statistics.json: Per-user activity statistics
-"""
-        zip_file.writestr("README.md", readme_content)
+    # Snapshot the lists here; the thread only serializes them
+    detailed_stats = {
+        "summary": storage.get_stats(),
+        "paragraphs": list(storage.paragraphs),
+        "recordings": list(storage.recordings),
+        "variants_reported": list(storage.variants.values())
+    }
     
-    zip_buffer.seek(0)
+    zip_buffer = await asyncio.to_thread(_build_statistics_zip, detailed_stats)
     
+    # Streamed from the spool itself rather than copied into a second buffer
     return StreamingResponse(
-        io.BytesIO(zip_buffer.read()),
+        _iter_spooled(zip_buffer),
         media_type="application/zip",
-        headers={"Content-Disposition": f"attachment; filename=hassaniya_statistics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"}
+        headers={
+            "Content-Disposition": f"attachment; filename=hassaniya_statistics_{_file_stamp(utc=False)}.zip",
+            "Content-Length": str(zip_buffer.tell()),
+        }
     )
 
 if __name__ == "__main__":
@@ -12,7 +12,7 @@ import logging
 import threading
 from functools import lru_cache
 from time import time
-from typing import Optional, Set
+from typing import FrozenSet, Optional, Set
 
 from importlib import resources  # std-lib; works in zip/pyinstaller
 
@@ -34,10 +34,13 @@ except FileNotFoundError as exc:
 # ---------------------------------------------------------------------------
 # Thread-safe lazy loader with mtime check
 # ---------------------------------------------------------------------------
-_exceptions: Set[str] = set()
+_exceptions: FrozenSet[str] = frozenset()
 _exceptions_mtime: float = 0.0
 _lock = threading.Lock()
 
+# Single-pass translation table for the 1:1 letter rules (گ/ق → ك)
+_G_Q_TO_KAF = str.maketrans({"گ": "ك", "ق": "ك"})
+
 
 def _load_exception_words() -> Set[str]:
     with _EXC_FILE.open(encoding="utf-8") as fh:
@@ -88,7 +91,7 @@ def load_exceptions() -> Set[str]:
     return _load_exception_words()
 
 
-def _get_exceptions() -> Set[str]:
+def _get_exceptions() -> FrozenSet[str]:
     global _exceptions_mtime, _exceptions
     with _lock:
         try:
@@ -97,12 +100,12 @@ def _get_exceptions() -> Set[str]:
             if mtime > _exceptions_mtime or _exceptions_mtime == 0.0:
                 base_exceptions = load_exceptions()  # Use load_exceptions for testability
                 # Automatically add ة/ه variants for each exception word
-                _exceptions = _expand_taa_haa_variants(base_exceptions)
+                _exceptions = frozenset(_expand_taa_haa_variants(base_exceptions))
                 _exceptions_mtime = mtime or time()
                 apply_letter_rules.cache_clear()
         except Exception as e:
             _LOG.warning("Failed to load exceptions: %s", e)
-            _exceptions = set()
+            _exceptions = frozenset()
             _exceptions_mtime = time()
     return _exceptions
 
@@ -120,7 +123,7 @@ def apply_letter_rules(word: str, _hash: Optional[int] = None) -> str:
 
     # Step 1  (protected by exceptions)
     if word not in exceptions:
-        word = word.replace("گ", "ك").replace("ق", "ك")
+        word = word.translate(_G_Q_TO_KAF)
 
     # Step 2 (conditional - respect exceptions for both original and converted forms)
     if word.endswith("ة"):
@@ -179,7 +182,7 @@ def clear_rules_cache() -> None:
     global _exceptions_mtime, _exceptions
     with _lock:
         _exceptions_mtime = 0.0  # Force reload on next access
-        _exceptions = set()  # Clear cached exceptions
+        _exceptions = frozenset()  # Clear cached exceptions
         apply_letter_rules.cache_clear()
     _LOG.info("Letter rules cache cleared")
 
@@ -192,7 +195,7 @@ def reload_exceptions() -> None:
     global _exceptions_mtime, _exceptions
     with _lock:
         _exceptions_mtime = 0.0  # Force reload on next access
-        _exceptions = set()  # Clear cached exceptions
+        _exceptions = frozenset()  # Clear cached exceptions
         apply_letter_rules.cache_clear()
     _LOG.info("Exception words will be reloaded on next access")
 
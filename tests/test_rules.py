@@ -27,6 +27,8 @@ class TestLetterRules:
             assert apply_letter_rules('گال', 0) == 'كال'
             assert apply_letter_rules('قلب', 0) == 'كلب'
             assert apply_letter_rules('گلب', 0) == 'كلب'
+            # Mixed letters are all mapped in one pass
+            assert apply_letter_rules('قگق', 0) == 'ككك'
     
     def test_taa_marbuta_to_haa_replacement(self):
         """Test ة → ه tail fix."""
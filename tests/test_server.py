@@ -0,0 +1,715 @@
+"""Tests for the FastAPI server in server.py."""
+
+import asyncio
+import io
+import json
+import urllib.parse
+import zipfile
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import server
+
+
+@pytest.fixture
+def audio_dir(tmp_path, monkeypatch):
+    """Keep recordings written by a test in a temporary directory."""
+    audio = tmp_path / "audio"
+    audio.mkdir()
+    monkeypatch.setattr(server, "AUDIO_DIR", audio)
+    return audio
+
+
+@pytest.fixture
+def storage(audio_dir, monkeypatch):
+    """Give each test a fresh SimpleStorage over a temporary audio directory."""
+    fresh = server.SimpleStorage()
+    monkeypatch.setattr(server, "storage", fresh)
+    return fresh
+
+
+@pytest.fixture
+def client(storage, audio_dir):
+    """Create a test client over the fresh storage."""
+    return TestClient(server.app)
+
+
+class TestRawAudioUpload:
+    """Test PUT /api/para/{para_id}/audio."""
+
+    def test_upload_completes_paragraph(self, client, storage, audio_dir):
+        """Test the body is saved and the paragraph completed."""
+        paragraph = storage.get_next_unassigned("EMIN")
+        text = "هذا نص نهائي"
+        audio = b"webm-data" * 200000
+
+        response = client.put(
+            f"/api/para/{paragraph['id']}/audio",
+            params={"username": "EMIN", "emotion": "😠"},
+            headers={"X-Text-Final": urllib.parse.quote(text)},
+            content=audio,
+        )
+
+        assert response.status_code == 200
+        filename = response.json()["audio"]
+        assert (audio_dir / filename).read_bytes() == audio
+        assert paragraph["status"] == "done"
+        assert paragraph["text_final"] == text
+        assert storage.recordings[-1]["filename"] == filename
+        assert storage.recordings[-1]["emotion"] == "😠"
+
+    def test_unassigned_paragraph_is_404_and_file_removed(self, client, storage, audio_dir):
+        """Test a paragraph not assigned to the user leaves no file behind."""
+        response = client.put(
+            "/api/para/1/audio",
+            params={"username": "EMIN"},
+            headers={"X-Text-Final": "x"},
+            content=b"webm-data",
+        )
+
+        assert response.status_code == 404
+        assert list(audio_dir.iterdir()) == []
+        assert storage.recordings == []
+
+    def test_long_text_header_is_413(self, client, storage, audio_dir):
+        """Test a text too long for a proxy-safe header is rejected up front."""
+        paragraph = storage.get_next_unassigned("EMIN")
+        text_final = urllib.parse.quote("ن" * 1000)
+        assert len(text_final) > server.TEXT_FINAL_HEADER_MAX
+
+        response = client.put(
+            f"/api/para/{paragraph['id']}/audio",
+            params={"username": "EMIN"},
+            headers={"X-Text-Final": text_final},
+            content=b"webm-data",
+        )
+
+        assert response.status_code == 413
+        assert "/submit" in response.json()["detail"]
+        assert list(audio_dir.iterdir()) == []
+        assert paragraph["status"] == "assigned"
+
+    def test_invalid_user_is_401(self, client, audio_dir):
+        """Test unknown users are rejected before anything is written."""
+        response = client.put(
+            "/api/para/1/audio",
+            params={"username": "NOBODY"},
+            headers={"X-Text-Final": "x"},
+            content=b"webm-data",
+        )
+
+        assert response.status_code == 401
+        assert list(audio_dir.iterdir()) == []
+
+
+class TestTextUpload:
+    """Test POST /api/text/upload."""
+
+    @pytest.mark.parametrize("chunk_bytes", [1, 2, 3, 7, 1 << 20])
+    def test_paragraphs_split_across_chunks(self, client, storage, monkeypatch, chunk_bytes):
+        """Test delimiters and characters cut by chunk boundaries are kept."""
+        monkeypatch.setattr(server, "TEXT_UPLOAD_CHUNK_BYTES", chunk_bytes)
+        text = "قال الرجل\nثم ذهب\n\n\nالفقرة الثانية\n \nبقية\n\n"
+
+        response = client.post(
+            "/api/text/upload",
+            data={"username": "EMIN"},
+            files={"file": ("text.txt", text.encode("utf-8"), "text/plain")},
+        )
+
+        assert response.json() == {"success": True, "paragraphs_added": 2}
+        assert [p["text_original"] for p in storage.paragraphs[-2:]] == [
+            "قال الرجل ثم ذهب",
+            "الفقرة الثانية بقية",
+        ]
+
+
+class TestWordFileFlush:
+    """Test the deferred word-file writes of SimpleStorage."""
+
+    def test_failed_write_keeps_edit_pending(self, storage, tmp_path, monkeypatch):
+        """Test an edit whose write fails is retried instead of dropped."""
+        path = tmp_path / "linked_words.json"
+        path.write_text("[]", encoding="utf-8")
+        monkeypatch.setattr(server, "_find_data_file", lambda filename: path)
+        real_write = server._write_bytes
+        calls = []
+
+        def failing_write(target, payload):
+            calls.append(target)
+            if len(calls) == 1:
+                raise OSError("disk full")
+            return real_write(target, payload)
+
+        monkeypatch.setattr(server, "_write_bytes", failing_write)
+
+        async def scenario():
+            storage.get_linked_words()
+            storage.add_linked_word("قال", "كال", "EMIN")
+            assert await storage.flush() is False
+            # The edit is still served and still pending
+            assert storage.get_linked_words()[0]["wrong"] == "قال"
+            assert path in storage._dirty_files
+            assert storage._flush_task is not None
+            assert await storage.flush() is True
+
+        asyncio.run(scenario())
+
+        assert len(calls) == 2
+        assert server._read_json(path)[0]["correct"] == "كال"
+
+    def test_burst_of_edits_is_written_once(self, storage, tmp_path, monkeypatch):
+        """Test edits are visible at once and written together after the delay."""
+        path = tmp_path / "linked_words.json"
+        path.write_text("[]", encoding="utf-8")
+        monkeypatch.setattr(server, "_find_data_file", lambda filename: path)
+        real_write = server._write_bytes
+        writes = []
+
+        def counting_write(target, payload):
+            writes.append(target)
+            return real_write(target, payload)
+
+        monkeypatch.setattr(server, "_write_bytes", counting_write)
+
+        async def scenario():
+            storage.get_linked_words()
+            for wrong in ("قال", "ثم", "ذهب"):
+                storage.add_linked_word(wrong, wrong + "!", "EMIN")
+            assert len(storage.get_linked_words()) == 3
+            assert server._read_json(path) == []
+            await asyncio.sleep(server.FLUSH_DELAY_SECONDS * 3)
+
+        asyncio.run(scenario())
+
+        assert writes == [path]
+        assert [entry["wrong"] for entry in server._read_json(path)] == ["قال", "ثم", "ذهب"]
+
+    def test_edit_outside_event_loop_is_written_at_once(self, storage, tmp_path, monkeypatch):
+        """Test there is no deferred write without a loop to run it."""
+        path = tmp_path / "linked_words.json"
+        path.write_text("[]", encoding="utf-8")
+        monkeypatch.setattr(server, "_find_data_file", lambda filename: path)
+
+        storage.add_linked_word("قال", "كال", "EMIN")
+
+        assert server._read_json(path)[0]["correct"] == "كال"
+        assert storage._dirty_files == {}
+
+
+class TestWordFileFormat:
+    """Test rewritten word files keep the layout they are maintained in."""
+
+    def test_variants_jsonl_round_trips(self):
+        """Test the tracked variants file is rewritten byte for byte."""
+        path = Path(__file__).parent.parent / "src" / "hassy_normalizer" / "data" / "hassaniya_variants.jsonl"
+        assert server._dump_variants(server._read_variants(path)) == path.read_bytes()
+
+    def test_linked_words_keep_indented_layout(self):
+        """Test linked words are written like json.dump(indent=2)."""
+        linked_words = [
+            {"wrong": "قال", "correct": "كال", "reporter": "EMIN", "created_at": "2024-01-01T00:00:00+00:00"},
+            {"wrong": "ثم", "correct": "تم", "reporter": "ZAIN", "created_at": "2024-01-02T00:00:00+00:00"},
+        ]
+        expected = json.dumps(linked_words, ensure_ascii=False, indent=2).encode("utf-8")
+        assert server._dump_json_indented(linked_words) == expected
+        assert server._dump_json_indented([]) == b"[]"
+
+
+def _sides(runs):
+    """Rebuild the original and normalized texts from diff runs."""
+    original = "".join(run["o"] for run in runs)
+    normalized = "".join(run.get("n", run["o"]) for run in runs)
+    return original, normalized
+
+
+class TestTokenDiff:
+    """Test the word/whitespace diff behind /api/normalize."""
+
+    def test_identical_text(self):
+        """Test unchanged text is a single equal run."""
+        runs, changed = server._token_diff("قال الرجل", "قال الرجل")
+        assert runs == [{"op": "eq", "o": "قال الرجل"}]
+        assert changed == 0
+
+    def test_replaced_word(self):
+        """Test a replaced word is one change run."""
+        runs, changed = server._token_diff("قال الرجل", "كال الرجل")
+        assert runs == [
+            {"op": "chg", "o": "قال", "n": "كال"},
+            {"op": "eq", "o": " الرجل"},
+        ]
+        assert changed == 1
+
+    def test_inserted_word(self):
+        """Test an insertion changes no original words."""
+        runs, changed = server._token_diff("a b", "a x b")
+        assert {"op": "chg", "o": "", "n": "x "} in runs
+        assert _sides(runs) == ("a b", "a x b")
+        assert changed == 0
+
+    def test_deleted_word(self):
+        """Test a deletion counts the removed word."""
+        runs, changed = server._token_diff("a x b", "a b")
+        assert {"op": "chg", "o": "x ", "n": ""} in runs
+        assert _sides(runs) == ("a x b", "a b")
+        assert changed == 1
+
+    def test_whitespace_is_preserved(self):
+        """Test runs keep the exact whitespace of both texts."""
+        original = "قال  الرجل\n\tثم ذهب "
+        normalized = "كال  الرجل\n\tتم ذهب "
+        runs, changed = server._token_diff(original, normalized)
+        assert _sides(runs) == (original, normalized)
+        assert changed == 2
+
+    def test_long_text_is_compared_by_position(self, monkeypatch):
+        """Test texts over DIFF_MAX_TOKENS skip SequenceMatcher."""
+        monkeypatch.setattr(server, "DIFF_MAX_TOKENS", 3)
+        monkeypatch.setattr(server.difflib, "SequenceMatcher", None)
+        original = "a b c d e"
+        normalized = "a x y d e f"
+        runs, changed = server._token_diff(original, normalized)
+        assert runs[0] == {"op": "eq", "o": "a "}
+        assert runs[1:4] == [
+            {"op": "chg", "o": "b", "n": "x"},
+            {"op": "eq", "o": " "},
+            {"op": "chg", "o": "c", "n": "y"},
+        ]
+        assert runs[-1] == {"op": "chg", "o": "", "n": " f"}
+        assert _sides(runs) == (original, normalized)
+        assert changed == 2
+
+    def test_api_sends_changes_with_diff_unless_turned_off(self, client):
+        """Test show_diff still sends the per-position changes list by default."""
+        body = {"text": "قال الرجل", "show_diff": True}
+        result = client.post("/api/normalize", json=body).json()
+        assert "diff" in result and "changed_words" in result
+        assert result["total_changes"] == len(result["changes"])
+
+        result = client.post("/api/normalize", json={**body, "include_changes": False}).json()
+        assert "diff" in result
+        assert "changes" not in result and "total_changes" not in result
+
+        result = client.post("/api/normalize", json={"text": "قال الرجل"}).json()
+        assert "diff" not in result and "changes" not in result
+
+
+class TestNormalizeCache:
+    """Test the memo in front of normalize_text."""
+
+    def test_long_text_is_not_memoized(self, monkeypatch):
+        """Test inputs over NORMALIZE_CACHE_MAX_CHARS bypass the cache."""
+        server._normalize_cached.cache_clear()
+        monkeypatch.setattr(server, "NORMALIZE_CACHE_MAX_CHARS", 5)
+        assert server._normalize("قال") == server.normalize_text("قال")
+        assert server._normalize("قال الرجل") == server.normalize_text("قال الرجل")
+        assert server._normalize_cached.cache_info().currsize == 1
+
+    def test_rule_files_are_checked_once_per_interval(self, monkeypatch):
+        """Test the mtimes are not re-read within NORMALIZER_VERSION_SECONDS."""
+        calls = []
+        monkeypatch.setattr(server, "_normalizer_version", None)
+        monkeypatch.setattr(server.os.path, "getmtime", lambda path: calls.append(path) or 1.0)
+        first = server._normalizer_data_version()
+        assert server._normalizer_data_version() == first
+        assert len(calls) == len(server.NORMALIZER_DATA_FILES)
+
+        monkeypatch.setattr(server, "NORMALIZER_VERSION_SECONDS", 0.0)
+        server._normalizer_version = None
+        server._normalizer_data_version()
+        server._normalizer_data_version()
+        assert len(calls) == 3 * len(server.NORMALIZER_DATA_FILES)
+
+
+class TestResetUserStats:
+    """Test SimpleStorage.reset_user_stats."""
+
+    def test_removes_user_audio_but_not_dotfiles(self, storage, audio_dir):
+        """Test only the user's visible recordings are deleted."""
+        for name in ("para_1__user_EMIN__1.webm", "para_2__user_ZAIN__1.webm",
+                     ".para_1__user_EMIN__1.webm.swp", "._para_1__user_EMIN__1.webm"):
+            (audio_dir / name).write_bytes(b"x")
+
+        assert storage.reset_user_stats("EMIN") is True
+
+        assert sorted(path.name for path in audio_dir.iterdir()) == [
+            "._para_1__user_EMIN__1.webm",
+            ".para_1__user_EMIN__1.webm.swp",
+            "para_2__user_ZAIN__1.webm",
+        ]
+
+
+def _index_snapshot(storage):
+    """Return the paragraph indexes as plain, comparable values."""
+    return (
+        {para_id: paragraph["id"] for para_id, paragraph in storage._by_id.items()},
+        {status: list(bucket) for status, bucket in storage._by_status.items() if bucket},
+        {user: set(ids) for user, ids in storage._by_user.items() if ids},
+    )
+
+
+class TestParagraphIndexes:
+    """Test the _by_id/_by_status/_by_user indexes of SimpleStorage."""
+
+    def test_indexes_match_a_rebuild(self, storage):
+        """Test the incrementally kept indexes equal freshly built ones."""
+        storage.add_paragraph("نص أول", uploaded_by="OMAR")
+        storage.add_paragraphs(["نص ثان", "نص ثالث"], uploaded_by="ALI")
+        first = storage.get_next_unassigned("EMIN")
+        second = storage.get_next_unassigned("EMIN")
+        third = storage.get_next_unassigned("OMAR")
+        storage.complete_paragraph(first["id"], "نهائي", "EMIN")
+        storage.skip_paragraph(second["id"], "EMIN")
+        storage.complete_paragraph(third["id"], "نهائي", "OMAR")
+        storage.reset_user_stats("OMAR")
+
+        kept = _index_snapshot(storage)
+        storage._reindex()
+        assert kept == _index_snapshot(storage)
+
+    def test_lookup_and_queue_order(self, storage):
+        """Test paragraphs come from the queue in upload order, reset ones included."""
+        para_id = storage.add_paragraph("نص", uploaded_by="EMIN")
+        assert storage.get_paragraph(para_id)["text_original"] == "نص"
+        assert storage.get_paragraph(999) is None
+
+        assert storage.get_next_unassigned("EMIN")["id"] == 1
+        assert storage.get_next_unassigned("EMIN")["id"] == 2
+        storage.reset_user_stats("EMIN")
+        assert [storage.get_next_unassigned("EMIN")["id"] for _ in range(3)] == [1, 2, para_id]
+        assert storage.get_next_unassigned("EMIN") is None
+
+    def test_non_admin_only_gets_own_or_system_paragraphs(self, storage):
+        """Test other users' uploads are not handed to a regular user."""
+        storage.add_paragraph("نص علي", uploaded_by="ALI")
+        own = storage.add_paragraph("نص عمر", uploaded_by="OMAR")
+
+        assert [storage.get_next_unassigned("OMAR")["id"] for _ in range(3)] == [1, 2, own]
+        assert storage.get_next_unassigned("OMAR") is None
+        assert storage.get_next_unassigned("EMIN")["uploaded_by"] == "ALI"
+
+    def test_only_the_assignee_can_complete_or_skip(self, storage):
+        """Test completing or skipping someone else's paragraph fails."""
+        paragraph = storage.get_next_unassigned("EMIN")
+        assert storage.complete_paragraph(paragraph["id"], "x", "ZAIN") is False
+        assert storage.skip_paragraph(paragraph["id"], "ZAIN") is False
+        assert storage.skip_paragraph(999, "EMIN") is False
+        assert paragraph["status"] == "assigned"
+
+
+def _recomputed_user_stats(storage):
+    """Compute per-user stats from scratch, the way get_stats once did."""
+    stats = defaultdict(lambda: {"recordings": 0, "paragraphs_completed": 0, "transcription_minutes": 0.0})
+    for recording in storage.recordings:
+        stats[recording["user"]]["recordings"] += 1
+        stats[recording["user"]]["transcription_minutes"] += recording["duration_min"]
+    for paragraph in storage.paragraphs:
+        if paragraph["status"] == "done" and paragraph["assigned_to"]:
+            stats[paragraph["assigned_to"]]["paragraphs_completed"] += 1
+    return dict(stats)
+
+
+class TestUserStats:
+    """Test the running per-user totals behind get_stats."""
+
+    def _record(self, storage, audio_dir, username, size):
+        """Take, complete and record the user's next paragraph."""
+        paragraph = storage.get_next_unassigned(username)
+        filename = f"para_{paragraph['id']}__user_{username}__1.webm"
+        (audio_dir / filename).write_bytes(b"x" * size)
+        storage.complete_paragraph(paragraph["id"], "نهائي", username)
+        storage.add_recording(paragraph["id"], username, filename)
+        return paragraph
+
+    def test_totals_match_a_recount(self, storage, audio_dir):
+        """Test incremental totals equal a full recount after every change."""
+        storage.add_paragraphs(["نص"] * 4)
+        self._record(storage, audio_dir, "EMIN", 90 * 1024)
+        self._record(storage, audio_dir, "EMIN", 300 * 1024)
+        skipped = storage.get_next_unassigned("ZAIN")
+        storage.skip_paragraph(skipped["id"], "ZAIN")
+        self._record(storage, audio_dir, "ZAIN", 10)
+        assert storage.get_stats()["user_stats"] == _recomputed_user_stats(storage)
+
+        storage.reset_user_stats("EMIN")
+        stats = storage.get_stats()
+        assert stats["user_stats"] == _recomputed_user_stats(storage)
+        assert "EMIN" not in stats["user_stats"]
+        assert stats["total_recording_minutes"] == pytest.approx(0.5)
+
+    def test_minutes_come_from_file_size(self, storage, audio_dir):
+        """Test durations are estimated from the file and clamped."""
+        storage.add_paragraphs(["نص"] * 3)
+        self._record(storage, audio_dir, "EMIN", 120 * 1024)
+        self._record(storage, audio_dir, "EMIN", 10)
+        storage.add_recording(3, "EMIN", "missing.webm")
+        assert [r["duration_min"] for r in storage.recordings] == [2.0, 0.5, 2.5]
+
+    def test_get_stats_returns_copies(self, storage, audio_dir):
+        """Test callers cannot change the running totals through get_stats."""
+        self._record(storage, audio_dir, "EMIN", 10)
+        stats = storage.get_stats()
+        stats["user_stats"]["EMIN"]["recordings"] = 99
+        stats["user_stats"]["ZAIN"] = {}
+        stats["total_recordings"] = 99
+        stats = storage.get_stats()
+        assert stats["user_stats"] == {"EMIN": storage._user_stats["EMIN"]}
+        assert stats["user_stats"]["EMIN"]["recordings"] == 1
+        assert stats["total_recordings"] == 1
+
+
+class TestStatsCache:
+    """Test the get_stats cache and its invalidation."""
+
+    def test_repeat_calls_reuse_the_result(self, storage):
+        """Test stats are not recomputed between changes."""
+        first = storage.get_stats()
+        cached = storage._stats_cache
+        assert storage.get_stats() == first
+        assert storage._stats_cache is cached
+
+    @pytest.mark.parametrize("change", [
+        lambda storage: storage.add_paragraph("نص"),
+        lambda storage: storage.add_paragraphs(["نص", "نص"]),
+        lambda storage: storage.get_next_unassigned("EMIN"),
+        lambda storage: storage.add_recording(1, "EMIN", "missing.webm"),
+        lambda storage: storage.reset_user_stats("EMIN"),
+    ])
+    def test_every_write_invalidates(self, storage, change):
+        """Test each write path drops the cached stats."""
+        storage.get_next_unassigned("EMIN")
+        storage.get_stats()
+        cached = storage._stats_cache
+        storage.transcriptions_jsonl()
+        assert storage._transcriptions_jsonl is not None
+        change(storage)
+        storage.get_stats()
+        assert storage._stats_cache is not cached
+        assert storage._transcriptions_jsonl is None
+
+    def test_expires_after_ttl(self, storage, monkeypatch):
+        """Test a cached result is not served past STATS_CACHE_SECONDS."""
+        now = [1000.0]
+        monkeypatch.setattr(server.time, "monotonic", lambda: now[0])
+        storage.get_stats()
+        cached = storage._stats_cache
+        now[0] += server.STATS_CACHE_SECONDS - 0.01
+        storage.get_stats()
+        assert storage._stats_cache is cached
+        now[0] += 0.02
+        storage.get_stats()
+        assert storage._stats_cache is not cached
+
+    def test_counts_follow_writes(self, storage):
+        """Test the numbers served right after a write are current."""
+        assert storage.get_stats()["total_paragraphs"] == 2
+        storage.add_paragraph("نص")
+        paragraph = storage.get_next_unassigned("EMIN")
+        storage.complete_paragraph(paragraph["id"], "x", "EMIN")
+        stats = storage.get_stats()
+        assert stats["total_paragraphs"] == 3
+        assert stats["completed_paragraphs"] == 1
+        assert stats["assigned_paragraphs"] == 0
+
+
+class TestAtomicWrite:
+    """Test _write_bytes replaces files atomically."""
+
+    def test_replaces_contents_and_keeps_mode(self, tmp_path):
+        """Test the new contents land with the old permissions and no temp file."""
+        path = tmp_path / "words.json"
+        path.write_bytes(b"old")
+        path.chmod(0o640)
+
+        stamp = server._write_bytes(path, b"new contents")
+
+        assert path.read_bytes() == b"new contents"
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert stamp == (path.stat().st_mtime_ns, len(b"new contents"))
+        assert [p.name for p in tmp_path.iterdir()] == ["words.json"]
+
+    def test_new_file_is_world_readable(self, tmp_path):
+        """Test a created file gets the usual 0644 instead of mkstemp's 0600."""
+        path = tmp_path / "new.json"
+        server._write_bytes(path, b"{}")
+        assert path.stat().st_mode & 0o777 == 0o644
+
+    def test_failed_replace_keeps_original(self, tmp_path, monkeypatch):
+        """Test a failure leaves the old file intact and cleans up."""
+        path = tmp_path / "words.json"
+        path.write_bytes(b"old")
+
+        def failing_replace(src, dst):
+            raise OSError("replace failed")
+
+        monkeypatch.setattr(server.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            server._write_bytes(path, b"new")
+
+        assert path.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["words.json"]
+
+
+class TestReadCached:
+    """Test SimpleStorage._read_cached."""
+
+    def test_reparses_only_when_the_file_changes(self, storage, tmp_path):
+        """Test an unchanged file is served from the cache."""
+        path = tmp_path / "linked_words.json"
+        path.write_text("[]", encoding="utf-8")
+        loads = []
+
+        def loader(target):
+            loads.append(target)
+            return server._read_json(target)
+
+        first = storage._read_cached(path, loader)
+        assert storage._read_cached(path, loader) is first
+        assert loads == [path]
+
+        path.write_text('[{"wrong": "قال", "correct": "كال"}]', encoding="utf-8")
+        assert storage._read_cached(path, loader)[0]["correct"] == "كال"
+        assert loads == [path, path]
+
+
+class TestGrammarVariants:
+    """Test grammar variant reports keyed by id."""
+
+    def test_ids_are_not_reused_after_delete(self, storage):
+        """Test a new report never takes a deleted or live report's id."""
+        first = storage.add_variant("قال", "كال", "EMIN")
+        second = storage.add_variant("ثم", "تم", "EMIN")
+        assert storage.delete_variant(first, "EMIN") is True
+        third = storage.add_variant("ذهب", "دهب", "ZAIN")
+
+        assert [first, second, third] == [1, 2, 3]
+        assert list(storage.variants) == [second, third]
+
+    def test_delete_checks_reporter_and_id(self, storage):
+        """Test only the reporter can delete, and only existing reports."""
+        variant_id = storage.add_variant("قال", "كال", "EMIN")
+        assert storage.delete_variant(variant_id, "ZAIN") is False
+        assert storage.delete_variant(999, "EMIN") is False
+        assert storage.delete_variant(variant_id, "EMIN") is True
+        assert storage.delete_variant(variant_id, "EMIN") is False
+
+    def test_api_lists_reports_in_order(self, client, storage):
+        """Test /api/variants still returns a list."""
+        for word in ("قال", "ثم", "ذهب"):
+            storage.add_variant(word, word, "EMIN")
+        storage.delete_variant(2, "EMIN")
+
+        variants = client.get("/api/variants").json()["variants"]
+        assert [(v["id"], v["word"]) for v in variants] == [(1, "قال"), (3, "ذهب")]
+
+
+class TestTranscriptionsExport:
+    """Test the cached transcriptions.jsonl of the recordings export."""
+
+    def _submit(self, storage, username):
+        """Complete the user's next paragraph with a recording."""
+        paragraph = storage.get_next_unassigned(username)
+        storage.complete_paragraph(paragraph["id"], f"نهائي {paragraph['id']}", username)
+        storage.add_recording(paragraph["id"], username, f"para_{paragraph['id']}.webm", "😠")
+        return paragraph
+
+    def test_lists_recordings_of_completed_paragraphs(self, storage):
+        """Test entries join each recording with its finished paragraph."""
+        paragraph = self._submit(storage, "EMIN")
+        assigned = storage.get_next_unassigned("ZAIN")
+        storage.add_recording(assigned["id"], "ZAIN", "unfinished.webm")
+
+        lines = storage.transcriptions_jsonl().decode("utf-8").split("\n")
+
+        assert len(lines) == 1
+        entry = json.loads(lines[0])
+        assert entry["text"] == f"نهائي {paragraph['id']}"
+        assert entry["original_text"] == paragraph["text_original"]
+        assert entry["emotion"] == server.EMOTION_EMOJIS["😠"]
+        assert lines[0] == json.dumps(entry, ensure_ascii=False)
+
+    def test_reused_until_the_next_change(self, storage):
+        """Test the encoded file is cached and rebuilt after submissions and resets."""
+        self._submit(storage, "EMIN")
+        cached = storage.transcriptions_jsonl()
+        assert storage.transcriptions_jsonl() is cached
+
+        self._submit(storage, "ZAIN")
+        assert storage.transcriptions_jsonl().count(b"\n") == 1
+
+        storage.reset_user_stats("EMIN")
+        storage.reset_user_stats("ZAIN")
+        assert storage.transcriptions_jsonl() == b""
+
+    def test_export_zip(self, client, storage, audio_dir):
+        """Test the export serves the cached file and stores audio uncompressed."""
+        paragraph = self._submit(storage, "EMIN")
+        (audio_dir / f"para_{paragraph['id']}.webm").write_bytes(b"webm" * 100)
+
+        response = client.get("/api/export/recordings")
+
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        assert archive.read("transcriptions.jsonl") == storage.transcriptions_jsonl()
+        audio = archive.getinfo(f"recordings/para_{paragraph['id']}.webm")
+        assert audio.compress_type == zipfile.ZIP_STORED
+
+
+class TestConditionalRequests:
+    """Test ETag / If-None-Match handling."""
+
+    def test_stats_revalidate(self, client, storage):
+        """Test unchanged stats are a 304 and changed stats a new tag."""
+        first = client.get("/api/stats")
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "no-cache"
+
+        again = client.get("/api/stats", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        weak = client.get("/api/stats", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert weak.status_code == 304
+
+        storage.add_paragraph("نص")
+        changed = client.get("/api/stats", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["total_paragraphs"] == 3
+        assert changed.headers["etag"] != etag
+
+    def test_audio_revalidates(self, client, audio_dir):
+        """Test a recording the client has is not sent again."""
+        path = audio_dir / "para_1__user_EMIN__1.webm"
+        path.write_bytes(b"webm" * 100)
+
+        first = client.get(f"/api/audio/{path.name}")
+        assert first.status_code == 200
+        assert first.content == path.read_bytes()
+        etag = first.headers["etag"]
+
+        again = client.get(f"/api/audio/{path.name}", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+
+        path.write_bytes(b"other audio")
+        changed = client.get(f"/api/audio/{path.name}", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.content == b"other audio"
+
+        assert client.get("/api/audio/missing.webm").status_code == 404
+
+    def test_pages_and_assets_revalidate(self, client):
+        """Test the HTML pages and their split-out assets answer 304."""
+        urls = ["/", "/dashboard"] + [f"/static/{name}" for name in server.STATIC_ASSETS]
+        for url in urls:
+            first = client.get(url, headers={"Accept-Encoding": "gzip"})
+            assert first.status_code == 200, url
+            again = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+            assert again.status_code == 304, url
+            assert again.content == b""
+
+        for name in server.STATIC_ASSETS:
+            assert "immutable" in client.get(f"/static/{name}").headers["cache-control"]
+        assert client.get("/static/missing.js").status_code == 404